@@ -8,23 +8,92 @@ import subprocess
 import shutil
 
 
+def generate_qrc(path="resources.qrc"):
+    """Write the Qt resources file, listing every asset with its class's compression"""
+    print("Generating resources file...")
+
+    from xml.sax.saxutils import escape
+    from src.config import RESOURCE_COMPRESSION
+    from src.utils.asset_manifest import scan_assets
+
+    root_dir = os.path.dirname(os.path.abspath(path))
+    lines = ['<!DOCTYPE RCC>', '<RCC version="1.0">', '    <qresource prefix="/">']
+
+    for key, entry in sorted(scan_assets(with_hashes=False).items()):
+        # Served as ":/assets/..." whether the file is in assets or src/assets
+        asset_class = key.split("/")[1] if key.count("/") > 1 else ""
+        algorithm = RESOURCE_COMPRESSION.get(asset_class, "zlib")
+        attributes = f'alias="{escape(key)}" compression-algorithm="{algorithm}"'
+        if algorithm != "none":
+            attributes += ' compress="9"'
+
+        file_path = os.path.relpath(entry["path"], root_dir).replace(os.sep, "/")
+        lines.append(f'        <file {attributes}>{escape(file_path)}</file>')
+
+    lines += ['    </qresource>', '</RCC>']
+
+    with open(path, "w") as f:
+        f.write("\n".join(lines) + "\n")
+
+    print("Resources file generated successfully.")
+    return True
+
+
 def compile_resources():
     """Compile Qt resources file into a Python module"""
     print("Compiling resources...")
 
-    # Check if pyrcc6 is available
-    try:
-        subprocess.run(["pyrcc6", "--version"], check=True, capture_output=True)
-    except (subprocess.SubprocessError, FileNotFoundError):
-        print("Error: pyrcc6 not found. Make sure PyQt6 is installed correctly.")
+    # PyQt6 has no resource compiler, so use Qt's rcc or PySide6's and fix the import
+    compilers = [
+        ["pyside6-rcc", "resources.qrc", "-o", "src/resources_rc.py"],
+        ["rcc", "-g", "python", "resources.qrc", "-o", "src/resources_rc.py"]
+    ]
+
+    for command in compilers:
+        try:
+            subprocess.run(command, check=True, capture_output=True)
+            break
+        except (subprocess.SubprocessError, FileNotFoundError):
+            continue
+    else:
+        print("Error: No resource compiler found. Install PySide6 (pyside6-rcc) or Qt (rcc).")
         return False
 
-    # Compile resources
-    subprocess.run(["pyrcc6", "resources.qrc", "-o", "src/resources_rc.py"], check=True)
+    with open("src/resources_rc.py", "r") as f:
+        module = f.read()
+    with open("src/resources_rc.py", "w") as f:
+        f.write(module.replace("from PySide6 import QtCore", "from PyQt6 import QtCore"))
+
     print("Resources compiled successfully.")
     return True
 
 
+def compile_themes():
+    """Precompile theme palettes and stylesheets into the theme cache"""
+    print("Compiling themes...")
+
+    from src.utils.theme_cache import build_theme_cache
+    if not build_theme_cache():
+        print("Error: Could not write the theme cache.")
+        return False
+
+    print("Themes compiled successfully.")
+    return True
+
+
+def build_asset_manifest():
+    """Write the manifest of asset paths, sizes and hashes"""
+    print("Building asset manifest...")
+
+    from src.utils.asset_manifest import build_manifest
+    if not build_manifest():
+        print("Error: Could not write the asset manifest.")
+        return False
+
+    print("Asset manifest built successfully.")
+    return True
+
+
 def build_executable():
     """Build the executable using PyInstaller"""
     print("Building executable...")
@@ -98,7 +167,15 @@ def main():
         print("Please add these assets before distributing the application.")
 
     # Compile resources
-    if not compile_resources():
+    if not generate_qrc() or not compile_resources():
+        return
+
+    # Compile themes
+    if not compile_themes():
+        return
+
+    # Build asset manifest
+    if not build_asset_manifest():
         return
 
     # Build executable
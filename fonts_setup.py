@@ -4,8 +4,26 @@ fonts_setup.py - Create necessary font directory structure
 
 import os
 import sys
+import json
 import shutil
+import struct
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# Font index cache, next to this script
+FONT_INDEX_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".font_index.json")
+
+# Cache format version (cached indexes with another version are rebuilt)
+FONT_INDEX_VERSION = 2
+
+# Font file extensions to index
+FONT_EXTENSIONS = ('.ttf', '.otf', '.ttc')
+
+# Style names fonts use for the regular style (normalized)
+REGULAR_STYLES = ("regular", "book", "normal", "roman")
+
+# Monospace families preferred as the placeholder military font
+PLACEHOLDER_FAMILIES = ["DejaVu Sans Mono", "Liberation Mono", "Ubuntu Mono", "Noto Sans Mono", "FreeMono"]
 
 
 def ensure_font_directory():
@@ -42,17 +60,294 @@ def ensure_font_directory():
     return True
 
 
-def find_system_fonts():
-    """Find system fonts that could be used as placeholders"""
-    system_fonts = []
-
+def get_font_dirs():
+    """Get the system font folders of this platform"""
     if sys.platform.startswith('win'):
-        # Windows font paths
-        font_dirs = [
+        return [
             os.path.join(os.environ['WINDIR'], 'Fonts'),
             os.path.join(os.environ['LOCALAPPDATA'], 'Microsoft', 'Windows', 'Fonts')
         ]
 
+    if sys.platform.startswith('darwin'):
+        return [
+            '/System/Library/Fonts',
+            '/Library/Fonts',
+            os.path.expanduser('~/Library/Fonts')
+        ]
+
+    return [
+        '/usr/share/fonts',
+        '/usr/local/share/fonts',
+        os.path.expanduser('~/.fonts')
+    ]
+
+
+def _normalize_name(name):
+    """Normalize a family or style name for lookups (e.g., "DejaVu Sans Mono" -> "dejavusansmono")"""
+    return "".join(character for character in name.lower() if character.isalnum())
+
+
+def _normalize_style(style):
+    """Normalize a style name for lookups ("Book", "Normal" and "Roman" become "regular")"""
+    style = _normalize_name(style)
+    return "regular" if style in REGULAR_STYLES else style
+
+
+def _names_from_file_name(path):
+    """Guess a font's family and style from its file name (e.g., "DejaVuSansMono-Bold.ttf")"""
+    stem = os.path.splitext(os.path.basename(path))[0]
+    family, separator, style = stem.rpartition('-')
+    if not separator:
+        family, style = stem, "Regular"
+
+    # Split camel case into words
+    words = []
+    for character in family.replace('_', ' '):
+        if character.isupper() and words and words[-1][-1:].islower():
+            words.append(" ")
+        words.append(character)
+
+    return " ".join("".join(words).split()), style or "Regular"
+
+
+def read_font_names(path):
+    """Read a font's family and style from its name table
+
+    Args:
+        path: Path to a TrueType/OpenType font or collection (first font only)
+
+    Returns:
+        (family, style), guessed from the file name if the font can't be read
+    """
+    try:
+        with open(path, "rb") as f:
+            header = f.read(12)
+            if header[:4] == b"ttcf":
+                f.seek(12)
+                f.seek(struct.unpack(">I", f.read(4))[0])
+                header = f.read(12)
+
+            num_tables = struct.unpack(">H", header[4:6])[0]
+            directory = f.read(16 * num_tables)
+
+            for i in range(num_tables):
+                tag, _, table_offset, table_length = struct.unpack(">4sIII", directory[i * 16:i * 16 + 16])
+                if tag == b"name":
+                    f.seek(table_offset)
+                    data = f.read(table_length)
+                    break
+            else:
+                return _names_from_file_name(path)
+
+        _, count, string_offset = struct.unpack(">HHH", data[:6])
+        names = {}
+        for i in range(count):
+            platform, _, language, name_id, length, offset = struct.unpack(">6H", data[6 + i * 12:18 + i * 12])
+            if name_id not in (1, 2, 16, 17):
+                continue
+
+            raw = data[string_offset + offset:string_offset + offset + length]
+            if platform in (0, 3):
+                text = raw.decode("utf-16-be", "replace")
+            elif platform == 1 and language == 0:
+                text = raw.decode("latin-1")
+            else:
+                continue
+
+            # Prefer the US English Windows names
+            if name_id not in names or (platform == 3 and language == 0x409):
+                names[name_id] = text
+
+        # Typographic names (16, 17) group all weights under one family
+        family = names.get(16) or names.get(1)
+        if family:
+            return family, names.get(17) or names.get(2) or "Regular"
+    except (OSError, struct.error):
+        pass
+
+    return _names_from_file_name(path)
+
+
+class FontIndex:
+    """Index of the system fonts by family and style, cached between runs
+
+    The index remembers the modification time of every folder it scanned.
+    Adding or removing a font changes its folder's modification time, so on
+    later runs only changed folders are listed again, and only new fonts are
+    read; everything else comes from the cache file. Font folders are scanned
+    in parallel, one thread per folder.
+    """
+
+    def __init__(self, font_dirs=None, cache_path=None):
+        """Initialize the font index
+
+        Args:
+            font_dirs: Font folders to index (default: get_font_dirs())
+            cache_path: Index cache file (default: FONT_INDEX_FILE)
+        """
+        self.font_dirs = font_dirs if font_dirs is not None else get_font_dirs()
+        self.cache_path = cache_path or FONT_INDEX_FILE
+        self.dirs = {}  # Folder path -> {"mtime", "subdirs", "fonts"}
+        self.fonts = []  # {"path", "family", "style"}
+        self.families = {}  # Normalized family name -> fonts
+        self.loaded = False
+
+    def _load_cache(self):
+        """Load the cached folders, if the cache matches this version"""
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        if data.get("version") != FONT_INDEX_VERSION:
+            return {}
+        return data.get("dirs", {})
+
+    def _save_cache(self):
+        """Write the scanned folders to the cache file"""
+        try:
+            with open(self.cache_path, "w", encoding="utf-8") as f:
+                json.dump({"version": FONT_INDEX_VERSION, "dirs": self.dirs}, f)
+        except OSError as e:
+            print(f"Error writing font index {self.cache_path}: {e}")
+
+    def _scan_dir(self, path, cached, dirs):
+        """Index a folder and its subfolders, reusing cached folders that haven't changed
+
+        Args:
+            path: Folder to scan
+            cached: Cached folders from the last run
+            dirs: Dictionary the scanned folders are added to
+
+        Returns:
+            Number of folders that had to be listed again
+        """
+        if path in dirs:
+            return 0
+
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return 0
+
+        entry = cached.get(path)
+        if entry is not None and entry["mtime"] == mtime:
+            dirs[path] = entry
+            return sum(self._scan_dir(subdir, cached, dirs) for subdir in entry["subdirs"])
+
+        # Fonts that were already in this folder don't need to be read again
+        known = {font["path"]: font for font in entry["fonts"]} if entry else {}
+        subdirs = []
+        fonts = []
+
+        try:
+            with os.scandir(path) as entries:
+                for item in entries:
+                    # Symlinked folders aren't followed, so links like "loop -> .." can't recurse
+                    if item.is_dir(follow_symlinks=False):
+                        subdirs.append(item.path)
+                    elif item.name.lower().endswith(FONT_EXTENSIONS) and item.is_file():
+                        font = known.get(item.path)
+                        if font is None:
+                            family, style = read_font_names(item.path)
+                            font = {"path": item.path, "family": family, "style": style}
+                        fonts.append(font)
+        except OSError:
+            return 0
+
+        subdirs.sort()
+        fonts.sort(key=lambda font: font["path"])
+        dirs[path] = {"mtime": mtime, "subdirs": subdirs, "fonts": fonts}
+        return 1 + sum(self._scan_dir(subdir, cached, dirs) for subdir in subdirs)
+
+    def load(self):
+        """Bring the index up to date with the font folders
+
+        Returns:
+            Number of fonts in the index
+        """
+        cached = self._load_cache()
+        font_dirs = [font_dir for font_dir in self.font_dirs if os.path.isdir(font_dir)]
+
+        def scan_root(font_dir):
+            dirs = {}
+            return dirs, self._scan_dir(font_dir, cached, dirs)
+
+        self.dirs = {}
+        changed = 0
+        if font_dirs:
+            with ThreadPoolExecutor(max_workers=len(font_dirs)) as executor:
+                for dirs, rescanned in executor.map(scan_root, font_dirs):
+                    self.dirs.update(dirs)
+                    changed += rescanned
+
+        # Save if a folder changed or was removed
+        if changed or set(self.dirs) != set(cached):
+            self._save_cache()
+
+        self.fonts = [font for path in sorted(self.dirs) for font in self.dirs[path]["fonts"]]
+        self.families = {}
+        for font in self.fonts:
+            self.families.setdefault(_normalize_name(font["family"]), []).append(font)
+        self.loaded = True
+        return len(self.fonts)
+
+    def get_fonts(self):
+        """Get every indexed font, loading the index if needed"""
+        if not self.loaded:
+            self.load()
+        return self.fonts
+
+    def get_families(self):
+        """Get the names of all indexed font families, sorted"""
+        return sorted({font["family"] for font in self.get_fonts()})
+
+    def find(self, family, style=None):
+        """Find fonts by family and style
+
+        Names are matched ignoring case, spaces and punctuation, and "Book",
+        "Normal" and "Roman" count as "Regular".
+
+        Args:
+            family: Family name (e.g., "DejaVu Sans Mono")
+            style: Style name (e.g., "Bold"), or None for any style
+
+        Returns:
+            List of font paths
+        """
+        if not self.loaded:
+            self.load()
+
+        fonts = self.families.get(_normalize_name(family), [])
+        style = _normalize_style(style) if style else None
+
+        return [font["path"] for font in fonts
+                if style is None or _normalize_style(font["style"]) == style]
+
+    def find_first(self, families, style="Regular", extensions=FONT_EXTENSIONS):
+        """Find the first available font from a list of families
+
+        Args:
+            families: Family names in order of preference
+            style: Style name
+            extensions: Allowed file extensions
+
+        Returns:
+            Font path, or None if none of the families is installed
+        """
+        for family in families:
+            for path in self.find(family, style):
+                if path.lower().endswith(extensions):
+                    return path
+        return None
+
+
+def find_system_fonts():
+    """Find system fonts that could be used as placeholders"""
+    system_fonts = []
+
+    if sys.platform.startswith('win'):
         # Look for common monospace fonts that might be suitable
         target_fonts = [
             'consola.ttf',  # Consolas
@@ -61,7 +356,7 @@ def find_system_fonts():
             'arial.ttf'  # Arial (fallback)
         ]
 
-        for font_dir in font_dirs:
+        for font_dir in get_font_dirs():
             if os.path.exists(font_dir):
                 for font in target_fonts:
                     font_path = os.path.join(font_dir, font)
@@ -69,13 +364,6 @@ def find_system_fonts():
                         system_fonts.append(font_path)
 
     elif sys.platform.startswith('darwin'):
-        # macOS font paths
-        font_dirs = [
-            '/System/Library/Fonts',
-            '/Library/Fonts',
-            os.path.expanduser('~/Library/Fonts')
-        ]
-
         # Look for common monospace fonts
         target_fonts = [
             'Menlo.ttc',
@@ -84,7 +372,7 @@ def find_system_fonts():
             'Arial.ttf'
         ]
 
-        for font_dir in font_dirs:
+        for font_dir in get_font_dirs():
             if os.path.exists(font_dir):
                 for font in target_fonts:
                     font_path = os.path.join(font_dir, font)
@@ -92,20 +380,19 @@ def find_system_fonts():
                         system_fonts.append(font_path)
 
     else:
-        # Linux font paths
-        font_dirs = [
-            '/usr/share/fonts',
-            '/usr/local/share/fonts',
-            os.path.expanduser('~/.fonts')
-        ]
+        # Linux font folders hold thousands of files, so use the cached index
+        index = FontIndex()
+        ttf_fonts = [font["path"] for font in index.get_fonts() if font["path"].lower().endswith('.ttf')]
 
-        # Walk through directories to find TTF fonts
-        for font_dir in font_dirs:
-            if os.path.exists(font_dir):
-                for root, dirs, files in os.walk(font_dir):
-                    for file in files:
-                        if file.lower().endswith('.ttf'):
-                            system_fonts.append(os.path.join(root, file))
+        # Put common monospace fonts first, like on the other platforms
+        preferred = set()
+        for family in PLACEHOLDER_FAMILIES:
+            for font_path in index.find(family, "Regular"):
+                if font_path.lower().endswith('.ttf') and font_path not in preferred:
+                    preferred.add(font_path)
+                    system_fonts.append(font_path)
+
+        system_fonts.extend(font_path for font_path in ttf_fonts if font_path not in preferred)
 
     return system_fonts
 
@@ -4,27 +4,43 @@ check_environment.py - Verify that all required components are available
 
 import sys
 import os
+import json
+import time
+import argparse
 from pathlib import Path
 import importlib
 import subprocess
+import threading
+from concurrent.futures import Future, FIRST_COMPLETED, wait
 
+# Make the src package importable when run as a script
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
 
-def check_python_version():
+try:
+    from src.utils.asset_manifest import asset_manifest
+except ImportError:
+    # Fall back to checking the files under the project root
+    asset_manifest = None
+
+
+def check_python_version(log=print):
     """Check Python version"""
-    print("\n--- Checking Python Version ---")
+    log("\n--- Checking Python Version ---")
     python_version = sys.version_info
-    print(f"Python version: {python_version.major}.{python_version.minor}.{python_version.micro}")
+    log(f"Python version: {python_version.major}.{python_version.minor}.{python_version.micro}")
 
     # Check if Python version is compatible
     is_compatible = python_version.major == 3 and python_version.minor >= 9
-    print(f"Compatible version: {is_compatible}")
+    log(f"Compatible version: {is_compatible}")
 
     return is_compatible
 
 
-def check_dependencies():
+def check_dependencies(log=print):
     """Check if required packages are installed"""
-    print("\n--- Checking Required Packages ---")
+    log("\n--- Checking Required Packages ---")
     required_packages = [
         "PyQt6",
         "PyQt6.QtCore",
@@ -38,21 +54,21 @@ def check_dependencies():
     for package in required_packages:
         try:
             importlib.import_module(package)
-            print(f"✓ {package}: Installed")
+            log(f"✓ {package}: Installed")
         except ImportError as e:
-            print(f"✗ {package}: Not found - {e}")
+            log(f"✗ {package}: Not found - {e}")
             all_available = False
 
     if not all_available:
-        print("\nSome required packages are missing. Run the following command:")
-        print("pip install -r requirements.txt")
+        log("\nSome required packages are missing. Run the following command:")
+        log("pip install -r requirements.txt")
 
     return all_available
 
 
-def check_asset_directories():
+def check_asset_directories(log=print):
     """Check if required asset directories exist"""
-    print("\n--- Checking Asset Directories ---")
+    log("\n--- Checking Asset Directories ---")
     required_dirs = [
         "assets/fonts",
         "assets/images/backgrounds",
@@ -66,22 +82,22 @@ def check_asset_directories():
     for directory in required_dirs:
         dir_path = Path(directory)
         if dir_path.exists() and dir_path.is_dir():
-            print(f"✓ {directory}: Exists")
+            log(f"✓ {directory}: Exists")
         else:
-            print(f"✗ {directory}: Not found")
+            log(f"✗ {directory}: Not found")
             all_exist = False
 
     if not all_exist:
-        print("\nSome required directories are missing. Run the following command:")
-        print("python fonts_setup.py")
-        print("python image_setup.py")
+        log("\nSome required directories are missing. Run the following command:")
+        log("python fonts_setup.py")
+        log("python image_setup.py")
 
     return all_exist
 
 
-def check_required_files():
+def check_required_files(log=print):
     """Check if required asset files exist"""
-    print("\n--- Checking Required Files ---")
+    log("\n--- Checking Required Files ---")
     required_files = [
         "assets/fonts/military_font.ttf",
         "assets/images/backgrounds/default_bg.png",
@@ -102,24 +118,28 @@ def check_required_files():
     all_exist = True
 
     for file_path in required_files:
-        path = Path(file_path)
-        if path.exists() and path.is_file():
-            print(f"✓ {file_path}: Exists")
+        if asset_manifest is not None:
+            exists = asset_manifest.exists(file_path)
+        else:
+            exists = Path(ROOT_DIR, file_path).is_file()
+
+        if exists:
+            log(f"✓ {file_path}: Exists")
         else:
-            print(f"✗ {file_path}: Not found")
+            log(f"✗ {file_path}: Not found")
             all_exist = False
 
     if not all_exist:
-        print("\nSome required files are missing. Run the following commands:")
-        print("python fonts_setup.py")
-        print("python image_setup.py")
+        log("\nSome required files are missing. Run the following commands:")
+        log("python fonts_setup.py")
+        log("python image_setup.py")
 
     return all_exist
 
 
-def check_source_files():
+def check_source_files(log=print):
     """Check if core source files exist"""
-    print("\n--- Checking Core Source Files ---")
+    log("\n--- Checking Core Source Files ---")
     required_files = [
         "src/main.py",
         "src/config.py",
@@ -145,57 +165,57 @@ def check_source_files():
     for file_path in required_files:
         path = Path(file_path)
         if path.exists() and path.is_file():
-            print(f"✓ {file_path}: Exists")
+            log(f"✓ {file_path}: Exists")
         else:
-            print(f"✗ {file_path}: Not found")
+            log(f"✗ {file_path}: Not found")
             all_exist = False
 
     if not all_exist:
-        print("\nSome core source files are missing. Check your project structure.")
+        log("\nSome core source files are missing. Check your project structure.")
 
     return all_exist
 
 
-def check_career_controller():
+def check_career_controller(log=print):
     """Check if CareerController has the necessary signal"""
-    print("\n--- Checking CareerController ---")
+    log("\n--- Checking CareerController ---")
     career_controller_path = Path("src/controllers/career_controller.py")
 
     if not career_controller_path.exists():
-        print("✗ CareerController file not found")
+        log("✗ CareerController file not found")
         return False
 
     with open(career_controller_path, "r") as f:
         content = f.read()
 
     if "careerCompleted = pyqtSignal" in content:
-        print("✓ CareerController has careerCompleted signal")
+        log("✓ CareerController has careerCompleted signal")
         signal_ok = True
     else:
-        print("✗ CareerController missing careerCompleted signal")
+        log("✗ CareerController missing careerCompleted signal")
         signal_ok = False
 
     if "def _on_career_completed" in content or "def on_career_completed" in content:
-        print("✓ CareerController has career completion handler")
+        log("✓ CareerController has career completion handler")
         handler_ok = True
     else:
-        print("✗ CareerController missing career completion handler")
+        log("✗ CareerController missing career completion handler")
         handler_ok = False
 
     if not signal_ok or not handler_ok:
-        print("\nCareerController needs to be fixed. Run the following command:")
-        print("python fixed_main.py")
+        log("\nCareerController needs to be fixed. Run the following command:")
+        log("python fixed_main.py")
 
     return signal_ok and handler_ok
 
 
-def check_game_controller():
+def check_game_controller(log=print):
     """Check GameController for potential issues"""
-    print("\n--- Checking GameController ---")
+    log("\n--- Checking GameController ---")
     game_controller_path = Path("src/controllers/game_controller.py")
 
     if not game_controller_path.exists():
-        print("✗ GameController file not found")
+        log("✗ GameController file not found")
         return False
 
     with open(game_controller_path, "r") as f:
@@ -207,88 +227,252 @@ def check_game_controller():
     if "self.career_controller.careerCompleted.connect" in content:
         connection_line = \
         [line for line in content.split("\n") if "self.career_controller.careerCompleted.connect" in line][0].strip()
-        print(f"✓ Connection to careerCompleted exists: {connection_line}")
+        log(f"✓ Connection to careerCompleted exists: {connection_line}")
     else:
-        print("✗ No connection to careerCompleted signal")
+        log("✗ No connection to careerCompleted signal")
         issues.append("Missing connection to careerCompleted signal")
 
     if issues:
-        print("\nGameController has potential issues that need fixing:")
+        log("\nGameController has potential issues that need fixing:")
         for issue in issues:
-            print(f"- {issue}")
-        print("\nRun the following command to apply fixes:")
-        print("python fixed_main.py")
+            log(f"- {issue}")
+        log("\nRun the following command to apply fixes:")
+        log("python fixed_main.py")
         return False
 
     return True
 
 
-def run_simple_test():
+def run_simple_test(log=print):
     """Run a simple test to check if PyQt works"""
-    print("\n--- Running Simple PyQt Test ---")
+    log("\n--- Running Simple PyQt Test ---")
     test_script = Path("test_pyqt.py")
 
     if not test_script.exists():
-        print("✗ test_pyqt.py not found")
+        log("✗ test_pyqt.py not found")
         return False
 
     try:
-        print("Attempting to run PyQt test...")
+        log("Attempting to run PyQt test...")
         result = subprocess.run([sys.executable, "test_pyqt.py"],
                                 capture_output=True,
                                 text=True,
                                 timeout=5)
 
         if result.returncode == 0:
-            print("✓ PyQt test ran successfully")
+            log("✓ PyQt test ran successfully")
             return True
         else:
-            print(f"✗ PyQt test failed with return code {result.returncode}")
-            print(f"Error output: {result.stderr}")
+            log(f"✗ PyQt test failed with return code {result.returncode}")
+            log(f"Error output: {result.stderr}")
             return False
     except subprocess.TimeoutExpired:
-        print("✗ PyQt test timed out - this might be normal if it displayed a window")
+        log("✗ PyQt test timed out - this might be normal if it displayed a window")
         return True
     except Exception as e:
-        print(f"✗ Error running PyQt test: {e}")
+        log(f"✗ Error running PyQt test: {e}")
         return False
 
 
-def main():
-    """Run all checks"""
+# Checks: (name, summary label, function, checks that must pass first, timeout in seconds)
+CHECKS = [
+    ("python_version", "Python Version", check_python_version, [], 5),
+    ("dependencies", "Dependencies", check_dependencies, [], 30),
+    ("asset_directories", "Asset Directories", check_asset_directories, [], 10),
+    ("required_files", "Required Files", check_required_files, [], 10),
+    ("source_files", "Source Files", check_source_files, [], 10),
+    ("career_controller", "CareerController", check_career_controller, [], 10),
+    ("game_controller", "GameController", check_game_controller, [], 10),
+    ("pyqt_test", "PyQt Test", run_simple_test, ["python_version", "dependencies"], 15)
+]
+
+
+def _start_check(function, lines):
+    """Start a check function on a daemon thread, collecting its log lines
+
+    Daemon threads don't keep the process alive, so a check that hangs past
+    its timeout doesn't stop the script from exiting once the report is done.
+
+    Args:
+        function: Check function taking a log function
+        lines: List the log lines are added to
+
+    Returns:
+        Future that resolves to True if the check passed, False otherwise
+    """
+    future = Future()
+
+    def run():
+        try:
+            future.set_result(bool(function(lines.append)))
+        except Exception as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name=f"check-{function.__name__}", daemon=True).start()
+    return future
+
+
+def validate_checks(checks):
+    """Make sure every dependency names a check and there are no cycles
+
+    Args:
+        checks: List of check definitions
+
+    Raises:
+        ValueError: If a dependency is unknown or checks depend on each other in a cycle
+    """
+    dependencies = {name: list(requires) for name, _, _, requires, _ in checks}
+    for name, requires in dependencies.items():
+        for dependency in requires:
+            if dependency not in dependencies:
+                raise ValueError(f"Check '{name}' depends on unknown check '{dependency}'")
+
+    # Repeatedly remove checks whose dependencies are all removed; anything left is in a cycle
+    remaining = dict(dependencies)
+    while remaining:
+        ready = [name for name, requires in remaining.items()
+                 if not any(dependency in remaining for dependency in requires)]
+        if not ready:
+            raise ValueError(f"Checks depend on each other in a cycle: {', '.join(sorted(remaining))}")
+        for name in ready:
+            del remaining[name]
+
+
+def _make_result(name, label, status, started, lines):
+    """Build the report entry of a check"""
+    return {
+        "name": name,
+        "label": label,
+        "status": status,
+        "ok": status == "passed",
+        "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+        "log": lines
+    }
+
+
+def run_checks(checks=None, max_workers=None):
+    """Run the checks as a task graph on daemon threads
+
+    Checks start as soon as the checks they depend on have finished, so
+    independent checks run at the same time and the whole run takes about as
+    long as the slowest chain. A check is skipped if a check it depends on
+    failed, and reported as timed out if it runs past its timeout.
+
+    Args:
+        checks: List of check definitions (default: CHECKS)
+        max_workers: Maximum number of checks running at once (default: one per check)
+
+    Returns:
+        Dictionary mapping check name to its result, in check order
+
+    Raises:
+        ValueError: If the dependencies are invalid (see validate_checks)
+    """
+    if checks is None:
+        checks = CHECKS
+    validate_checks(checks)
+
+    pending = {name: (label, function, dependencies, timeout)
+               for name, label, function, dependencies, timeout in checks}
+    running = {}  # future -> (name, label, start time, timeout, log lines)
+    results = {}
+
+    while pending or running:
+        # Start every check whose dependencies have finished
+        for name, (label, function, dependencies, timeout) in list(pending.items()):
+            if max_workers and len(running) >= max_workers:
+                break
+            if not all(dependency in results for dependency in dependencies):
+                continue
+
+            del pending[name]
+            started = time.perf_counter()
+            failed = [dependency for dependency in dependencies if not results[dependency]["ok"]]
+            if failed:
+                lines = [f"\n--- Skipping {label} ---",
+                         f"{', '.join(results[d]['label'] for d in failed)} check failed. Skipping {label}."]
+                results[name] = _make_result(name, label, "skipped", started, lines)
+                continue
+
+            lines = []
+            future = _start_check(function, lines)
+            running[future] = (name, label, started, timeout, lines)
+
+        if not running:
+            continue
+
+        # Wait until a check finishes or the next one runs out of time
+        next_deadline = min(started + timeout for _, _, started, timeout, _ in running.values())
+        done, _ = wait(running, timeout=max(0.0, next_deadline - time.perf_counter()),
+                       return_when=FIRST_COMPLETED)
+
+        now = time.perf_counter()
+        for future, (name, label, started, timeout, lines) in list(running.items()):
+            if future in done:
+                try:
+                    status = "passed" if future.result() else "failed"
+                except Exception as e:
+                    lines.append(f"✗ Error running check: {e}")
+                    status = "error"
+            elif now - started >= timeout:
+                lines.append(f"✗ Check timed out after {timeout} seconds")
+                status = "timeout"
+            else:
+                continue
+
+            del running[future]
+            results[name] = _make_result(name, label, status, started, list(lines))
+
+    return {name: results[name] for name, *_ in checks}
+
+
+def main(argv=None):
+    """Run all checks
+
+    Args:
+        argv: Command line arguments (default: sys.argv[1:])
+
+    Returns:
+        Exit code (0 if every check passed, 1 otherwise)
+    """
+    parser = argparse.ArgumentParser(description="Check the Twilight 2000 Character Creator environment.")
+    parser.add_argument("--json", nargs="?", const="-", metavar="FILE",
+                        help="Write a JSON report to FILE (or standard output)")
+    parser.add_argument("--workers", type=int, help="Maximum number of checks running at once")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    results = run_checks(max_workers=args.workers)
+    all_checks = all(result["ok"] for result in results.values())
+
+    report = {
+        "ok": all_checks,
+        "duration_ms": round((time.perf_counter() - started) * 1000, 1),
+        "checks": results
+    }
+
+    if args.json == "-":
+        print(json.dumps(report, indent=2, ensure_ascii=False))
+        return 0 if all_checks else 1
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
     print("=== Twilight 2000 Character Creator Environment Check ===")
 
-    # Run all checks
-    python_ok = check_python_version()
-    deps_ok = check_dependencies()
-    dirs_ok = check_asset_directories()
-    files_ok = check_required_files()
-    source_ok = check_source_files()
-    career_controller_ok = check_career_controller()
-    game_controller_ok = check_game_controller()
-
-    # Run PyQt test if basic checks pass
-    if python_ok and deps_ok:
-        pyqt_ok = run_simple_test()
-    else:
-        pyqt_ok = False
-        print("\n--- Skipping PyQt Test ---")
-        print("Python or dependency check failed. Skipping PyQt test.")
+    # Show each check's output in order
+    for result in results.values():
+        for line in result["log"]:
+            print(line)
 
     # Summarize results
     print("\n=== Summary ===")
-    print(f"Python Version: {'✓' if python_ok else '✗'}")
-    print(f"Dependencies: {'✓' if deps_ok else '✗'}")
-    print(f"Asset Directories: {'✓' if dirs_ok else '✗'}")
-    print(f"Required Files: {'✓' if files_ok else '✗'}")
-    print(f"Source Files: {'✓' if source_ok else '✗'}")
-    print(f"CareerController: {'✓' if career_controller_ok else '✗'}")
-    print(f"GameController: {'✓' if game_controller_ok else '✗'}")
-    print(f"PyQt Test: {'✓' if pyqt_ok else '✗'}")
+    for result in results.values():
+        print(f"{result['label']}: {'✓' if result['ok'] else '✗'} ({result['duration_ms']:.0f} ms)")
+    print(f"Total: {report['duration_ms']:.0f} ms")
 
     # Overall assessment
-    all_checks = python_ok and deps_ok and dirs_ok and files_ok and source_ok and career_controller_ok and game_controller_ok and pyqt_ok
-
     if all_checks:
         print("\n✅ All checks passed! The environment appears to be set up correctly.")
         print("To run the application, use:")
@@ -299,6 +483,8 @@ def main():
         print("try running with the fixed main script:")
         print("python fixed_main.py")
 
+    return 0 if all_checks else 1
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
@@ -6,13 +6,23 @@ config.py - Configuration settings for the Twilight 2000 Character Creator
 APP_NAME = "Twilight 2000 Character Creator"
 APP_VERSION = "1.0.0"
 DEBUG_MODE = True
+STARTUP_CACHE_FILE = ".startup_cache.json"  # Fingerprint of the last successful startup setup
 
 # UI Settings
 DEFAULT_WINDOW_WIDTH = 1024
 DEFAULT_WINDOW_HEIGHT = 768
 DEFAULT_FONT = "Arial"
 MILITARY_FONT = "assets/fonts/military_font.ttf"  # Replace with actual font file
+ASSET_MANIFEST_FILE = "assets/asset_manifest.json"  # Asset paths, sizes and hashes, written by build.py
+RESOURCE_MODE = "auto"  # "auto" (bundle if compiled), "bundle" or "files" (loose files, for development)
+RESOURCE_COMPRESSION = {  # Compression per asset class in the resource bundle: "zlib", "zstd" or "none"
+    "fonts": "zlib",
+    "images": "none",  # PNGs are already compressed
+    "sounds": "zlib",
+    "music": "none",  # MP3s are already compressed
+}
 TEXT_SCROLL_SPEED = 30  # ms per character
+SCREEN_PRELOAD_DELAY = 250  # ms of idle time before building the next screen
 
 # Theme Settings
 THEMES = {
@@ -51,6 +61,17 @@ THEMES = {
     }
 }
 DEFAULT_THEME = "default"
+THEME_CACHE_FILE = "assets/theme_cache.json"  # Compiled themes, written by build.py
+THEME_REPOLISH_VISIBLE_ONLY = False  # Restyle hidden windows when they are shown
+
+# Background image for each theme
+THEME_BACKGROUNDS = {
+    "default": "assets/images/backgrounds/default_bg.png",
+    "military": "assets/images/backgrounds/military_bg.png",
+    "soviet": "assets/images/backgrounds/soviet_bg.png",
+}
+APP_ICON = "assets/images/icons/app_icon.png"
+IMAGE_CACHE_BUDGET = 64 * 1024 * 1024  # Bytes of decoded and scaled images to keep
 
 # Audio Settings
 MASTER_VOLUME = 0.7
@@ -58,6 +79,13 @@ MUSIC_VOLUME = 0.5
 SFX_VOLUME = 0.8
 ENABLE_MUSIC = True
 ENABLE_SFX = True
+AUDIO_BACKEND = "auto"  # "auto" (silent when headless or without devices), "qt" or "null"
+SFX_POLYPHONY = 4  # Voices per sound effect; the oldest is stolen when all are busy
+SFX_PRELOAD = ["button_click", "dice_roll"]  # Sound effects decoded at startup
+
+MUSIC_CROSSFADE = 1500  # ms to crossfade between music tracks
+MUSIC_FADE_STEP = 30  # ms between crossfade volume steps
+STARTUP_MUSIC_DELAY = 500  # ms after the main window is shown before music starts
 
 AUDIO_FILES = {
     "intro_music": "assets/music/main_theme.mp3",
@@ -67,9 +95,42 @@ AUDIO_FILES = {
     "dice_roll": "assets/sounds/dice_roll.wav",
 }
 
+# Music for each theme
+THEME_MUSIC = {
+    "default": "intro_music",
+    "military": "military_theme",
+    "soviet": "soviet_theme",
+}
+
+# Audio Scheduling (requests closer together than the interval are coalesced)
+AUDIO_MIN_INTERVALS = {  # ms
+    "button_click": 50,
+    "dice_roll": 120,
+}
+AUDIO_PRIORITIES = {  # "ui" < "dice" < "music"
+    "intro_music": "music",
+    "military_theme": "music",
+    "soviet_theme": "music",
+    "button_click": "ui",
+    "dice_roll": "dice",
+}
+AUDIO_PRIORITY_HOLD = 80  # ms lower priority sounds are dropped after a higher one starts
+
 # Game Data Settings
 DATA_VERSION = "1.0"
 DICE_ANIMATION_SPEED = 50  # ms between dice roll frames
 
+# Roster Settings
+ROSTER_DB = "roster.db"  # SQLite database for saved characters
+ROSTER_PAGE_SIZE = 200  # Rows fetched per page in the roster browser
+
+# Instrumentation Settings (the T2K_INSTRUMENT and T2K_INSTRUMENT_PAINT environment variables override)
+INSTRUMENTATION_ENABLED = DEBUG_MODE
+PAINT_INSTRUMENTATION_ENABLED = False  # Times paint events, adding a Python call to every event
+INSTRUMENTATION_BUFFER_SIZE = 20000  # Timing samples kept in memory
+INSTRUMENTATION_HEARTBEAT = 50  # ms between event loop heartbeats
+STALL_THRESHOLD = 50  # ms a heartbeat may be late before it counts as a stall
+INSTRUMENTATION_TRACE_FILE = "logs/ui_trace.json"  # Chrome trace written on exit
+
 # Character Creation Settings
 STARTING_AGE = 18
\ No newline at end of file
@@ -4,6 +4,8 @@ dice_controller.py - Dice rolling controller
 
 import random
 
+from src.data.skills import CHECK_DIE_SIZES
+
 
 class DiceController:
     """Controller for rolling dice"""
@@ -40,6 +42,21 @@ class DiceController:
         """
         return random.randint(1, size)
 
+    def roll_dice(self, size, count):
+        """Roll a batch of dice of the same size in one call
+
+        Args:
+            size: Number of sides on each die
+            count: Number of dice to roll
+
+        Returns:
+            List of count random numbers from 1 to size
+        """
+        if size <= 0 or count <= 0:
+            return []
+
+        return random.choices(range(1, size + 1), k=count)
+
     def roll_attribute_die(self, attribute_level):
         """Roll a die based on attribute level
 
@@ -49,16 +66,8 @@ class DiceController:
         Returns:
             Random number from the appropriate die (D12, D10, D8, or D6)
         """
-        # Map attribute levels to die sizes
-        die_sizes = {
-            "A": 12,  # D12
-            "B": 10,  # D10
-            "C": 8,  # D8
-            "D": 6  # D6
-        }
-
         # Get the die size for the attribute level
-        die_size = die_sizes.get(attribute_level, 8)  # Default to D8 if level not found
+        die_size = CHECK_DIE_SIZES.get(attribute_level) or 8  # Default to D8 if level not found
 
         # Roll the die
         return self.roll_die(die_size)
@@ -72,17 +81,8 @@ class DiceController:
         Returns:
             Random number from the appropriate die (D12, D10, D8, D6, or 0)
         """
-        # Map skill levels to die sizes
-        die_sizes = {
-            "A": 12,  # D12
-            "B": 10,  # D10
-            "C": 8,  # D8
-            "D": 6,  # D6
-            "F": 0  # No die
-        }
-
         # Get the die size for the skill level
-        die_size = die_sizes.get(skill_level, 0)  # Default to 0 if level not found
+        die_size = CHECK_DIE_SIZES.get(skill_level, 0)  # Default to 0 if level not found
 
         # Return 0 for level F (untrained)
         if die_size == 0:
@@ -112,6 +112,34 @@ class DiceController:
 
         return (attribute_roll, skill_roll, total)
 
+    def roll_skill_checks(self, checks):
+        """Roll many skill checks in one batch
+
+        Dice of the same size are rolled together, so a whole round of
+        actions costs one roll call per die size.
+
+        Args:
+            checks: List of (attribute level, skill level) tuples
+
+        Returns:
+            List of (attribute roll, skill roll, total) tuples in the same order
+        """
+        sizes = []
+        for attribute_level, skill_level in checks:
+            sizes.append(CHECK_DIE_SIZES.get(attribute_level) or 8)
+            sizes.append(CHECK_DIE_SIZES.get(skill_level, 0))
+
+        # Count the dice needed for each size and roll them all at once
+        counts = {}
+        for size in sizes:
+            if size:
+                counts[size] = counts.get(size, 0) + 1
+        pools = {size: iter(self.roll_dice(size, count)) for size, count in counts.items()}
+
+        rolls = [next(pools[size]) if size else 0 for size in sizes]
+
+        return [(rolls[i], rolls[i + 1], rolls[i] + rolls[i + 1]) for i in range(0, len(rolls), 2)]
+
     def roll_career_path(self):
         """Roll for a random career path based on 2D6
 
@@ -9,6 +9,11 @@ import os
 from src.models.character import Character
 from src.controllers.dice_controller import DiceController
 from src.controllers.career_controller import CareerController
+from src.utils.instrumentation import timed_slot
+from src.utils.lazy_import import lazy_import
+
+# PDF export is rarely used, so it's only loaded on first use
+pdf_generator = lazy_import("src.utils.pdf_generator")
 
 
 class GameController(QObject):
@@ -169,6 +174,7 @@ class GameController(QObject):
         """
         return self.career_controller.check_war_breakout()
 
+    @timed_slot("warBrokenOut:GameController")
     def _on_war_broken_out(self):
         """Handle war breaking out"""
         self.war_broken_out = True
@@ -225,26 +231,34 @@ class GameController(QObject):
                 character_dict = json.load(f)
 
             # Create character from dictionary
-            self.character = Character.from_dict(character_dict)
-
-            # Update career controller
-            self.career_controller.set_character(self.character)
-
-            # Set state based on loaded character
-            self.war_broken_out = self.character.war_experience
-            self.character_completed = True
-
-            # Emit signals
-            self.characterChanged.emit(self.character)
-            if self.war_broken_out:
-                self.warBrokenOut.emit()
-            self.characterCompleted.emit()
+            self.set_character(Character.from_dict(character_dict))
 
             return True
         except Exception as e:
             print(f"Error loading character: {e}")
             return False
 
+    def set_character(self, character):
+        """Replace the current character with a completed one
+
+        Args:
+            character: Character object (e.g., loaded from a file or the roster)
+        """
+        self.character = character
+
+        # Update career controller
+        self.career_controller.set_character(self.character)
+
+        # Set state based on loaded character
+        self.war_broken_out = self.character.war_experience
+        self.character_completed = True
+
+        # Emit signals
+        self.characterChanged.emit(self.character)
+        if self.war_broken_out:
+            self.warBrokenOut.emit()
+        self.characterCompleted.emit()
+
     def export_to_pdf(self, filename):
         """Export character to PDF
 
@@ -254,16 +268,15 @@ class GameController(QObject):
         Returns:
             True if successful, False otherwise
         """
-        from src.utils.pdf_exporter import PDFExporter, check_file_extension
-
         # Ensure filename has .pdf extension
-        filename = check_file_extension(filename, ".pdf")
+        if not filename.lower().endswith(".pdf"):
+            filename += ".pdf"
 
-        # Create exporter
-        exporter = PDFExporter(self.character)
+        # Create generator
+        generator = pdf_generator.PDFGenerator(self.character)
 
         # Export character sheet
-        return exporter.export_to_pdf(filename)
+        return generator.generate_pdf(filename)
 
     def roll_attributes(self):
         """Roll random attributes
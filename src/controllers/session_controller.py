@@ -0,0 +1,320 @@
+"""
+session_controller.py - Controller for tracking combatants during play sessions
+"""
+
+from src.models.combatant import Combatant
+from src.controllers.dice_controller import DiceController
+from src.data.skills import get_attribute_for_skill, CHECK_DIE_SIZES, CHECK_SUCCESS_THRESHOLD
+
+# Rounds between full state snapshots used to rebuild past rounds
+CHECKPOINT_INTERVAL = 10
+
+
+class SessionController:
+    """Controller for a play session with a group of characters and NPCs
+
+    Every change to a combatant is recorded as an event in an append-only
+    log. Current state is kept up to date as events are added, and the state
+    at any earlier round is rebuilt from the nearest snapshot.
+    """
+
+    def __init__(self):
+        """Initialize the session controller"""
+        self.dice_controller = DiceController()
+        self.reset()
+
+    def reset(self):
+        """Clear the session"""
+        self.combatants = {}
+        self.events = []
+        self.current_round = 0
+
+        # Event index where each round starts, and snapshots by round
+        self._round_starts = [0]
+        self._checkpoints = {0: (0, {})}
+        self._next_id = 1
+
+    def add_combatant(self, character, is_npc=False):
+        """Add a character or NPC to the session
+
+        Args:
+            character: Character or Combatant object
+            is_npc: Whether the character is an NPC (ignored for Combatant objects)
+
+        Returns:
+            Combatant ID
+        """
+        combatant_id = self._next_id
+        self._next_id += 1
+
+        if isinstance(character, Combatant):
+            data = character.to_dict()
+            data["combatant_id"] = combatant_id
+        else:
+            data = Combatant.from_character(combatant_id, character, is_npc).to_dict()
+
+        self._record({"type": "join", "combatant": data})
+        return combatant_id
+
+    def add_combatants(self, characters, is_npc=True):
+        """Add many characters or NPCs to the session
+
+        Args:
+            characters: List of Character objects (e.g., a generated unit)
+            is_npc: Whether the characters are NPCs
+
+        Returns:
+            List of combatant IDs
+        """
+        return [self.add_combatant(character, is_npc) for character in characters]
+
+    def remove_combatant(self, combatant_id):
+        """Remove a combatant from the session
+
+        Args:
+            combatant_id: Combatant ID
+
+        Returns:
+            True if the combatant was removed, False if not found
+        """
+        if combatant_id not in self.combatants:
+            return False
+
+        self._record({"type": "leave", "target": combatant_id})
+        return True
+
+    def get_combatant(self, combatant_id):
+        """Get a combatant by ID
+
+        Args:
+            combatant_id: Combatant ID
+
+        Returns:
+            Combatant object or None if not found
+        """
+        return self.combatants.get(combatant_id)
+
+    def start_round(self):
+        """Start the next round
+
+        Returns:
+            The new round number
+        """
+        self.current_round += 1
+        self._round_starts.append(len(self.events))
+        self._record({"type": "round"})
+
+        if self.current_round % CHECKPOINT_INTERVAL == 0:
+            snapshot = {cid: combatant.to_dict() for cid, combatant in self.combatants.items()}
+            self._checkpoints[self.current_round] = (len(self.events), snapshot)
+
+        return self.current_round
+
+    def resolve_round(self, actions):
+        """Resolve a whole round of actions with one batched roll
+
+        Args:
+            actions: List of action dictionaries with "actor" (combatant ID), "skill",
+                and optionally "target" (combatant ID) and "damage" (default 1)
+
+        Returns:
+            List of result dictionaries with the actor, skill, target, rolls and
+            success, in the same order as actions
+        """
+        self.start_round()
+
+        checks = []
+        pending = []
+        results = []
+
+        for action in actions:
+            actor = self.combatants.get(action.get("actor"))
+            result = {
+                "actor": action.get("actor"),
+                "skill": action.get("skill"),
+                "target": action.get("target"),
+                "rolls": None,
+                "success": False
+            }
+            results.append(result)
+
+            # Combatants who are gone or broken lose their action
+            if not actor or not actor.can_act():
+                continue
+
+            attribute = get_attribute_for_skill(action.get("skill")) or "STR"
+            checks.append((actor.attributes.get(attribute, "C"), actor.skills.get(action.get("skill"), "F")))
+            pending.append((result, action))
+
+        # One roll call for every check in the round
+        for (result, action), rolls in zip(pending, self.dice_controller.roll_skill_checks(checks)):
+            result["rolls"] = rolls
+            result["success"] = rolls[0] >= CHECK_SUCCESS_THRESHOLD or rolls[1] >= CHECK_SUCCESS_THRESHOLD
+
+            self._record({
+                "type": "check",
+                "actor": result["actor"],
+                "skill": result["skill"],
+                "target": result["target"],
+                "rolls": rolls,
+                "success": result["success"]
+            })
+
+            if result["success"] and result["target"] in self.combatants:
+                self.apply_damage(result["target"], action.get("damage", 1))
+
+        return results
+
+    def resolve_cuf_checks(self, combatant_ids, stress=1):
+        """Roll Coolness Under Fire for many combatants at once
+
+        Combatants who fail take stress.
+
+        Args:
+            combatant_ids: List of combatant IDs under fire
+            stress: Stress taken on a failed check
+
+        Returns:
+            Dictionary mapping combatant ID to True if the check succeeded
+        """
+        present = [cid for cid in combatant_ids if cid in self.combatants]
+
+        # Group by die size so each size is rolled once
+        by_size = {}
+        for cid in present:
+            # Coolness Under Fire rolls the die of its level, like an attribute
+            size = CHECK_DIE_SIZES.get(self.combatants[cid].cuf) or 6
+            by_size.setdefault(size, []).append(cid)
+
+        results = {}
+        for size, ids in by_size.items():
+            for cid, roll in zip(ids, self.dice_controller.roll_dice(size, len(ids))):
+                results[cid] = roll >= CHECK_SUCCESS_THRESHOLD
+
+        for cid in present:
+            self._record({"type": "cuf", "target": cid, "success": results[cid]})
+            if not results[cid]:
+                self.apply_stress(cid, stress)
+
+        return results
+
+    def apply_damage(self, combatant_id, amount):
+        """Apply damage to a combatant (negative amounts heal)
+
+        Args:
+            combatant_id: Combatant ID
+            amount: Damage points
+        """
+        self._record({"type": "damage", "target": combatant_id, "amount": amount})
+
+    def apply_stress(self, combatant_id, amount):
+        """Apply stress to a combatant (negative amounts recover)
+
+        Args:
+            combatant_id: Combatant ID
+            amount: Stress points
+        """
+        self._record({"type": "stress", "target": combatant_id, "amount": amount})
+
+    def apply_radiation(self, combatant_id, amount):
+        """Apply radiation points to a combatant
+
+        Args:
+            combatant_id: Combatant ID
+            amount: Radiation points
+        """
+        self._record({"type": "radiation", "target": combatant_id, "amount": amount})
+
+    def set_cuf(self, combatant_id, level):
+        """Set a combatant's Coolness Under Fire
+
+        Args:
+            combatant_id: Combatant ID
+            level: CUF level (A, B, C or D)
+        """
+        if CHECK_DIE_SIZES.get(level):
+            self._record({"type": "set_cuf", "target": combatant_id, "level": level})
+
+    def get_events(self, round_number=None):
+        """Get logged events
+
+        Args:
+            round_number: Optional round to filter by
+
+        Returns:
+            List of event dictionaries
+        """
+        if round_number is None:
+            return list(self.events)
+
+        if round_number < 0 or round_number > self.current_round:
+            return []
+
+        start = self._round_starts[round_number]
+        end = self._round_starts[round_number + 1] if round_number < self.current_round else len(self.events)
+        return self.events[start:end]
+
+    def get_state_at(self, round_number):
+        """Rebuild the combatants as they were at the end of a round
+
+        Args:
+            round_number: Round number (0 is the setup before the first round)
+
+        Returns:
+            Dictionary mapping combatant ID to Combatant object
+        """
+        round_number = max(0, min(round_number, self.current_round))
+
+        # Start from the nearest snapshot at or before the round
+        checkpoint_round = round_number - round_number % CHECKPOINT_INTERVAL
+        start, snapshot = self._checkpoints[checkpoint_round]
+        combatants = {cid: Combatant.from_dict(data) for cid, data in snapshot.items()}
+
+        end = self._round_starts[round_number + 1] if round_number < self.current_round else len(self.events)
+        for event in self.events[start:end]:
+            self._apply_event(combatants, event)
+
+        return combatants
+
+    def _record(self, event):
+        """Append an event to the log and apply it to the current state
+
+        Args:
+            event: Event dictionary without the round number
+        """
+        event["round"] = self.current_round
+        self.events.append(event)
+        self._apply_event(self.combatants, event)
+
+    def _apply_event(self, combatants, event):
+        """Apply an event to a set of combatants
+
+        Args:
+            combatants: Dictionary mapping combatant ID to Combatant object
+            event: Event dictionary
+        """
+        event_type = event["type"]
+
+        if event_type == "join":
+            combatant = Combatant.from_dict(event["combatant"])
+            combatants[combatant.combatant_id] = combatant
+            return
+
+        target = combatants.get(event.get("target"))
+        if not target:
+            return
+
+        if event_type == "leave":
+            del combatants[target.combatant_id]
+        elif event_type == "damage":
+            target.damage = max(0, target.damage + event["amount"])
+        elif event_type == "stress":
+            target.stress = max(0, target.stress + event["amount"])
+        elif event_type == "radiation":
+            target.radiation = max(0, target.radiation + event["amount"])
+        elif event_type == "set_cuf":
+            target.cuf = event["level"]
+
+
+# Create a global instance for easy access
+session_controller = SessionController()
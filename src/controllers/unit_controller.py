@@ -0,0 +1,209 @@
+"""
+unit_controller.py - Controller for generating whole NPC units
+"""
+
+import random
+
+from src.models.character import Character
+from src.controllers.dice_controller import DiceController
+from src.data.attributes import calculate_hit_capacity, calculate_stress_capacity
+from src.data.nationalities import get_nationality_gear, get_unit_rank
+from src.data.units import get_unit_structure, get_rank_tier_profile
+
+# Attribute letters from best to worst
+ATTRIBUTE_LETTERS = ["A", "B", "C", "D"]
+
+
+class UnitController:
+    """Controller for generating NPC formations in batches"""
+
+    def __init__(self):
+        """Initialize the unit controller"""
+        self.dice_controller = DiceController()
+
+    def generate_unit(self, nationality, unit_type, size=None):
+        """Generate a whole unit of NPCs
+
+        Every column (attributes, CUF, skills, age) is rolled for the whole unit
+        at once instead of running each NPC through the character controller.
+
+        Args:
+            nationality: Nationality of the unit
+            unit_type: Unit type name from UNIT_STRUCTURES
+            size: Number of NPCs (default: the unit type's standard size)
+
+        Returns:
+            List of Character objects, or an empty list if the unit type is unknown
+        """
+        structure = get_unit_structure(unit_type)
+        if not structure:
+            return []
+
+        if size is None:
+            size = structure["size"]
+
+        slots = self._expand_slots(structure, size)
+        count = len(slots)
+        if count == 0:
+            return []
+
+        attributes = self._roll_attribute_columns(count)
+        ages, cufs, skills = self._roll_experience_columns(structure, slots)
+
+        # Gear and ranks depend only on nationality and tier, so look them up once
+        gear = get_nationality_gear(nationality, structure["military"])
+        ranks = {tier: get_unit_rank(nationality, tier) for _, tier in slots}
+        career_type = "Military" if structure["military"] else "Local Militia"
+
+        role_totals = {}
+        for role, _ in slots:
+            role_totals[role] = role_totals.get(role, 0) + 1
+
+        role_numbers = {}
+        unit = []
+
+        for i, (role, tier) in enumerate(slots):
+            character = Character()
+
+            # Number NPCs that share a role (e.g., "Rifleman 3")
+            role_numbers[role] = role_numbers.get(role, 0) + 1
+            if role_totals[role] > 1:
+                character.name = f"{role} {role_numbers[role]}"
+            else:
+                character.name = role
+
+            character.nationality = nationality
+            character.age = ages[i]
+            character.attributes = attributes[i]
+            character.hit_capacity = calculate_hit_capacity(attributes[i]["STR"], attributes[i]["AGL"])
+            character.stress_capacity = calculate_stress_capacity(attributes[i]["INT"], attributes[i]["EMP"])
+            character.cuf = cufs[i]
+            character.skills = skills[i]
+            character.careers = [{
+                "type": career_type,
+                "branch": unit_type,
+                "rank": ranks[tier],
+                "promotion": False,
+                "age": ages[i]
+            }]
+            character.gear = list(gear)
+
+            unit.append(character)
+
+        return unit
+
+    def _expand_slots(self, structure, size):
+        """Expand a unit structure into one (role, rank tier) slot per NPC
+
+        Args:
+            structure: Unit structure dictionary
+            size: Number of NPCs in the unit
+
+        Returns:
+            List of (role, rank tier) tuples
+        """
+        slots = []
+        filler = None
+
+        for element in structure["elements"]:
+            if element["count"] is None:
+                filler = element
+                continue
+
+            # Leadership slots come first, so small units keep their leaders
+            remaining = size - len(slots)
+            slots.extend([(element["role"], element["rank"])] * min(element["count"], remaining))
+
+        if filler and len(slots) < size:
+            slots.extend([(filler["role"], filler["rank"])] * (size - len(slots)))
+
+        return slots
+
+    def _roll_attribute_columns(self, count):
+        """Roll attributes for a batch of NPCs
+
+        Uses the same 2D3-2 random increase rule as a single character.
+
+        Args:
+            count: Number of NPCs
+
+        Returns:
+            List of attribute dictionaries, one per NPC
+        """
+        first = self.dice_controller.roll_dice(3, count)
+        second = self.dice_controller.roll_dice(3, count)
+        increases = [min(4, max(0, a + b - 2)) for a, b in zip(first, second)]
+
+        # Draw every increase for the whole unit in a single call
+        picks = random.choices(range(4), k=sum(increases))
+
+        attributes = []
+        pick_index = 0
+
+        for num_increases in increases:
+            levels = [2, 2, 2, 2]  # All attributes start at C
+            for attr_index in picks[pick_index:pick_index + num_increases]:
+                if levels[attr_index] > 0:
+                    levels[attr_index] -= 1
+            pick_index += num_increases
+
+            attributes.append({
+                "STR": ATTRIBUTE_LETTERS[levels[0]],
+                "AGL": ATTRIBUTE_LETTERS[levels[1]],
+                "INT": ATTRIBUTE_LETTERS[levels[2]],
+                "EMP": ATTRIBUTE_LETTERS[levels[3]]
+            })
+
+        return attributes
+
+    def _roll_experience_columns(self, structure, slots):
+        """Roll age, CUF and skills for a batch of NPCs, grouped by rank tier
+
+        Args:
+            structure: Unit structure dictionary
+            slots: List of (role, rank tier) tuples
+
+        Returns:
+            Tuple of (ages, cufs, skills) lists indexed like slots
+        """
+        count = len(slots)
+        ages = [18] * count
+        cufs = ["D"] * count
+        skills = [{} for _ in range(count)]
+
+        # Group slot indexes by tier so each tier's columns come from one draw
+        tier_indexes = {}
+        for i, (_, tier) in enumerate(slots):
+            tier_indexes.setdefault(tier, []).append(i)
+
+        for tier, indexes in tier_indexes.items():
+            profile = get_rank_tier_profile(tier)
+            tier_count = len(indexes)
+
+            low, high = profile["age_range"]
+            tier_ages = random.choices(range(low, high + 1), k=tier_count)
+
+            cuf_letters = list(profile["cuf_weights"].keys())
+            cuf_weights = list(profile["cuf_weights"].values())
+            tier_cufs = random.choices(cuf_letters, weights=cuf_weights, k=tier_count)
+
+            skill_letters = list(profile["skill_weights"].keys())
+            skill_weights = list(profile["skill_weights"].values())
+            skill_columns = {
+                skill: random.choices(skill_letters, weights=skill_weights, k=tier_count)
+                for skill in structure["skills"]
+            }
+
+            for position, i in enumerate(indexes):
+                ages[i] = tier_ages[position]
+                cufs[i] = tier_cufs[position]
+                for skill, column in skill_columns.items():
+                    # Untrained skills are left off the sheet
+                    if column[position] != "F":
+                        skills[i][skill] = column[position]
+
+        return ages, cufs, skills
+
+
+# Create a global instance for easy access
+unit_controller = UnitController()
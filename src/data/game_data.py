@@ -172,6 +172,28 @@ EXCHANGE_RATES = {
     }
 }
 
+# Gear names that trade as one of the EXCHANGE_RATES items
+GEAR_EXCHANGE_ALIASES = {
+    "personal medkit": ("Medicine", "Med-kit"),
+    "medkit": ("Medicine", "Med-kit"),
+    "med kit": ("Medicine", "Med-kit"),
+    "bandage": ("Medicine", "Bandages"),
+    "painkiller": ("Medicine", "Painkillers"),
+    "pain reliever": ("Medicine", "Painkillers"),
+    "antibiotic": ("Medicine", "Antibiotics"),
+    "ration": ("Food", "1 day ration"),
+    "ration of food": ("Food", "1 day ration"),
+    "canned food": ("Food", "Canned food"),
+    "reload": ("Ammunition", "5.56mm (10 rounds)"),
+    "gasoline": ("Fuel", "1 liter gasoline"),
+    "diesel": ("Fuel", "1 liter diesel"),
+    "alcohol": ("Fuel", "1 liter alcohol")
+}
+
+# One-word aliases that also match the start of longer names ("reloads for each weapon").
+# Other one-word aliases only match the whole name, so "rations of clean water" isn't food.
+GEAR_EXCHANGE_PREFIX_ALIASES = {"reload"}
+
 
 def get_game_info():
     """Get basic game information
@@ -198,6 +198,74 @@ NATIONALITY_RANKS = {
     ]
 }
 
+# NATO-style rank grades from lowest to highest (enlisted, then officers)
+NATO_GRADES = [
+    "OR-1", "OR-2", "OR-3", "OR-4", "OR-5", "OR-6", "OR-7", "OR-8", "OR-9",
+    "OF-1", "OF-2", "OF-3", "OF-4", "OF-5", "OF-6", "OF-7", "OF-8", "OF-9", "OF-10"
+]
+
+# NATO grade of each rank, in the same order as NATIONALITY_RANKS
+NATIONALITY_RANK_GRADES = {
+    "American": [
+        "OR-1", "OR-3", "OR-4", "OR-5", "OR-6",
+        "OR-7", "OR-8", "OR-8", "OR-9",
+        "OR-9", "OR-9", "OF-1",
+        "OF-1", "OF-2", "OF-3", "OF-4", "OF-5",
+        "OF-6", "OF-7", "OF-8", "OF-9"
+    ],
+    "Soviet": [
+        "OR-1", "OR-3", "OR-4", "OR-5", "OR-6",
+        "OR-7", "OR-8", "OR-9", "OF-1",
+        "OF-1", "OF-1", "OF-2", "OF-3", "OF-4", "OF-5",
+        "OF-7", "OF-8", "OF-9", "OF-9", "OF-10"
+    ],
+    "British": [
+        "OR-1", "OR-3", "OR-4", "OR-5", "OR-7",
+        "OR-8", "OR-9", "OF-1",
+        "OF-1", "OF-2", "OF-3", "OF-4", "OF-5", "OF-6",
+        "OF-7", "OF-8", "OF-9", "OF-10"
+    ],
+    "default": [
+        "OR-1", "OR-4", "OR-5", "OF-1", "OF-2", "OF-3", "OF-5", "OF-9"
+    ]
+}
+
+
+def _build_rank_indexes():
+    """Build the forward (rank to grade) and reverse (grade to rank) indexes
+
+    The reverse index is filled for every NATO grade: a grade a nationality has
+    no rank for maps to the rank with the nearest grade (the lower one on a tie).
+    Where several ranks share a grade, the most junior one is used.
+
+    Returns:
+        Tuple of (rank to grade index, grade to rank index), keyed by rank list name
+    """
+    grade_positions = {grade: i for i, grade in enumerate(NATO_GRADES)}
+    rank_to_grade = {}
+    grade_to_rank = {}
+
+    for key, ranks in NATIONALITY_RANKS.items():
+        grades = NATIONALITY_RANK_GRADES[key]
+        rank_to_grade[key] = dict(zip(ranks, grades))
+
+        # Most junior rank for each grade this nationality actually has
+        known = {}
+        for rank, grade in zip(ranks, grades):
+            known.setdefault(grade_positions[grade], rank)
+
+        reverse = {}
+        for grade, position in grade_positions.items():
+            nearest = min(known, key=lambda p: (abs(p - position), p))
+            reverse[grade] = known[nearest]
+        grade_to_rank[key] = reverse
+
+    return rank_to_grade, grade_to_rank
+
+
+# Precomputed rank indexes for O(1) conversions
+RANK_GRADE_INDEX, GRADE_RANK_INDEX = _build_rank_indexes()
+
 
 def get_nationality_languages(nationality):
     """Get languages for a nationality
@@ -241,6 +309,95 @@ def get_nationality_ranks(nationality):
     return NATIONALITY_RANKS.get(nationality, NATIONALITY_RANKS["default"])
 
 
+def _get_rank_list_key(nationality):
+    """Get the NATIONALITY_RANKS key a nationality uses
+
+    Args:
+        nationality: Nationality name
+
+    Returns:
+        The nationality itself if it has its own ranks, otherwise "default"
+    """
+    return nationality if nationality in NATIONALITY_RANKS else "default"
+
+
+def get_rank_grade(nationality, rank):
+    """Get the NATO-style grade of a rank
+
+    Args:
+        nationality: Nationality name
+        rank: Rank in the nationality's rank list
+
+    Returns:
+        Grade string (e.g., "OR-5", "OF-2") or None if the rank is not found
+    """
+    return RANK_GRADE_INDEX[_get_rank_list_key(nationality)].get(rank, None)
+
+
+def get_rank_for_grade(nationality, grade):
+    """Get the rank a nationality uses for a NATO-style grade
+
+    Args:
+        nationality: Nationality name
+        grade: Grade string (e.g., "OR-5", "OF-2")
+
+    Returns:
+        Rank name or None if the grade is not valid
+    """
+    return GRADE_RANK_INDEX[_get_rank_list_key(nationality)].get(grade, None)
+
+
+def convert_rank(rank, source_nationality, target_nationality):
+    """Convert a rank to its equivalent in another nationality
+
+    Args:
+        rank: Rank in the source nationality
+        source_nationality: Nationality the rank belongs to
+        target_nationality: Nationality to convert to
+
+    Returns:
+        Equivalent rank name or None if the rank is not found
+    """
+    grade = get_rank_grade(source_nationality, rank)
+    if grade is None:
+        return None
+
+    return get_rank_for_grade(target_nationality, grade)
+
+
+def convert_roster_ranks(roster, target_nationality):
+    """Convert the ranks of a mixed-nationality roster to one nationality
+
+    Args:
+        roster: List of (nationality, rank) tuples
+        target_nationality: Nationality to convert to
+
+    Returns:
+        List of equivalent ranks in the same order (None where a rank is not found)
+    """
+    target_ranks = GRADE_RANK_INDEX[_get_rank_list_key(target_nationality)]
+    results = []
+
+    for nationality, rank in roster:
+        grade = RANK_GRADE_INDEX[_get_rank_list_key(nationality)].get(rank, None)
+        results.append(target_ranks.get(grade, None) if grade else None)
+
+    return results
+
+
+def get_unit_rank(nationality, tier):
+    """Get the rank a nationality uses for a default rank tier
+
+    Args:
+        nationality: Nationality name
+        tier: Default rank tier (e.g., "Private", "Sergeant", "Lieutenant")
+
+    Returns:
+        Rank name for the nationality, or the tier itself if it is not a default rank
+    """
+    return convert_rank(tier, "default", nationality) or tier
+
+
 def get_rank_equivalence(nationality, rank):
     """Get equivalent rank in other nationalities
 
@@ -249,11 +406,14 @@ def get_rank_equivalence(nationality, rank):
         rank: Rank in the source nationality
 
     Returns:
-        Dictionary mapping nationality to equivalent rank
+        Dictionary mapping nationality to equivalent rank, or an empty dictionary
+        if the rank is not found
     """
-    # This would be a more complex implementation with actual rank equivalencies
-    # For now, just return a simple placeholder
-    return {nat: "Equivalent Rank" for nat in NATIONALITIES if nat != nationality}
+    grade = get_rank_grade(nationality, rank)
+    if grade is None:
+        return {}
+
+    return {nat: get_rank_for_grade(nat, grade) for nat in NATIONALITIES if nat != nationality}
 
 
 def is_valid_nationality(nationality):
@@ -102,6 +102,36 @@ SKILL_LEVELS = {
     "F": {"die": "None", "description": "Untrained"}
 }
 
+# Die size for each attribute and skill level (untrained skills roll no die).
+# The dice controller, session controller and character sheet all use this table.
+CHECK_DIE_SIZES = {"A": 12, "B": 10, "C": 8, "D": 6, "F": 0}
+
+# A check succeeds if either die shows this value or higher
+CHECK_SUCCESS_THRESHOLD = 6
+
+
+def _build_check_odds():
+    """Build the chance of success for every attribute and skill level pair
+
+    Returns:
+        Dictionary mapping (attribute level, skill level) to a chance from 0 to 1
+    """
+    def miss_chance(size):
+        # Chance a die shows less than the threshold (certain if there is no die)
+        if not size:
+            return 1.0
+        return min(1.0, (CHECK_SUCCESS_THRESHOLD - 1) / size)
+
+    return {
+        (attribute_level, skill_level): 1.0 - miss_chance(attribute_size) * miss_chance(skill_size)
+        for attribute_level, attribute_size in CHECK_DIE_SIZES.items() if attribute_size
+        for skill_level, skill_size in CHECK_DIE_SIZES.items()
+    }
+
+
+# Precomputed chance of success for each (attribute level, skill level)
+SKILL_CHECK_ODDS = _build_check_odds()
+
 # Specialties descriptions
 SPECIALTIES = {
     # Close Combat Specialties
@@ -375,6 +405,19 @@ def calculate_skill_check_dice(character, skill_name):
     return (attribute_die, skill_die, attribute_name)
 
 
+def get_skill_check_odds(attribute_level, skill_level="F"):
+    """Get the chance of succeeding at a skill check
+
+    Args:
+        attribute_level: Attribute level (A, B, C, or D)
+        skill_level: Skill level (A, B, C, D, or F for untrained)
+
+    Returns:
+        Chance of success from 0 to 1
+    """
+    return SKILL_CHECK_ODDS.get((attribute_level, skill_level), 0.0)
+
+
 def get_related_skills(skill_name):
     """Get skills that are related to a specific skill
 
@@ -0,0 +1,134 @@
+"""
+units.py - Unit structure data for NPC formation generation
+"""
+
+# Unit structures - each element gives a role, its rank tier and how many NPCs fill it.
+# An element with a count of None takes up whatever is left of the unit size.
+UNIT_STRUCTURES = {
+    "Infantry Squad": {
+        "description": "A standard infantry squad of two fire teams.",
+        "military": True,
+        "size": 10,
+        "skills": ["Ranged Combat", "Close Combat", "Stamina", "Recon"],
+        "elements": [
+            {"role": "Squad Leader", "rank": "Sergeant", "count": 1},
+            {"role": "Team Leader", "rank": "Corporal", "count": 2},
+            {"role": "Rifleman", "rank": "Private", "count": None}
+        ]
+    },
+    "Motor Rifle Platoon": {
+        "description": "Three mechanized infantry squads with a platoon headquarters.",
+        "military": True,
+        "size": 30,
+        "skills": ["Ranged Combat", "Heavy Weapons", "Stamina", "Mobility", "Recon"],
+        "elements": [
+            {"role": "Platoon Leader", "rank": "Lieutenant", "count": 1},
+            {"role": "Platoon Sergeant", "rank": "Sergeant", "count": 1},
+            {"role": "Squad Leader", "rank": "Sergeant", "count": 3},
+            {"role": "Gunner", "rank": "Corporal", "count": 3},
+            {"role": "Rifleman", "rank": "Private", "count": None}
+        ]
+    },
+    "Infantry Company": {
+        "description": "Three infantry platoons with a company headquarters.",
+        "military": True,
+        "size": 100,
+        "skills": ["Ranged Combat", "Heavy Weapons", "Stamina", "Recon"],
+        "elements": [
+            {"role": "Company Commander", "rank": "Captain", "count": 1},
+            {"role": "Platoon Leader", "rank": "Lieutenant", "count": 3},
+            {"role": "Platoon Sergeant", "rank": "Sergeant", "count": 3},
+            {"role": "Squad Leader", "rank": "Sergeant", "count": 9},
+            {"role": "Team Leader", "rank": "Corporal", "count": 18},
+            {"role": "Rifleman", "rank": "Private", "count": None}
+        ]
+    },
+    "Militia Band": {
+        "description": "Armed locals defending their home ground under elected leaders.",
+        "military": False,
+        "size": 50,
+        "skills": ["Ranged Combat", "Close Combat", "Survival", "Recon"],
+        "elements": [
+            {"role": "Leader", "rank": "Lieutenant", "count": 1},
+            {"role": "Section Leader", "rank": "Sergeant", "count": 4},
+            {"role": "Militiaman", "rank": "Private", "count": None}
+        ]
+    }
+}
+
+# Experience profile for each rank tier - weights for CUF, skill levels and the age range
+RANK_TIER_PROFILES = {
+    "Private": {
+        "cuf_weights": {"D": 6, "C": 3, "B": 1, "A": 0},
+        "skill_weights": {"F": 3, "D": 5, "C": 2, "B": 0, "A": 0},
+        "age_range": (18, 26)
+    },
+    "Corporal": {
+        "cuf_weights": {"D": 3, "C": 5, "B": 2, "A": 0},
+        "skill_weights": {"F": 1, "D": 4, "C": 4, "B": 1, "A": 0},
+        "age_range": (20, 30)
+    },
+    "Sergeant": {
+        "cuf_weights": {"D": 1, "C": 4, "B": 4, "A": 1},
+        "skill_weights": {"F": 0, "D": 2, "C": 5, "B": 3, "A": 0},
+        "age_range": (24, 38)
+    },
+    "Lieutenant": {
+        "cuf_weights": {"D": 2, "C": 5, "B": 3, "A": 0},
+        "skill_weights": {"F": 1, "D": 3, "C": 4, "B": 2, "A": 0},
+        "age_range": (22, 30)
+    },
+    "Captain": {
+        "cuf_weights": {"D": 1, "C": 3, "B": 5, "A": 1},
+        "skill_weights": {"F": 0, "D": 2, "C": 4, "B": 3, "A": 1},
+        "age_range": (26, 36)
+    },
+    "Major": {
+        "cuf_weights": {"D": 0, "C": 3, "B": 5, "A": 2},
+        "skill_weights": {"F": 0, "D": 2, "C": 4, "B": 3, "A": 1},
+        "age_range": (32, 44)
+    },
+    "Colonel": {
+        "cuf_weights": {"D": 0, "C": 2, "B": 5, "A": 3},
+        "skill_weights": {"F": 0, "D": 1, "C": 4, "B": 4, "A": 1},
+        "age_range": (38, 52)
+    },
+    "General": {
+        "cuf_weights": {"D": 0, "C": 2, "B": 4, "A": 4},
+        "skill_weights": {"F": 1, "D": 2, "C": 4, "B": 2, "A": 1},
+        "age_range": (45, 60)
+    }
+}
+
+
+def get_unit_types():
+    """Get a list of all unit types
+
+    Returns:
+        List of unit type names
+    """
+    return list(UNIT_STRUCTURES.keys())
+
+
+def get_unit_structure(unit_type):
+    """Get the structure of a unit type
+
+    Args:
+        unit_type: Unit type name
+
+    Returns:
+        Unit structure dictionary or None if not found
+    """
+    return UNIT_STRUCTURES.get(unit_type, None)
+
+
+def get_rank_tier_profile(tier):
+    """Get the experience profile for a rank tier
+
+    Args:
+        tier: Rank tier name (e.g., "Private", "Sergeant")
+
+    Returns:
+        Profile dictionary, falling back to the Private profile if not found
+    """
+    return RANK_TIER_PROFILES.get(tier, RANK_TIER_PROFILES["Private"])
@@ -8,13 +8,33 @@ import shutil
 import subprocess
 from pathlib import Path
 
+# Make the src package importable when run as a script
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+# Setup paths are relative to the project root, like the startup cache fingerprint
+os.chdir(ROOT_DIR)
+
+from src.utils.startup_cache import StartupCache, PhaseTimer
+
 
 def apply_all_fixes():
     """Apply all necessary fixes before launching the application"""
     print("=== Twilight 2000 Character Creator Launcher ===")
+
+    # Nothing to fix if no source, asset or package changed since the last run
+    startup_cache = StartupCache("launch")
+    if startup_cache.is_fresh():
+        print("Nothing has changed since the last setup. Skipping fixes.")
+        return True
+
     print("Applying fixes and setting up the environment...")
+    timer = PhaseTimer()
+    setup_ok = True  # Only remembered as done if every step succeeded
 
     # Step 1: Check if Python and dependencies are available
+    timer.begin("Dependencies")
     print("\nChecking Python and dependencies...")
     try:
         # Check Python version
@@ -49,8 +69,10 @@ def apply_all_fixes():
 
     except Exception as e:
         print(f"❌ Error checking dependencies: {e}")
+        setup_ok = False
 
     # Step 2: Ensure all required directories exist
+    timer.begin("Directories")
     print("\nEnsuring required directories exist...")
     try:
         directories = [
@@ -66,8 +88,10 @@ def apply_all_fixes():
             print(f"✓ Created directory: {directory}")
     except Exception as e:
         print(f"❌ Error creating directories: {e}")
+        setup_ok = False
 
     # Step 3: Create placeholder font file
+    timer.begin("Font file")
     print("\nChecking font file...")
     try:
         font_path = Path("assets/fonts/military_font.ttf")
@@ -77,7 +101,8 @@ def apply_all_fixes():
 
             # Check if fonts_setup.py exists and run it
             if Path("fonts_setup.py").exists():
-                subprocess.run([sys.executable, "fonts_setup.py"])
+                if subprocess.run([sys.executable, "fonts_setup.py"]).returncode != 0:
+                    setup_ok = False
             else:
                 # Simple font creation
                 print("Creating minimal font placeholder...")
@@ -88,8 +113,10 @@ def apply_all_fixes():
             print("✓ Font file exists")
     except Exception as e:
         print(f"❌ Error handling font file: {e}")
+        setup_ok = False
 
     # Step 4: Create placeholder images
+    timer.begin("Image files")
     print("\nChecking image files...")
     try:
         background_files = [
@@ -117,7 +144,8 @@ def apply_all_fixes():
 
             # Check if image_setup.py exists and run it
             if Path("image_setup.py").exists():
-                subprocess.run([sys.executable, "image_setup.py"])
+                if subprocess.run([sys.executable, "image_setup.py"]).returncode != 0:
+                    setup_ok = False
             else:
                 # Simple image creation
                 print("Creating minimal image placeholders...")
@@ -133,8 +161,10 @@ def apply_all_fixes():
             print("✓ All image files exist")
     except Exception as e:
         print(f"❌ Error handling image files: {e}")
+        setup_ok = False
 
     # Step 5: Create placeholder sound files
+    timer.begin("Sound files")
     print("\nChecking sound files...")
     try:
         sound_files = [
@@ -166,8 +196,10 @@ def apply_all_fixes():
             print("✓ All sound files exist")
     except Exception as e:
         print(f"❌ Error handling sound files: {e}")
+        setup_ok = False
 
     # Step 6: Fix CareerController issues
+    timer.begin("CareerController")
     print("\nChecking CareerController...")
     try:
         career_controller_path = Path("src/controllers/career_controller.py")
@@ -249,10 +281,13 @@ def apply_all_fixes():
                 print("✓ CareerController has careerCompleted signal")
         else:
             print("❌ CareerController file not found")
+            setup_ok = False
     except Exception as e:
         print(f"❌ Error fixing CareerController: {e}")
+        setup_ok = False
 
     # Step 7: Fix theme_manager.py to handle missing fonts
+    timer.begin("ThemeManager")
     print("\nChecking ThemeManager...")
     try:
         theme_manager_path = Path("src/ui/theme_manager.py")
@@ -284,10 +319,13 @@ def apply_all_fixes():
                     print("⚠️ No fixed ThemeManager found. Using original")
         else:
             print("❌ ThemeManager file not found")
+            setup_ok = False
     except Exception as e:
         print(f"❌ Error fixing ThemeManager: {e}")
+        setup_ok = False
 
     # Step 8: Fix audio_manager.py to handle missing audio files
+    timer.begin("AudioManager")
     print("\nChecking AudioManager...")
     try:
         audio_manager_path = Path("src/utils/audio_manager.py")
@@ -319,10 +357,13 @@ def apply_all_fixes():
                 print("✓ AudioManager appears to have proper error handling")
         else:
             print("❌ AudioManager file not found")
+            setup_ok = False
     except Exception as e:
         print(f"❌ Error fixing AudioManager: {e}")
+        setup_ok = False
 
     # Step 9: Fix skill.py if it's empty
+    timer.begin("skill.py")
     print("\nChecking skill.py...")
     try:
         skill_path = Path("src/models/skill.py")
@@ -343,8 +384,16 @@ def apply_all_fixes():
                 print("✓ skill.py exists and has content")
         else:
             print("❌ skill.py file not found")
+            setup_ok = False
     except Exception as e:
         print(f"❌ Error fixing skill.py: {e}")
+        setup_ok = False
+
+    timer.print_report()
+    if setup_ok:
+        startup_cache.save()
+    else:
+        print("\n⚠️ Some steps failed. They will be retried on the next launch.")
 
     print("\nAll fixes applied. Ready to launch application!")
     return True
@@ -7,6 +7,20 @@ import os
 import shutil
 from pathlib import Path
 
+# Make the src package importable when run as a script
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+# Setup paths are relative to the project root, like the startup cache fingerprint
+os.chdir(ROOT_DIR)
+
+from src.utils.import_profiler import profile_imports_from_env
+from src.utils.startup_cache import StartupCache, PhaseTimer
+
+# Time the application's imports when T2K_PROFILE_IMPORTS is set
+import_profiler = profile_imports_from_env()
+
 # First, make sure we have the assets directory structure
 def ensure_assets_directories():
     """Create the necessary assets directories if they don't exist"""
@@ -150,12 +164,29 @@ def fix_theme_manager():
             shutil.copy(fixed_path, theme_manager_path)
             print("Replaced theme_manager.py with fixed version")
 
-# Make sure we have all required directories and files
-ensure_assets_directories()
-ensure_font_file()
-ensure_sound_files()
-fix_career_controller()
-fix_theme_manager()
+# Make sure we have all required directories and files, unless nothing changed since the last run
+startup_cache = StartupCache("main")
+if startup_cache.is_fresh():
+    print("Nothing has changed since the last startup. Skipping setup.")
+else:
+    timer = PhaseTimer()
+    setup_ok = True  # Only remembered as done if every step succeeded
+    for phase_name, setup_step in [("Asset directories", ensure_assets_directories),
+                                   ("Font file", ensure_font_file),
+                                   ("Sound files", ensure_sound_files),
+                                   ("CareerController", fix_career_controller),
+                                   ("ThemeManager", fix_theme_manager)]:
+        timer.begin(phase_name)
+        try:
+            setup_step()
+        except Exception as e:
+            print(f"Error in setup step {phase_name}: {e}")
+            setup_ok = False
+    timer.print_report()
+    if setup_ok:
+        startup_cache.save()
+    else:
+        print("Some setup steps failed. They will be retried on the next startup.")
 
 # Now import and run the application
 print("Starting application...")
@@ -163,12 +194,16 @@ print("Starting application...")
 try:
     from src.ui.main_window import MainWindow
     from src.utils.resource_loader import setup_resources
-    from PyQt6.QtWidgets import QApplication
+    from src.utils.instrumentation import create_application
+
+    if import_profiler is not None:
+        import_profiler.uninstall()
+        import_profiler.print_report()
 
     def main():
         """Main application entry point"""
-        # Create the application
-        app = QApplication(sys.argv)
+        # Create the application (with timing instrumentation in debug mode)
+        app = create_application(sys.argv)
 
         # Setup resources
         setup_resources()
@@ -0,0 +1,138 @@
+"""
+combatant.py - Combatant model for session play
+"""
+
+
+class Combatant:
+    """Model for a character or NPC taking part in a play session"""
+
+    def __init__(self, combatant_id, name="", attributes=None, skills=None, cuf="D",
+                 hit_capacity=4, stress_capacity=4, radiation=0, is_npc=False):
+        """Initialize a new combatant
+
+        Args:
+            combatant_id: Unique identifier within the session
+            name: Display name
+            attributes: Dictionary of attribute letters
+            skills: Dictionary mapping skill names to levels
+            cuf: Coolness Under Fire level (A, B, C or D)
+            hit_capacity: Damage the combatant can take before being broken
+            stress_capacity: Stress the combatant can take before being broken
+            radiation: Radiation points
+            is_npc: Whether the combatant is an NPC
+        """
+        self.combatant_id = combatant_id
+        self.name = name
+        self.attributes = dict(attributes or {"STR": "C", "AGL": "C", "INT": "C", "EMP": "C"})
+        self.skills = dict(skills or {})
+        self.cuf = cuf
+        self.hit_capacity = hit_capacity
+        self.stress_capacity = stress_capacity
+        self.radiation = radiation
+        self.is_npc = is_npc
+
+        # Current damage and stress taken during the session
+        self.damage = 0
+        self.stress = 0
+
+    def is_incapacitated(self):
+        """Check if the combatant is broken by damage
+
+        Returns:
+            True if damage has reached hit capacity, False otherwise
+        """
+        return self.damage >= self.hit_capacity
+
+    def is_shaken(self):
+        """Check if the combatant is broken by stress
+
+        Returns:
+            True if stress has reached stress capacity, False otherwise
+        """
+        return self.stress >= self.stress_capacity
+
+    def can_act(self):
+        """Check if the combatant can still take actions
+
+        Returns:
+            True if neither broken by damage nor by stress, False otherwise
+        """
+        return not self.is_incapacitated() and not self.is_shaken()
+
+    def to_dict(self):
+        """Convert combatant to dictionary for saving
+
+        Returns:
+            Dictionary representation of the combatant
+        """
+        return {
+            "combatant_id": self.combatant_id,
+            "name": self.name,
+            "attributes": self.attributes.copy(),
+            "skills": self.skills.copy(),
+            "cuf": self.cuf,
+            "hit_capacity": self.hit_capacity,
+            "stress_capacity": self.stress_capacity,
+            "radiation": self.radiation,
+            "is_npc": self.is_npc,
+            "damage": self.damage,
+            "stress": self.stress
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create combatant from dictionary
+
+        Args:
+            data: Dictionary with combatant data
+
+        Returns:
+            Combatant object
+        """
+        combatant = cls(
+            combatant_id=data.get("combatant_id"),
+            name=data.get("name", ""),
+            attributes=data.get("attributes"),
+            skills=data.get("skills"),
+            cuf=data.get("cuf", "D"),
+            hit_capacity=data.get("hit_capacity", 4),
+            stress_capacity=data.get("stress_capacity", 4),
+            radiation=data.get("radiation", 0),
+            is_npc=data.get("is_npc", False)
+        )
+        combatant.damage = data.get("damage", 0)
+        combatant.stress = data.get("stress", 0)
+        return combatant
+
+    @classmethod
+    def from_character(cls, combatant_id, character, is_npc=False):
+        """Create combatant from a character
+
+        Args:
+            combatant_id: Unique identifier within the session
+            character: Character object
+            is_npc: Whether the character is an NPC
+
+        Returns:
+            Combatant object
+        """
+        return cls(
+            combatant_id=combatant_id,
+            name=character.name,
+            attributes=character.attributes,
+            skills=character.skills,
+            cuf=character.cuf,
+            hit_capacity=character.hit_capacity,
+            stress_capacity=character.stress_capacity,
+            radiation=character.radiation,
+            is_npc=is_npc
+        )
+
+    def __str__(self):
+        """String representation of the combatant
+
+        Returns:
+            String in format "Rifleman 3 (damage 1/4, stress 0/4)"
+        """
+        return (f"{self.name} (damage {self.damage}/{self.hit_capacity}, "
+                f"stress {self.stress}/{self.stress_capacity})")
@@ -5,9 +5,9 @@ character_creation.py - Character creation screens
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QLineEdit,
     QComboBox, QFormLayout, QGroupBox, QRadioButton, QSpacerItem, QSizePolicy,
-    QScrollArea, QFrame
+    QScrollArea, QFrame, QGridLayout
 )
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, QTimer
 from PyQt6.QtGui import QFont
 
 import src.config as config
@@ -15,7 +15,14 @@ from src.ui.theme_manager import theme_manager
 from src.utils.audio_manager import audio_manager
 from src.controllers.game_controller import game_controller
 from src.controllers.dice_controller import DiceController
+from src.utils.instrumentation import timed_slot
 from src.data.nationalities import get_all_nationalities
+from src.data.attributes import calculate_hit_capacity, calculate_stress_capacity
+from src.data.skills import get_all_skills, get_skill_check_odds
+from src.ui.character_sheet_model import CharacterSheetViewModel
+
+# Milliseconds to wait after an attribute change before updating the odds
+ODDS_UPDATE_DELAY = 60
 
 
 class BasicInfoScreen(QWidget):
@@ -90,6 +97,7 @@ class BasicInfoScreen(QWidget):
         self.str_combo.addItems(["A", "B", "C", "D"])
         self.str_combo.setCurrentText("C")
         self.str_combo.currentIndexChanged.connect(self._update_attribute_pool)
+        self.str_combo.currentIndexChanged.connect(lambda index: self._on_attribute_changed("STR"))
         attr_grid.addRow(QLabel("Strength (STR):", self), self.str_combo)
 
         # Agility
@@ -97,6 +105,7 @@ class BasicInfoScreen(QWidget):
         self.agl_combo.addItems(["A", "B", "C", "D"])
         self.agl_combo.setCurrentText("C")
         self.agl_combo.currentIndexChanged.connect(self._update_attribute_pool)
+        self.agl_combo.currentIndexChanged.connect(lambda index: self._on_attribute_changed("AGL"))
         attr_grid.addRow(QLabel("Agility (AGL):", self), self.agl_combo)
 
         # Intelligence
@@ -104,6 +113,7 @@ class BasicInfoScreen(QWidget):
         self.int_combo.addItems(["A", "B", "C", "D"])
         self.int_combo.setCurrentText("C")
         self.int_combo.currentIndexChanged.connect(self._update_attribute_pool)
+        self.int_combo.currentIndexChanged.connect(lambda index: self._on_attribute_changed("INT"))
         attr_grid.addRow(QLabel("Intelligence (INT):", self), self.int_combo)
 
         # Empathy
@@ -111,8 +121,13 @@ class BasicInfoScreen(QWidget):
         self.emp_combo.addItems(["A", "B", "C", "D"])
         self.emp_combo.setCurrentText("C")
         self.emp_combo.currentIndexChanged.connect(self._update_attribute_pool)
+        self.emp_combo.currentIndexChanged.connect(lambda index: self._on_attribute_changed("EMP"))
         attr_grid.addRow(QLabel("Empathy (EMP):", self), self.emp_combo)
 
+        # Combos by attribute
+        self.attribute_combos = {"STR": self.str_combo, "AGL": self.agl_combo,
+                                 "INT": self.int_combo, "EMP": self.emp_combo}
+
         # Add attribute grid to attribute layout
         attribute_layout.addWidget(attr_widget)
 
@@ -124,6 +139,32 @@ class BasicInfoScreen(QWidget):
         # Add attribute group to main layout
         main_layout.addWidget(attribute_group)
 
+        # Odds section
+        odds_group = QGroupBox("Capacities and Skill Odds", self)
+        odds_group.setFont(theme_manager.get_military_font(14, bold=True))
+        odds_layout = QGridLayout(odds_group)
+
+        self.hit_capacity_label = QLabel(self)
+        odds_layout.addWidget(self.hit_capacity_label, 0, 0)
+        self.stress_capacity_label = QLabel(self)
+        odds_layout.addWidget(self.stress_capacity_label, 0, 1)
+
+        # One label per skill, grouped by the attribute it uses
+        self.skill_odds_labels = {}
+        for i, (skill, skill_info) in enumerate(get_all_skills().items()):
+            label = QLabel(self)
+            odds_layout.addWidget(label, 1 + i // 2, i % 2)
+            self.skill_odds_labels.setdefault(skill_info["attribute"], []).append((skill, label))
+
+        main_layout.addWidget(odds_group)
+
+        # Odds are refreshed once the combos settle, only for the attributes that changed
+        self.changed_attributes = set(self.attribute_combos)
+        self.odds_timer = QTimer(self)
+        self.odds_timer.setSingleShot(True)
+        self.odds_timer.setInterval(ODDS_UPDATE_DELAY)
+        self.odds_timer.timeout.connect(self._update_odds)
+
         # Points remaining
         self.points_label = QLabel("Points Remaining: 0", self)
         self.points_label.setFont(theme_manager.get_military_font(14, bold=True))
@@ -160,6 +201,7 @@ class BasicInfoScreen(QWidget):
 
         # Initialize attributes
         self._update_attribute_pool()
+        self._update_odds()
 
     def _update_attribute_pool(self):
         """Update the attribute pool based on selected attributes"""
@@ -180,6 +222,39 @@ class BasicInfoScreen(QWidget):
         # Enable/disable next button based on points
         self.next_button.setEnabled(points_used <= 0)
 
+    def _on_attribute_changed(self, attribute):
+        """Queue an odds update for a changed attribute
+
+        Args:
+            attribute: Attribute abbreviation (STR, AGL, INT or EMP)
+        """
+        self.changed_attributes.add(attribute)
+        self.odds_timer.start()
+
+    def _update_odds(self):
+        """Update the capacities and skill odds that depend on the changed attributes"""
+        changed = self.changed_attributes
+        self.changed_attributes = set()
+        levels = {attribute: combo.currentText() for attribute, combo in self.attribute_combos.items()}
+
+        if changed & {"STR", "AGL"}:
+            self._set_label_text(self.hit_capacity_label,
+                                 f"Hit Capacity: {calculate_hit_capacity(levels['STR'], levels['AGL'])}")
+        if changed & {"INT", "EMP"}:
+            self._set_label_text(self.stress_capacity_label,
+                                 f"Stress Capacity: {calculate_stress_capacity(levels['INT'], levels['EMP'])}")
+
+        for attribute in changed:
+            for skill, label in self.skill_odds_labels.get(attribute, []):
+                skill_level = game_controller.character.skills.get(skill, "F")
+                odds = get_skill_check_odds(levels[attribute], skill_level)
+                self._set_label_text(label, f"{skill} ({attribute} {levels[attribute]}, {skill_level}): {odds:.0%}")
+
+    def _set_label_text(self, label, text):
+        """Set a label's text only if it changed"""
+        if label.text() != text:
+            label.setText(text)
+
     def _roll_attributes(self):
         """Roll random attributes"""
         # Play sound
@@ -196,7 +271,7 @@ class BasicInfoScreen(QWidget):
 
         # Apply random increases
         attributes = ["STR", "AGL", "INT", "EMP"]
-        combos = {"STR": self.str_combo, "AGL": self.agl_combo, "INT": self.int_combo, "EMP": self.emp_combo}
+        combos = self.attribute_combos
 
         import random
         for _ in range(num_increases):
@@ -221,8 +296,7 @@ class BasicInfoScreen(QWidget):
 
         # Go back to intro screen
         if self.parent:
-            intro_screen = self.parent.stacked_widget.widget(0)  # Assuming intro screen is the first widget
-            self.parent.stacked_widget.setCurrentWidget(intro_screen)
+            self.parent.stacked_widget.setCurrentWidget(self.parent.intro_screen)
 
     def _on_next_clicked(self):
         """Handle next button click"""
@@ -283,11 +357,8 @@ class BasicInfoScreen(QWidget):
 
         def _proceed_to_childhood(self):
             """Proceed to childhood selection screen"""
-            # Create childhood screen
-            childhood_screen = ChildhoodScreen(self.parent)
-
             # Navigate to childhood screen
-            self.parent.navigate_to_screen(childhood_screen)
+            self.parent.show_screen("childhood")
 
     class ChildhoodScreen(QWidget):
         """Screen for selecting childhood background"""
@@ -546,8 +617,7 @@ class BasicInfoScreen(QWidget):
             audio_manager.play_sound("button_click")
 
             # Go back to basic info screen
-            basic_info_screen = BasicInfoScreen(self.parent)
-            self.parent.navigate_to_screen(basic_info_screen)
+            self.parent.show_screen("basic_info")
 
         def _on_next_clicked(self):
             """Handle next button click"""
@@ -607,11 +677,8 @@ class BasicInfoScreen(QWidget):
 
         def _proceed_to_career(self):
             """Proceed to career selection screen"""
-            # Create career screen
-            career_screen = CareerSelectionScreen(self.parent)
-
             # Navigate to career screen
-            self.parent.navigate_to_screen(career_screen)
+            self.parent.show_screen("career")
 
     class CareerSelectionScreen(QWidget):
         """Screen for selecting a career path"""
@@ -621,6 +688,7 @@ class BasicInfoScreen(QWidget):
             self.parent = parent
             self.dice_controller = DiceController()
             self._setup_ui()
+            self.update_display()
 
         def _setup_ui(self):
             """Set up the user interface"""
@@ -635,15 +703,10 @@ class BasicInfoScreen(QWidget):
             title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             main_layout.addWidget(title_label)
 
-            # Description
-            desc_label = QLabel(
-                f"Your character is now {game_controller.character.age} years old. "
-                "It's time to choose a career path. Each career lasts 6 years and provides "
-                "skills, specialties, and possibly equipment.",
-                self
-            )
-            desc_label.setWordWrap(True)
-            main_layout.addWidget(desc_label)
+            # Description (filled in by update_display)
+            self.desc_label = QLabel(self)
+            self.desc_label.setWordWrap(True)
+            main_layout.addWidget(self.desc_label)
 
             # Career type tabs
             from PyQt6.QtWidgets import QTabWidget
@@ -769,6 +832,14 @@ class BasicInfoScreen(QWidget):
             # Add buttons to main layout
             main_layout.addLayout(button_layout)
 
+        def update_display(self):
+            """Refresh the text that depends on the current character"""
+            self.desc_label.setText(
+                f"Your character is now {game_controller.character.age} years old. "
+                "It's time to choose a career path. Each career lasts 6 years and provides "
+                "skills, specialties, and possibly equipment."
+            )
+
         def _roll_random_career(self):
             """Roll a random career"""
             # Play sound
@@ -795,8 +866,7 @@ class BasicInfoScreen(QWidget):
             audio_manager.play_sound("button_click")
 
             # Go back to childhood screen
-            childhood_screen = ChildhoodScreen(self.parent)
-            self.parent.navigate_to_screen(childhood_screen)
+            self.parent.show_screen("childhood")
 
         def _on_next_clicked(self):
             """Handle next button click"""
@@ -879,13 +949,10 @@ class BasicInfoScreen(QWidget):
 
         def _proceed_to_career_events(self):
             """Proceed to career events screen"""
-            # In a real implementation, you'd create a career events screen here
-
-            # For now, just create a placeholder war screen
-            war_screen = WarScreen(self.parent)
+            # In a real implementation, you'd show a career events screen here
 
             # Navigate to war screen
-            self.parent.navigate_to_screen(war_screen)
+            self.parent.show_screen("war")
 
     class WarScreen(QWidget):
         """Screen for war experience"""
@@ -895,6 +962,7 @@ class BasicInfoScreen(QWidget):
             self.parent = parent
             self.dice_controller = DiceController()
             self._setup_ui()
+            self.update_display()
 
         def _setup_ui(self):
             """Set up the user interface"""
@@ -909,15 +977,10 @@ class BasicInfoScreen(QWidget):
             title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             main_layout.addWidget(title_label)
 
-            # Description
-            desc_label = QLabel(
-                f"The year is 2000. Your character is now {game_controller.character.age} years old. "
-                "War has broken out across the globe. Nuclear exchanges have devastated major cities. "
-                "Civilization is in ruins. What role did your character play during the war?",
-                self
-            )
-            desc_label.setWordWrap(True)
-            main_layout.addWidget(desc_label)
+            # Description (filled in by update_display)
+            self.desc_label = QLabel(self)
+            self.desc_label.setWordWrap(True)
+            main_layout.addWidget(self.desc_label)
 
             # War role group
             role_group = QGroupBox("Your Role in the War", self)
@@ -1022,6 +1085,14 @@ class BasicInfoScreen(QWidget):
             # Add buttons to main layout
             main_layout.addLayout(button_layout)
 
+        def update_display(self):
+            """Refresh the text that depends on the current character"""
+            self.desc_label.setText(
+                f"The year is 2000. Your character is now {game_controller.character.age} years old. "
+                "War has broken out across the globe. Nuclear exchanges have devastated major cities. "
+                "Civilization is in ruins. What role did your character play during the war?"
+            )
+
         def _roll_radiation(self):
             """Roll for radiation exposure"""
             # Play sound
@@ -1043,8 +1114,7 @@ class BasicInfoScreen(QWidget):
             audio_manager.play_sound("button_click")
 
             # Go back to career selection screen
-            career_screen = CareerSelectionScreen(self.parent)
-            self.parent.navigate_to_screen(career_screen)
+            self.parent.show_screen("career")
 
         def _on_next_clicked(self):
             """Handle next button click"""
@@ -1122,11 +1192,8 @@ class BasicInfoScreen(QWidget):
 
         def _proceed_to_character_details(self):
             """Proceed to character details screen"""
-            # Create character details screen
-            details_screen = CharacterDetailsScreen(self.parent)
-
             # Navigate to details screen
-            self.parent.navigate_to_screen(details_screen)
+            self.parent.show_screen("details")
 
         class CharacterDetailsScreen(QWidget):
             """Screen for final character details"""
@@ -1253,6 +1320,10 @@ class BasicInfoScreen(QWidget):
                 # Add buttons to main layout
                 main_layout.addLayout(button_layout)
 
+            def update_display(self):
+                """Refresh the gear list for the current character"""
+                self.gear_text.setText(self._generate_gear_text())
+
             def _generate_gear_text(self):
                 """Generate text listing the character's starting gear
 
@@ -1322,8 +1393,7 @@ class BasicInfoScreen(QWidget):
                 audio_manager.play_sound("button_click")
 
                 # Go back to war screen
-                war_screen = WarScreen(self.parent)
-                self.parent.navigate_to_screen(war_screen)
+                self.parent.show_screen("war")
 
             def _on_complete_clicked(self):
                 """Handle complete button click"""
@@ -1377,32 +1447,43 @@ class BasicInfoScreen(QWidget):
 
             def _proceed_to_character_sheet(self):
                 """Proceed to character sheet screen"""
-                # Create character sheet screen
-                sheet_screen = CharacterSheetScreen(self.parent)
-
                 # Navigate to sheet screen
-                self.parent.navigate_to_screen(sheet_screen)
+                self.parent.show_screen("sheet")
 
         class CharacterSheetScreen(QWidget):
-            """Screen for displaying the final character sheet"""
+            """Screen for displaying the final character sheet
+
+            Widgets are built once and then updated in place from the sheet
+            view-model, which only reports the fields that changed.
+            """
 
             def __init__(self, parent=None):
                 super().__init__(parent)
                 self.parent = parent
+                self.view_model = CharacterSheetViewModel()
+                self.view_model.subscribe(self._apply_changes)
                 self._setup_ui()
 
+                # Refresh whenever the character changes
+                game_controller.characterChanged.connect(self.update_display)
+                self.update_display()
+
             def _setup_ui(self):
                 """Set up the user interface"""
+                # Labels for single-value fields, keyed by view-model field
+                self.field_labels = {}
+
                 # Main layout
                 main_layout = QVBoxLayout(self)
                 main_layout.setContentsMargins(50, 50, 50, 50)
                 main_layout.setSpacing(20)
 
                 # Title
-                title_label = QLabel(f"Character Sheet: {game_controller.character.name}", self)
+                title_label = QLabel(self)
                 title_label.setFont(theme_manager.get_military_font(24, bold=True))
                 title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
                 main_layout.addWidget(title_label)
+                self.field_labels["title"] = title_label
 
                 # Scroll area for the sheet
                 scroll_widget = QWidget()
@@ -1412,18 +1493,11 @@ class BasicInfoScreen(QWidget):
                 basic_group = QGroupBox("Basic Information", self)
                 basic_layout = QFormLayout(basic_group)
 
-                name_label = QLabel(f"Name: {game_controller.character.name}", self)
-                basic_layout.addRow(name_label)
-
-                nationality_label = QLabel(f"Nationality: {game_controller.character.nationality}", self)
-                basic_layout.addRow(nationality_label)
-
-                age_label = QLabel(f"Age: {game_controller.character.age}", self)
-                basic_layout.addRow(age_label)
-
-                appearance_label = QLabel(f"Appearance: {game_controller.character.appearance}", self)
-                appearance_label.setWordWrap(True)
-                basic_layout.addRow(appearance_label)
+                for key in ("name", "nationality", "age", "appearance"):
+                    label = QLabel(self)
+                    label.setWordWrap(key == "appearance")
+                    basic_layout.addRow(label)
+                    self.field_labels[key] = label
 
                 scroll_layout.addWidget(basic_group)
 
@@ -1431,34 +1505,11 @@ class BasicInfoScreen(QWidget):
                 attr_group = QGroupBox("Attributes", self)
                 attr_layout = QFormLayout(attr_group)
 
-                str_label = QLabel(
-                    f"Strength (STR): {game_controller.character.get_attribute_letter('STR')} ({game_controller.character.get_attribute_die('STR')})",
-                    self)
-                attr_layout.addRow(str_label)
-
-                agl_label = QLabel(
-                    f"Agility (AGL): {game_controller.character.get_attribute_letter('AGL')} ({game_controller.character.get_attribute_die('AGL')})",
-                    self)
-                attr_layout.addRow(agl_label)
-
-                int_label = QLabel(
-                    f"Intelligence (INT): {game_controller.character.get_attribute_letter('INT')} ({game_controller.character.get_attribute_die('INT')})",
-                    self)
-                attr_layout.addRow(int_label)
-
-                emp_label = QLabel(
-                    f"Empathy (EMP): {game_controller.character.get_attribute_letter('EMP')} ({game_controller.character.get_attribute_die('EMP')})",
-                    self)
-                attr_layout.addRow(emp_label)
-
-                hit_label = QLabel(f"Hit Capacity: {game_controller.character.hit_capacity}", self)
-                attr_layout.addRow(hit_label)
-
-                stress_label = QLabel(f"Stress Capacity: {game_controller.character.stress_capacity}", self)
-                attr_layout.addRow(stress_label)
-
-                cuf_label = QLabel(f"Coolness Under Fire (CUF): {game_controller.character.cuf}", self)
-                attr_layout.addRow(cuf_label)
+                for key in ("attr_STR", "attr_AGL", "attr_INT", "attr_EMP",
+                            "hit_capacity", "stress_capacity", "cuf"):
+                    label = QLabel(self)
+                    attr_layout.addRow(label)
+                    self.field_labels[key] = label
 
                 scroll_layout.addWidget(attr_group)
 
@@ -1469,33 +1520,15 @@ class BasicInfoScreen(QWidget):
                 # Create a table-like display for skills
                 from PyQt6.QtWidgets import QGridLayout
 
-                skills_grid = QGridLayout()
-                skills_grid.addWidget(QLabel("Skill", self), 0, 0, Qt.AlignmentFlag.AlignLeft)
-                skills_grid.addWidget(QLabel("Level", self), 0, 1, Qt.AlignmentFlag.AlignCenter)
-                skills_grid.addWidget(QLabel("Die", self), 0, 2, Qt.AlignmentFlag.AlignRight)
-
-                # Add skills to grid
-                row = 1
-                for skill, level in game_controller.character.skills.items():
-                    skills_grid.addWidget(QLabel(skill, self), row, 0, Qt.AlignmentFlag.AlignLeft)
-                    skills_grid.addWidget(QLabel(level, self), row, 1, Qt.AlignmentFlag.AlignCenter)
-
-                    # Calculate die based on level
-                    if level == "A":
-                        die = "D12"
-                    elif level == "B":
-                        die = "D10"
-                    elif level == "C":
-                        die = "D8"
-                    elif level == "D":
-                        die = "D6"
-                    else:
-                        die = "None"
+                self.skills_grid = QGridLayout()
+                self.skills_grid.addWidget(QLabel("Skill", self), 0, 0, Qt.AlignmentFlag.AlignLeft)
+                self.skills_grid.addWidget(QLabel("Level", self), 0, 1, Qt.AlignmentFlag.AlignCenter)
+                self.skills_grid.addWidget(QLabel("Die", self), 0, 2, Qt.AlignmentFlag.AlignRight)
 
-                    skills_grid.addWidget(QLabel(die, self), row, 2, Qt.AlignmentFlag.AlignRight)
-                    row += 1
+                # Skill rows are created on demand and reused
+                self.skill_rows = []
 
-                skills_layout.addLayout(skills_grid)
+                skills_layout.addLayout(self.skills_grid)
 
                 scroll_layout.addWidget(skills_group)
 
@@ -1503,10 +1536,10 @@ class BasicInfoScreen(QWidget):
                 specialties_group = QGroupBox("Specialties", self)
                 specialties_layout = QVBoxLayout(specialties_group)
 
-                specialties_text = ", ".join(s for s, has in game_controller.character.specialties.items() if has)
-                specialties_label = QLabel(specialties_text, self)
+                specialties_label = QLabel(self)
                 specialties_label.setWordWrap(True)
                 specialties_layout.addWidget(specialties_label)
+                self.field_labels["specialties"] = specialties_label
 
                 scroll_layout.addWidget(specialties_group)
 
@@ -1514,34 +1547,24 @@ class BasicInfoScreen(QWidget):
                 background_group = QGroupBox("Background", self)
                 background_layout = QVBoxLayout(background_group)
 
-                childhood_label = QLabel(f"Childhood: {game_controller.character.childhood}", self)
-                background_layout.addWidget(childhood_label)
-
-                childhood_specialty_label = QLabel(
-                    f"Childhood Specialty: {game_controller.character.childhood_specialty}", self)
-                background_layout.addWidget(childhood_specialty_label)
+                for key in ("childhood", "childhood_specialty"):
+                    label = QLabel(self)
+                    background_layout.addWidget(label)
+                    self.field_labels[key] = label
 
                 # Career history
                 career_label = QLabel("Career History:", self)
                 career_label.setFont(theme_manager.get_military_font(12, bold=True))
                 background_layout.addWidget(career_label)
 
-                for career in game_controller.character.careers:
-                    age = career["age"]
-                    term = f"Age {age}-{age + 5}: {career['type']}"
-                    if career["branch"]:
-                        term += f" - {career['branch']}"
-                    if career["rank"]:
-                        term += f" ({career['rank']})"
-                    if career["promotion"]:
-                        term += " [Promoted]"
-
-                    career_term_label = QLabel(term, self)
-                    background_layout.addWidget(career_term_label)
-
-                war_text = "Yes - " + game_controller.character.at_war_career if game_controller.character.war_experience else "No"
-                war_label = QLabel(f"War Experience: {war_text}", self)
+                # Career term labels are created on demand and reused
+                self.career_layout = QVBoxLayout()
+                self.career_labels = []
+                background_layout.addLayout(self.career_layout)
+
+                war_label = QLabel(self)
                 background_layout.addWidget(war_label)
+                self.field_labels["war"] = war_label
 
                 scroll_layout.addWidget(background_group)
 
@@ -1549,21 +1572,12 @@ class BasicInfoScreen(QWidget):
                 details_group = QGroupBox("Character Details", self)
                 details_layout = QFormLayout(details_group)
 
-                moral_code_label = QLabel(game_controller.character.moral_code, self)
-                moral_code_label.setWordWrap(True)
-                details_layout.addRow("Moral Code:", moral_code_label)
-
-                big_dream_label = QLabel(game_controller.character.big_dream, self)
-                big_dream_label.setWordWrap(True)
-                details_layout.addRow("Big Dream:", big_dream_label)
-
-                buddy_label = QLabel(game_controller.character.buddy, self)
-                buddy_label.setWordWrap(True)
-                details_layout.addRow("Buddy:", buddy_label)
-
-                how_met_label = QLabel(game_controller.character.how_you_met, self)
-                how_met_label.setWordWrap(True)
-                details_layout.addRow("How You Met:", how_met_label)
+                for key, title in (("moral_code", "Moral Code:"), ("big_dream", "Big Dream:"),
+                                   ("buddy", "Buddy:"), ("how_you_met", "How You Met:")):
+                    label = QLabel(self)
+                    label.setWordWrap(True)
+                    details_layout.addRow(title, label)
+                    self.field_labels[key] = label
 
                 scroll_layout.addWidget(details_group)
 
@@ -1571,10 +1585,10 @@ class BasicInfoScreen(QWidget):
                 gear_group = QGroupBox("Gear", self)
                 gear_layout = QVBoxLayout(gear_group)
 
-                # For now, just list gear as a placeholder
-                gear_text = QLabel("Standard gear based on nationality and career", self)
+                gear_text = QLabel(self)
                 gear_text.setWordWrap(True)
                 gear_layout.addWidget(gear_text)
+                self.field_labels["gear"] = gear_text
 
                 scroll_layout.addWidget(gear_group)
 
@@ -1582,8 +1596,9 @@ class BasicInfoScreen(QWidget):
                 radiation_group = QGroupBox("Radiation", self)
                 radiation_layout = QVBoxLayout(radiation_group)
 
-                radiation_label = QLabel(f"Permanent Radiation Points: {game_controller.character.radiation}", self)
+                radiation_label = QLabel(self)
                 radiation_layout.addWidget(radiation_label)
+                self.field_labels["radiation"] = radiation_label
 
                 scroll_layout.addWidget(radiation_group)
 
@@ -1617,6 +1632,75 @@ class BasicInfoScreen(QWidget):
                 # Add buttons to main layout
                 main_layout.addLayout(button_layout)
 
+            @timed_slot("characterChanged:CharacterSheetScreen")
+            def update_display(self, character=None):
+                """Refresh the sheet from a character
+
+                Only widgets whose fields changed are touched.
+
+                Args:
+                    character: Character to show (default: the game controller's character)
+                """
+                self.view_model.update(character or game_controller.character)
+
+            def _apply_changes(self, changes):
+                """Push changed view-model fields to their widgets
+
+                Args:
+                    changes: Dictionary of changed fields from the view-model
+                """
+                for key, value in changes.items():
+                    if key == "skills":
+                        self._update_skill_rows(value)
+                    elif key == "careers":
+                        self._update_career_labels(value)
+                    elif key in self.field_labels:
+                        self.field_labels[key].setText(value)
+
+            def _update_skill_rows(self, skills):
+                """Update the skill grid, reusing existing row widgets
+
+                Args:
+                    skills: Tuple of (skill, level, die) tuples
+                """
+                # Create any extra rows needed
+                while len(self.skill_rows) < len(skills):
+                    row = len(self.skill_rows) + 1
+                    labels = (QLabel(self), QLabel(self), QLabel(self))
+                    self.skills_grid.addWidget(labels[0], row, 0, Qt.AlignmentFlag.AlignLeft)
+                    self.skills_grid.addWidget(labels[1], row, 1, Qt.AlignmentFlag.AlignCenter)
+                    self.skills_grid.addWidget(labels[2], row, 2, Qt.AlignmentFlag.AlignRight)
+                    self.skill_rows.append(labels)
+
+                for i, labels in enumerate(self.skill_rows):
+                    visible = i < len(skills)
+                    if visible:
+                        for label, text in zip(labels, skills[i]):
+                            if label.text() != text:
+                                label.setText(text)
+                    for label in labels:
+                        if label.isVisibleTo(self) != visible:
+                            label.setVisible(visible)
+
+            def _update_career_labels(self, terms):
+                """Update the career history, reusing existing labels
+
+                Args:
+                    terms: Tuple of career term strings
+                """
+                # Create any extra labels needed
+                while len(self.career_labels) < len(terms):
+                    label = QLabel(self)
+                    self.career_layout.addWidget(label)
+                    self.career_labels.append(label)
+
+                for i, label in enumerate(self.career_labels):
+                    visible = i < len(terms)
+                    if visible and label.text() != terms[i]:
+                        label.setText(terms[i])
+                    if label.isVisibleTo(self) != visible:
+                        label.setVisible(visible)
+
             def _on_save_pdf_clicked(self):
                 """Handle save PDF button click"""
                 # Play sound
@@ -1678,6 +1762,4 @@ class BasicInfoScreen(QWidget):
 
                     # Navigate back to intro screen
                     if self.parent:
-                        intro_screen = self.parent.stacked_widget.widget(0)  # Assuming intro screen is the first widget
-                        intro_screen.restart()  # Restart the intro sequence
-                        self.parent.stacked_widget.setCurrentWidget(intro_screen)
\ No newline at end of file
+                        self.parent.restart_intro()
\ No newline at end of file
@@ -0,0 +1,123 @@
+"""
+character_sheet_model.py - View-model for the character sheet screen
+"""
+
+from src.data.skills import CHECK_DIE_SIZES
+
+# Attribute rows shown on the sheet
+SHEET_ATTRIBUTES = [
+    ("STR", "Strength"),
+    ("AGL", "Agility"),
+    ("INT", "Intelligence"),
+    ("EMP", "Empathy")
+]
+
+# Die for each skill level (untrained skills have none)
+SKILL_DICE = {level: f"D{size}" for level, size in CHECK_DIE_SIZES.items() if size}
+
+
+def build_sheet_fields(character):
+    """Build the display value of every field on the character sheet
+
+    Args:
+        character: Character object
+
+    Returns:
+        Dictionary mapping field key to display value. Most values are strings;
+        "skills" is a tuple of (skill, level, die) tuples and "careers" a tuple
+        of career term strings.
+    """
+    fields = {
+        "title": f"Character Sheet: {character.name}",
+        "name": f"Name: {character.name}",
+        "nationality": f"Nationality: {character.nationality}",
+        "age": f"Age: {character.age}",
+        "appearance": f"Appearance: {character.appearance}",
+        "hit_capacity": f"Hit Capacity: {character.hit_capacity}",
+        "stress_capacity": f"Stress Capacity: {character.stress_capacity}",
+        "cuf": f"Coolness Under Fire (CUF): {character.cuf}",
+        "specialties": ", ".join(s for s, has in character.specialties.items() if has),
+        "childhood": f"Childhood: {character.childhood}",
+        "childhood_specialty": f"Childhood Specialty: {character.childhood_specialty}",
+        "moral_code": character.moral_code,
+        "big_dream": character.big_dream,
+        "buddy": character.buddy,
+        "how_you_met": character.how_you_met,
+        "gear": "\n".join(str(item) for item in character.gear) or "Standard gear based on nationality and career",
+        "radiation": f"Permanent Radiation Points: {character.radiation}"
+    }
+
+    for attr, name in SHEET_ATTRIBUTES:
+        fields[f"attr_{attr}"] = (f"{name} ({attr}): {character.get_attribute_letter(attr)} "
+                                  f"({character.get_attribute_die(attr)})")
+
+    fields["skills"] = tuple(
+        (skill, level, SKILL_DICE.get(level, "None")) for skill, level in character.skills.items()
+    )
+
+    terms = []
+    for career in character.careers:
+        age = career["age"]
+        term = f"Age {age}-{age + 5}: {career['type']}"
+        if career["branch"]:
+            term += f" - {career['branch']}"
+        if career["rank"]:
+            term += f" ({career['rank']})"
+        if career["promotion"]:
+            term += " [Promoted]"
+        terms.append(term)
+    fields["careers"] = tuple(terms)
+
+    war_text = "Yes - " + character.at_war_career if character.war_experience else "No"
+    fields["war"] = f"War Experience: {war_text}"
+
+    return fields
+
+
+class CharacterSheetViewModel:
+    """Tracks the displayed sheet fields and reports only the ones that changed"""
+
+    def __init__(self):
+        """Initialize the view-model with nothing displayed"""
+        self.fields = {}
+        self._listeners = []
+
+    def subscribe(self, callback):
+        """Subscribe to field changes
+
+        Args:
+            callback: Function called with a dictionary of changed fields
+        """
+        self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        """Unsubscribe from field changes
+
+        Args:
+            callback: Previously subscribed function
+        """
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def update(self, character):
+        """Update the view-model from a character
+
+        Args:
+            character: Character object
+
+        Returns:
+            Dictionary of the fields whose display value changed
+        """
+        new_fields = build_sheet_fields(character)
+        changes = {key: value for key, value in new_fields.items() if self.fields.get(key) != value}
+        self.fields = new_fields
+
+        if changes:
+            for callback in self._listeners:
+                callback(changes)
+
+        return changes
+
+    def invalidate(self):
+        """Forget the displayed fields, so the next update reports all of them"""
+        self.fields = {}
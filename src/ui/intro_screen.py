@@ -4,33 +4,68 @@ intro_screen.py - Introduction screen with scrolling text
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QSpacerItem, QSizePolicy
+    QSpacerItem, QSizePolicy, QStyle, QStyleOption
+)
+from PyQt6.QtCore import Qt, QTimer, QSize, QElapsedTimer, QEvent, QPointF, QRectF
+from PyQt6.QtGui import (
+    QFont, QFontMetrics, QPixmap, QPainter, QPainterPath, QPalette, QTextLayout, QTextOption
 )
-from PyQt6.QtCore import Qt, QTimer, QSize
-from PyQt6.QtGui import QFont, QFontMetrics, QPixmap
 
 import src.config as config
 from src.ui.theme_manager import theme_manager
 from src.utils.audio_manager import audio_manager
-from src.ui.character_creation import BasicInfoScreen
+
+# Shortest interval between typewriter ticks (about 60 frames per second)
+FRAME_INTERVAL = 16
 
 
 class ScriptedTextLabel(QLabel):
-    """A label that displays text character by character for a typewriter effect"""
+    """A label that displays text character by character for a typewriter effect
+
+    The full text is laid out once with a QTextLayout, and each tick only moves
+    the clip that hides the characters not yet revealed. Ticks are timed
+    against a clock, so a slow frame reveals several characters at once
+    instead of falling behind.
+    """
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.full_text = ""
         self.current_pos = 0
+        self.callback = None
+        self.speed = config.TEXT_SCROLL_SPEED
         self.timer = QTimer(self)
         self.timer.timeout.connect(self._update_text)
-        self.setText("")
+        self.clock = QElapsedTimer()
+        self._layout = None
         self.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.setWordWrap(True)
 
         # Use the military font
         self.setFont(theme_manager.get_military_font(12))
 
+    def setText(self, text):
+        """Show text immediately, stopping any script in progress
+
+        Args:
+            text: The text to display
+        """
+        if self.timer.isActive():
+            self.timer.stop()
+
+        self.full_text = text
+        self.current_pos = len(text)
+        self._layout = None
+        super().setText(text)
+
+    def text(self):
+        """Get the text revealed so far
+
+        Returns:
+            The visible part of the text
+        """
+        return self.full_text[:self.current_pos]
+
     def start_script(self, text, speed=None, callback=None):
         """Start displaying text character by character
 
@@ -39,26 +74,31 @@ class ScriptedTextLabel(QLabel):
             speed: Milliseconds between each character (default: config.TEXT_SCROLL_SPEED)
             callback: Function to call when text is fully displayed
         """
-        self.full_text = text
+        # Lay out the whole text once, then reveal it
+        self.setText(text)
         self.current_pos = 0
-        self.setText("")
         self.callback = callback
 
         # Set scroll speed
         if speed is None:
             speed = config.TEXT_SCROLL_SPEED
+        self.speed = max(1, speed)
 
-        # Start the timer
-        self.timer.start(speed)
+        # Tick once per character, but never faster than the frame rate
+        self.clock.start()
+        self.timer.start(max(self.speed, FRAME_INTERVAL))
+        self.update()
 
     def _update_text(self):
-        """Update the displayed text with the next character"""
+        """Reveal the characters due since the script started"""
         if self.current_pos < len(self.full_text):
-            self.current_pos += 1
-            self.setText(self.full_text[:self.current_pos])
+            previous_pos = self.current_pos
+            due_pos = self.clock.elapsed() // self.speed
+            self.current_pos = min(len(self.full_text), max(previous_pos + 1, due_pos))
+            self.update()
 
             # Play a subtle typing sound for every 3rd character
-            if self.current_pos % 3 == 0:
+            if self.current_pos // 3 > previous_pos // 3:
                 # This would be better with a typing sound
                 audio_manager.play_sound("button_click")
         else:
@@ -66,7 +106,7 @@ class ScriptedTextLabel(QLabel):
             self.timer.stop()
 
             # Call the callback if provided
-            if hasattr(self, 'callback') and self.callback:
+            if self.callback:
                 self.callback()
 
     def display_instantly(self, text):
@@ -75,13 +115,91 @@ class ScriptedTextLabel(QLabel):
         Args:
             text: The text to display
         """
-        self.full_text = text
-        self.current_pos = len(text)
         self.setText(text)
 
-        # Stop the timer if it's running
-        if self.timer.isActive():
-            self.timer.stop()
+    def resizeEvent(self, event):
+        """Drop the cached layout when the label is resized"""
+        self._layout = None
+        super().resizeEvent(event)
+
+    def changeEvent(self, event):
+        """Drop the cached layout when the font changes"""
+        if event.type() == QEvent.Type.FontChange:
+            self._layout = None
+        super().changeEvent(event)
+
+    def _build_layout(self):
+        """Lay out the full text for the current width and font
+
+        Returns:
+            Tuple of (QTextLayout, total text height)
+        """
+        width = self.contentsRect().width()
+
+        # QTextLayout breaks lines on the Unicode line separator
+        layout = QTextLayout(self.full_text.replace("\n", "\u2028"), self.font())
+        option = QTextOption(self.alignment() & Qt.AlignmentFlag.AlignHorizontal_Mask)
+        option.setWrapMode(QTextOption.WrapMode.WordWrap if self.wordWrap()
+                           else QTextOption.WrapMode.NoWrap)
+        layout.setTextOption(option)
+
+        height = 0.0
+        layout.beginLayout()
+        while True:
+            line = layout.createLine()
+            if not line.isValid():
+                break
+            line.setLineWidth(width)
+            line.setPosition(QPointF(0, height))
+            height += line.height()
+        layout.endLayout()
+
+        return layout, height
+
+    def paintEvent(self, event):
+        """Draw the frame and the revealed part of the cached text layout"""
+        painter = QPainter(self)
+
+        # Draw the theme's background, border and frame, as QLabel would.
+        # Qt already paints the background of widgets with WA_StyledBackground.
+        if not self.testAttribute(Qt.WidgetAttribute.WA_StyledBackground):
+            option = QStyleOption()
+            option.initFrom(self)
+            self.style().drawPrimitive(QStyle.PrimitiveElement.PE_Widget, option, painter, self)
+        self.drawFrame(painter)
+
+        if not self.full_text or not self.current_pos:
+            painter.end()
+            return
+
+        if self._layout is None:
+            self._layout = self._build_layout()
+        layout, height = self._layout
+
+        rect = self.contentsRect()
+        top = rect.top()
+        if self.alignment() & Qt.AlignmentFlag.AlignVCenter:
+            top += (rect.height() - height) / 2
+        elif self.alignment() & Qt.AlignmentFlag.AlignBottom:
+            top += rect.height() - height
+        origin = QPointF(rect.left(), top)
+
+        painter.setPen(self.palette().color(QPalette.ColorRole.WindowText))
+
+        if self.current_pos < len(self.full_text):
+            # Show every line above the cursor and the cursor line up to the cursor
+            line = layout.lineForTextPosition(self.current_pos)
+            x = line.cursorToX(self.current_pos)
+            if isinstance(x, tuple):
+                x = x[0]
+
+            clip = QPainterPath()
+            clip.addRect(QRectF(rect.left(), top, rect.width(), line.y()))
+            clip.addRect(QRectF(rect.left(), top + line.y(), x, line.height()))
+            painter.setClipPath(clip)
+
+        layout.draw(painter, origin)
+        painter.end()
 
 
 class IntroScreen(QWidget):
@@ -213,11 +331,8 @@ class IntroScreen(QWidget):
 
     def _proceed_to_character_creation(self):
         """Proceed to the character creation screen"""
-        # Create basic info screen
-        basic_info_screen = BasicInfoScreen(self.parent)
-
         # Navigate to the basic info screen
-        self.parent.navigate_to_screen(basic_info_screen)
+        self.parent.show_screen("basic_info")
 
     def restart(self):
         """Restart the intro sequence"""
@@ -7,16 +7,86 @@ from PyQt6.QtWidgets import (
     QPushButton, QStackedWidget, QMessageBox, QFileDialog,
     QSizePolicy, QSpacerItem
 )
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QIcon, QPixmap, QFont, QAction
+from PyQt6.QtCore import Qt, QSize, QTimer, QPointF
+from PyQt6.QtGui import QIcon, QPixmap, QFont, QAction, QPainter
 
 import src.config as config
-from src.ui.intro_screen import IntroScreen
+from src.ui.screen_registry import ScreenRegistry
 from src.ui.theme_manager import theme_manager
 from src.utils.audio_manager import audio_manager
+from src.utils.image_cache import image_cache
+from src.utils.asset_manifest import asset_manifest
+from src.utils.instrumentation import instrumentation
 from src.controllers.game_controller import game_controller
 
 
+# Milliseconds to wait after a resize before rescaling the backgrounds
+RESIZE_PRESCALE_DELAY = 150
+
+
+class BackgroundWidget(QWidget):
+    """Central widget that draws the current theme's background image"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        # Rescale once resizing settles rather than on every step
+        self.resize_timer = QTimer(self)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.setInterval(RESIZE_PRESCALE_DELAY)
+        self.resize_timer.timeout.connect(self.prescale_backgrounds)
+
+        image_cache.pixmapReady.connect(self._on_pixmap_ready)
+
+    def background_path(self):
+        """Get the background image for the current theme"""
+        return config.THEME_BACKGROUNDS.get(theme_manager.current_theme)
+
+    def prescale_backgrounds(self):
+        """Prepare every theme's background at the current size, so theme switches are instant"""
+        current = self.background_path()
+        paths = [current] + [path for path in config.THEME_BACKGROUNDS.values() if path != current]
+        image_cache.prescale_all([path for path in paths if path], self.size(), self.devicePixelRatioF())
+
+    def showEvent(self, event):
+        """Prepare the backgrounds when first shown"""
+        super().showEvent(event)
+        self.prescale_backgrounds()
+
+    def resizeEvent(self, event):
+        """Prepare the backgrounds for the new size"""
+        super().resizeEvent(event)
+        self.resize_timer.start()
+
+    def _on_pixmap_ready(self, path):
+        """Repaint when the current background is ready"""
+        if path == self.background_path():
+            self.update()
+
+    def paintEvent(self, event):
+        """Draw the background"""
+        path = self.background_path()
+        if not path:
+            return
+
+        pixmap = image_cache.get_pixmap(path, self.size(), self.devicePixelRatioF())
+        painter = QPainter(self)
+
+        if pixmap is not None:
+            # The pixmap covers the widget, so center it and let the edges crop
+            size = pixmap.deviceIndependentSize()
+            painter.drawPixmap(QPointF((self.width() - size.width()) / 2,
+                                       (self.height() - size.height()) / 2), pixmap)
+        else:
+            # Stretch another size until this one is ready
+            nearest = image_cache.get_nearest_pixmap(path)
+            if nearest is not None:
+                painter.drawPixmap(self.rect(), nearest)
+            image_cache.prescale(path, self.size(), self.devicePixelRatioF())
+
+        painter.end()
+
+
 class MainWindow(QMainWindow):
     """Main application window for Twilight 2000 Character Creator"""
 
@@ -31,8 +101,13 @@ class MainWindow(QMainWindow):
         # Set up the menu bar
         self._setup_menu_bar()
 
+        # Set the window icon
+        icon_image = image_cache.get_image(config.APP_ICON)
+        if not icon_image.isNull():
+            self.setWindowIcon(QIcon(QPixmap.fromImage(icon_image)))
+
         # Create central widget
-        self.central_widget = QWidget()
+        self.central_widget = BackgroundWidget()
         self.setCentralWidget(self.central_widget)
 
         # Create main layout
@@ -47,24 +122,40 @@ class MainWindow(QMainWindow):
         self.stacked_widget = QStackedWidget()
         self.main_layout.addWidget(self.stacked_widget)
 
-        # Create screens
-        self.intro_screen = IntroScreen(self)
-        self.stacked_widget.addWidget(self.intro_screen)
-
-        # Uncomment these when implemented:
-        # self.character_creation_screen = CharacterCreationScreen(self)
-        # self.stacked_widget.addWidget(self.character_creation_screen)
-        # self.character_sheet_screen = CharacterSheetScreen(self)
-        # self.stacked_widget.addWidget(self.character_sheet_screen)
+        # Screens are built on first use and cached
+        self.screen_registry = ScreenRegistry(self.stacked_widget, self)
+        self.screen_registry.register_defaults()
 
         # Set initial screen
+        self.intro_screen = self.screen_registry.get("intro")
         self.stacked_widget.setCurrentWidget(self.intro_screen)
+        self.screen_registry.preload_next("intro")
 
         # Apply theme
         theme_manager.set_theme(config.DEFAULT_THEME)
 
-        # Start background music
-        audio_manager.play_music("intro_music")
+        # Decode sound effects before the first click
+        audio_manager.preload_sounds()
+
+        # Pick up changed assets while developing
+        self.asset_watcher = asset_manifest.watch(self)
+        if self.asset_watcher is not None:
+            asset_manifest.add_refresh_listener(self._on_assets_changed)
+
+        # Background music starts once the window is on screen (see showEvent)
+        self.music_started = False
+
+    def showEvent(self, event):
+        """Start the background music after the window is first shown
+
+        Starting the music creates the audio backend, so it's left until the
+        window has been painted rather than done while building it.
+        """
+        super().showEvent(event)
+        if not self.music_started:
+            self.music_started = True
+            QTimer.singleShot(config.STARTUP_MUSIC_DELAY,
+                              lambda: audio_manager.play_theme_music(theme_manager.current_theme))
 
     def _setup_menu_bar(self):
         """Set up the menu bar"""
@@ -89,6 +180,12 @@ class MainWindow(QMainWindow):
         save_action.triggered.connect(self._save_character)
         file_menu.addAction(save_action)
 
+        # Roster action
+        roster_action = QAction("&Roster...", self)
+        roster_action.setShortcut("Ctrl+R")
+        roster_action.triggered.connect(self._open_roster)
+        file_menu.addAction(roster_action)
+
         # Export to PDF action
         export_action = QAction("&Export to PDF", self)
         export_action.setShortcut("Ctrl+E")
@@ -110,7 +207,9 @@ class MainWindow(QMainWindow):
         for theme_key, theme_data in config.THEMES.items():
             theme_action = QAction(theme_data["name"], self)
             theme_action.setData(theme_key)
-            theme_action.triggered.connect(lambda checked, t=theme_key: theme_manager.set_theme(t))
+            theme_action.triggered.connect(lambda checked, t=theme_key: self._set_theme(t))
+            theme_action.hovered.connect(
+                lambda t=theme_key: audio_manager.prepare_music(config.THEME_MUSIC.get(t)))
             theme_menu.addAction(theme_action)
 
         # Audio menu
@@ -138,6 +237,12 @@ class MainWindow(QMainWindow):
         about_action.triggered.connect(self._show_about)
         help_menu.addAction(about_action)
 
+        # Performance trace action (only while instrumented)
+        if instrumentation.enabled:
+            trace_action = QAction("Export &Performance Trace...", self)
+            trace_action.triggered.connect(self._export_performance_trace)
+            help_menu.addAction(trace_action)
+
     def _setup_header(self):
         """Set up the header with title and theme switcher"""
         header_widget = QWidget()
@@ -158,12 +263,26 @@ class MainWindow(QMainWindow):
         for theme_key, theme_data in config.THEMES.items():
             theme_button = QPushButton(theme_data["name"])
             theme_button.setFixedSize(QSize(100, 40))
-            theme_button.clicked.connect(lambda checked, t=theme_key: theme_manager.set_theme(t))
+            theme_button.clicked.connect(lambda checked, t=theme_key: self._set_theme(t))
             header_layout.addWidget(theme_button)
 
         # Add header to main layout
         self.main_layout.addWidget(header_widget)
 
+    def _set_theme(self, theme_name):
+        """Switch theme and redraw the background"""
+        theme_manager.set_theme(theme_name)
+        self.central_widget.update()
+
+        # Crossfade to the theme's music
+        audio_manager.play_theme_music(theme_name)
+
+    def _on_assets_changed(self):
+        """Reload images after assets change on disk"""
+        image_cache.clear()
+        self.central_widget.prescale_backgrounds()
+        self.central_widget.update()
+
     def navigate_to_screen(self, screen):
         """Navigate to a specific screen
 
@@ -180,6 +299,37 @@ class MainWindow(QMainWindow):
         # Navigate to the screen
         self.stacked_widget.setCurrentWidget(screen)
 
+    def show_screen(self, name):
+        """Show a registered screen, building it if needed
+
+        Args:
+            name: Screen name (e.g., "childhood", "sheet")
+
+        Returns:
+            The screen widget
+        """
+        screen = self.screen_registry.get(name)
+
+        # Cached screens may be showing an older character
+        if hasattr(screen, "update_display"):
+            screen.update_display()
+
+        self.navigate_to_screen(screen)
+
+        # Build the next step while the user reads this one
+        self.screen_registry.preload_next(name)
+
+        return screen
+
+    def restart_intro(self):
+        """Drop the character creation screens and restart the intro"""
+        self.screen_registry.clear(keep=("intro",))
+
+        # Navigate to the intro screen
+        self.stacked_widget.setCurrentWidget(self.intro_screen)
+        self.intro_screen.restart()
+        self.screen_registry.preload_next("intro")
+
     def _new_character(self):
         """Create a new character"""
         # Play sound
@@ -188,9 +338,8 @@ class MainWindow(QMainWindow):
         # Reset the game controller
         game_controller.reset()
 
-        # Navigate to the intro screen
-        self.stacked_widget.setCurrentWidget(self.intro_screen)
-        self.intro_screen.restart()
+        # Start over from the intro screen
+        self.restart_intro()
 
     def _open_character(self):
         """Open an existing character"""
@@ -203,13 +352,21 @@ class MainWindow(QMainWindow):
         if file_path:
             # Load character
             if game_controller.load_character(file_path):
-                # Navigate to character sheet screen (when implemented)
-                # self.stacked_widget.setCurrentWidget(self.character_sheet_screen)
-                # self.character_sheet_screen.update_display()
-                pass
+                # Navigate to character sheet screen
+                self.show_screen("sheet")
             else:
                 QMessageBox.warning(self, "Error", "Failed to load character file.")
 
+    def _open_roster(self):
+        """Open the roster of saved characters"""
+        # Play sound
+        audio_manager.play_sound("button_click")
+
+        from src.ui.roster_browser import RosterBrowser
+
+        roster_browser = RosterBrowser(self)
+        roster_browser.exec()
+
     def _save_character(self):
         """Save the current character"""
         # Play sound
@@ -240,6 +397,25 @@ class MainWindow(QMainWindow):
             else:
                 QMessageBox.warning(self, "Error", "Failed to export character to PDF.")
 
+    def _export_performance_trace(self):
+        """Export the recorded UI timings"""
+        # Show file dialog
+        file_path, selected_filter = QFileDialog.getSaveFileName(
+            self, "Export Performance Trace", "",
+            "Chrome Trace (*.json);;Timing Samples (*.json);;All Files (*)")
+
+        if file_path:
+            # Chrome trace format unless plain samples were asked for
+            if selected_filter.startswith("Timing Samples"):
+                success = instrumentation.export_json(file_path)
+            else:
+                success = instrumentation.export_chrome_trace(file_path)
+
+            if success:
+                QMessageBox.information(self, "Success", "Performance trace exported successfully.")
+            else:
+                QMessageBox.warning(self, "Error", "Failed to export performance trace.")
+
     def _show_about(self):
         """Show the about dialog"""
         # Play sound
@@ -0,0 +1,394 @@
+"""
+roster_browser.py - Browser for the roster of saved characters
+"""
+
+from collections import OrderedDict
+
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QLineEdit,
+    QComboBox, QTableView, QHeaderView, QAbstractItemView, QMessageBox
+)
+from PyQt6.QtCore import Qt, QTimer, QAbstractTableModel, QModelIndex
+
+import src.config as config
+from src.ui.theme_manager import theme_manager
+from src.utils.audio_manager import audio_manager
+from src.controllers.game_controller import game_controller
+from src.utils.character_store import CharacterStore, SUMMARY_COLUMNS, SKILL_COLUMNS, LEVEL_COLUMNS
+from src.data.skills import CORE_SKILLS
+
+# Columns shown in the roster: (store column, header)
+ROSTER_COLUMNS = [
+    ("name", "Name"),
+    ("nationality", "Nationality"),
+    ("career", "Career"),
+    ("cuf", "CUF"),
+    ("age", "Age")
+] + [(column, skill) for skill, column in SKILL_COLUMNS.items()]
+
+# Pages of rows kept in memory
+MAX_CACHED_PAGES = 20
+
+# Milliseconds to wait after typing before filtering
+FILTER_DELAY = 250
+
+
+class RosterTableModel(QAbstractTableModel):
+    """Table model that pages rows in from a CharacterStore as they are needed
+
+    Only the row count is known up front. Rows are fetched a page at a time
+    when the view asks for them, and sorting and filtering are done by the
+    store, so no more than a few pages are ever held in memory.
+    """
+
+    def __init__(self, store, parent=None):
+        """Initialize the roster model
+
+        Args:
+            store: CharacterStore to browse
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self.store = store
+        self.page_size = config.ROSTER_PAGE_SIZE
+        self.filters = {}
+        self.sort_column = "name"
+        self.descending = False
+        self._row_count = None
+        self._pages = OrderedDict()
+
+        # Position of each shown column in the store's summary rows
+        self._row_indexes = [SUMMARY_COLUMNS.index(column) for column, _ in ROSTER_COLUMNS]
+
+    def rowCount(self, parent=QModelIndex()):
+        """Get the number of matching characters"""
+        if parent.isValid():
+            return 0
+
+        if self._row_count is None:
+            self._row_count = self.store.count(self.filters)
+        return self._row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        """Get the number of columns"""
+        if parent.isValid():
+            return 0
+        return len(ROSTER_COLUMNS)
+
+    def _get_row(self, row):
+        """Get a summary row, fetching its page if needed
+
+        Args:
+            row: Row number
+
+        Returns:
+            Tuple in SUMMARY_COLUMNS order, or None if out of range
+        """
+        page_number = row // self.page_size
+        page = self._pages.get(page_number)
+
+        if page is None:
+            page = self.store.fetch_rows(page_number * self.page_size, self.page_size,
+                                         self.sort_column, self.descending, self.filters)
+            self._pages[page_number] = page
+
+            # Drop the least recently used page
+            if len(self._pages) > MAX_CACHED_PAGES:
+                self._pages.popitem(last=False)
+        else:
+            self._pages.move_to_end(page_number)
+
+        offset = row - page_number * self.page_size
+        if offset < len(page):
+            return page[offset]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        """Get the data for a cell"""
+        if not index.isValid():
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            row = self._get_row(index.row())
+            if row is None:
+                return None
+            return row[self._row_indexes[index.column()]]
+
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            column = ROSTER_COLUMNS[index.column()][0]
+            if column in LEVEL_COLUMNS or column == "age":
+                return Qt.AlignmentFlag.AlignCenter
+
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        """Get the column headers"""
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return ROSTER_COLUMNS[section][1]
+        return None
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        """Sort the roster by a column"""
+        self.beginResetModel()
+        self.sort_column = ROSTER_COLUMNS[column][0]
+        self.descending = order == Qt.SortOrder.DescendingOrder
+        self._pages.clear()
+        self.endResetModel()
+
+    def set_filters(self, filters):
+        """Filter the roster
+
+        Args:
+            filters: Filter dictionary (see CharacterStore._where_clause)
+        """
+        self.beginResetModel()
+        self.filters = filters
+        self._row_count = None
+        self._pages.clear()
+        self.endResetModel()
+
+    def refresh(self):
+        """Reload the roster after the store has changed"""
+        self.set_filters(self.filters)
+
+    def get_character_id(self, row):
+        """Get the store ID of the character on a row
+
+        Args:
+            row: Row number
+
+        Returns:
+            Character ID or None
+        """
+        summary = self._get_row(row)
+        if summary is None:
+            return None
+        return summary[0]
+
+
+class RosterBrowser(QDialog):
+    """Dialog for browsing, filtering and opening saved characters"""
+
+    def __init__(self, parent=None, store=None):
+        """Initialize the roster browser
+
+        Args:
+            parent: Parent widget (usually the main window)
+            store: Optional CharacterStore (default: opens config.ROSTER_DB)
+        """
+        super().__init__(parent)
+        self.parent = parent
+        self.store = store or CharacterStore()
+        self._owns_store = store is None
+        self.model = RosterTableModel(self.store, self)
+
+        # Filters are applied once typing pauses
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(FILTER_DELAY)
+        self.filter_timer.timeout.connect(self._apply_filters)
+
+        self.setWindowTitle("Character Roster")
+        self.resize(900, 600)
+        self._setup_ui()
+
+    def _setup_ui(self):
+        """Set up the user interface"""
+        # Main layout
+        main_layout = QVBoxLayout(self)
+        main_layout.setSpacing(10)
+
+        # Title
+        title_label = QLabel("Character Roster", self)
+        title_label.setFont(theme_manager.get_military_font(18, bold=True))
+        main_layout.addWidget(title_label)
+
+        # Filters
+        filter_layout = QHBoxLayout()
+
+        self.name_filter = QLineEdit(self)
+        self.name_filter.setPlaceholderText("Search by name")
+        self.name_filter.textChanged.connect(lambda text: self.filter_timer.start())
+        filter_layout.addWidget(self.name_filter, 2)
+
+        self.nationality_filter = QComboBox(self)
+        filter_layout.addWidget(self.nationality_filter)
+
+        self.career_filter = QComboBox(self)
+        filter_layout.addWidget(self.career_filter)
+
+        self.cuf_filter = QComboBox(self)
+        self.cuf_filter.addItem("Any CUF", "")
+        for level in ["A", "B", "C", "D"]:
+            self.cuf_filter.addItem(f"CUF {level} or better", level)
+        filter_layout.addWidget(self.cuf_filter)
+
+        self.skill_filter = QComboBox(self)
+        self.skill_filter.addItem("Any skill", "")
+        for skill in CORE_SKILLS:
+            self.skill_filter.addItem(skill, skill)
+        filter_layout.addWidget(self.skill_filter)
+
+        self.skill_level_filter = QComboBox(self)
+        for level in ["A", "B", "C", "D"]:
+            self.skill_level_filter.addItem(f"{level} or better", level)
+        self.skill_level_filter.setCurrentIndex(3)
+        filter_layout.addWidget(self.skill_level_filter)
+
+        for combo in (self.nationality_filter, self.career_filter, self.cuf_filter,
+                      self.skill_filter, self.skill_level_filter):
+            combo.currentIndexChanged.connect(lambda index: self._apply_filters())
+
+        main_layout.addLayout(filter_layout)
+
+        # Roster table
+        self.table_view = QTableView(self)
+        self.table_view.setModel(self.model)
+        self.table_view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table_view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.table_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.table_view.verticalHeader().setVisible(False)
+
+        # Fixed row heights let the view skip measuring rows it isn't showing
+        self.table_view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table_view.verticalHeader().setDefaultSectionSize(24)
+        self.table_view.horizontalHeader().setStretchLastSection(True)
+
+        self.table_view.setSortingEnabled(True)
+        self.table_view.sortByColumn(0, Qt.SortOrder.AscendingOrder)
+        self.table_view.doubleClicked.connect(lambda index: self._on_open_clicked())
+        main_layout.addWidget(self.table_view)
+
+        # Row count
+        self.count_label = QLabel(self)
+        main_layout.addWidget(self.count_label)
+
+        # Buttons
+        button_layout = QHBoxLayout()
+        button_layout.setSpacing(10)
+
+        self.add_button = QPushButton("Add Current Character", self)
+        self.add_button.clicked.connect(self._on_add_clicked)
+        button_layout.addWidget(self.add_button)
+
+        self.delete_button = QPushButton("Delete", self)
+        self.delete_button.clicked.connect(self._on_delete_clicked)
+        button_layout.addWidget(self.delete_button)
+
+        button_layout.addStretch(1)
+
+        self.open_button = QPushButton("Open", self)
+        self.open_button.clicked.connect(self._on_open_clicked)
+        button_layout.addWidget(self.open_button)
+
+        self.close_button = QPushButton("Close", self)
+        self.close_button.clicked.connect(self.reject)
+        button_layout.addWidget(self.close_button)
+
+        main_layout.addLayout(button_layout)
+
+        self._update_filter_choices()
+        self._update_count()
+
+    def _update_filter_choices(self):
+        """Fill the nationality and career filters from the store"""
+        for combo, column, any_text in ((self.nationality_filter, "nationality", "Any nationality"),
+                                        (self.career_filter, "career", "Any career")):
+            current = combo.currentData()
+
+            combo.blockSignals(True)
+            combo.clear()
+            combo.addItem(any_text, "")
+            for value in self.store.get_distinct_values(column):
+                combo.addItem(value, value)
+
+            index = combo.findData(current)
+            combo.setCurrentIndex(max(0, index))
+            combo.blockSignals(False)
+
+    def _apply_filters(self):
+        """Filter the roster from the filter widgets"""
+        filters = {
+            "name": self.name_filter.text().strip(),
+            "nationality": self.nationality_filter.currentData(),
+            "career": self.career_filter.currentData(),
+            "cuf": self.cuf_filter.currentData()
+        }
+
+        skill = self.skill_filter.currentData()
+        if skill:
+            filters["skills"] = {skill: self.skill_level_filter.currentData()}
+
+        self.model.set_filters(filters)
+        self._update_count()
+
+    def _update_count(self):
+        """Show the number of matching characters"""
+        self.count_label.setText(f"{self.model.rowCount()} characters")
+
+    def _get_selected_id(self):
+        """Get the store ID of the selected character, or None"""
+        rows = self.table_view.selectionModel().selectedRows()
+        if not rows:
+            return None
+        return self.model.get_character_id(rows[0].row())
+
+    def _on_add_clicked(self):
+        """Add the current character to the roster"""
+        # Play sound
+        audio_manager.play_sound("button_click")
+
+        self.store.add_character(game_controller.character)
+        self._update_filter_choices()
+        self.model.refresh()
+        self._update_count()
+
+    def _on_delete_clicked(self):
+        """Delete the selected character from the roster"""
+        # Play sound
+        audio_manager.play_sound("button_click")
+
+        character_id = self._get_selected_id()
+        if character_id is None:
+            return
+
+        result = QMessageBox.question(
+            self,
+            "Delete Character",
+            "Are you sure you want to delete this character from the roster?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+
+        if result == QMessageBox.StandardButton.Yes:
+            self.store.delete_character(character_id)
+            self._update_filter_choices()
+            self.model.refresh()
+            self._update_count()
+
+    def _on_open_clicked(self):
+        """Open the selected character"""
+        # Play sound
+        audio_manager.play_sound("button_click")
+
+        character_id = self._get_selected_id()
+        if character_id is None:
+            return
+
+        character = self.store.get_character(character_id)
+        if character is None:
+            QMessageBox.warning(self, "Error", "Failed to load character from the roster.")
+            return
+
+        game_controller.set_character(character)
+
+        # Show the character sheet
+        if hasattr(self.parent, "show_screen"):
+            self.parent.show_screen("sheet")
+
+        self.accept()
+
+    def done(self, result):
+        """Close the store when the dialog closes"""
+        if self._owns_store:
+            self.store.close()
+        super().done(result)
@@ -0,0 +1,192 @@
+"""
+screen_registry.py - Lazy construction and caching of application screens
+"""
+
+from PyQt6.QtCore import QTimer
+
+import src.config as config
+from src.utils.instrumentation import instrumentation, CATEGORY_SCREEN
+
+
+def _create_intro_screen(parent):
+    from src.ui.intro_screen import IntroScreen
+    return IntroScreen(parent)
+
+
+def _create_basic_info_screen(parent):
+    from src.ui.character_creation import BasicInfoScreen
+    return BasicInfoScreen(parent)
+
+
+def _create_childhood_screen(parent):
+    from src.ui.character_creation import BasicInfoScreen
+    return BasicInfoScreen.ChildhoodScreen(parent)
+
+
+def _create_career_screen(parent):
+    from src.ui.character_creation import BasicInfoScreen
+    return BasicInfoScreen.CareerSelectionScreen(parent)
+
+
+def _create_war_screen(parent):
+    from src.ui.character_creation import BasicInfoScreen
+    return BasicInfoScreen.WarScreen(parent)
+
+
+def _create_details_screen(parent):
+    from src.ui.character_creation import BasicInfoScreen
+    return BasicInfoScreen.WarScreen.CharacterDetailsScreen(parent)
+
+
+def _create_sheet_screen(parent):
+    from src.ui.character_creation import BasicInfoScreen
+    return BasicInfoScreen.WarScreen.CharacterSheetScreen(parent)
+
+
+# Screens in wizard order: (name, factory, next likely screen)
+DEFAULT_SCREENS = [
+    ("intro", _create_intro_screen, "basic_info"),
+    ("basic_info", _create_basic_info_screen, "childhood"),
+    ("childhood", _create_childhood_screen, "career"),
+    ("career", _create_career_screen, "war"),
+    ("war", _create_war_screen, "details"),
+    ("details", _create_details_screen, "sheet"),
+    ("sheet", _create_sheet_screen, None)
+]
+
+
+class ScreenRegistry:
+    """Builds screens on first use and keeps them for reuse
+
+    Each screen is registered with a factory and the screen likely to follow
+    it. After a screen is shown, the next one can be built in the background
+    once the event loop is idle, so moving through the wizard doesn't stall.
+    """
+
+    def __init__(self, stacked_widget, parent=None):
+        """Initialize the screen registry
+
+        Args:
+            stacked_widget: QStackedWidget that holds the built screens
+            parent: Widget passed to each screen factory (usually the main window)
+        """
+        self.stacked_widget = stacked_widget
+        self.parent = parent
+        self._factories = {}
+        self._next_screens = {}
+        self._screens = {}
+        self._pending = set()
+
+    def register(self, name, factory, next_screen=None):
+        """Register a screen factory
+
+        Args:
+            name: Screen name
+            factory: Function that takes the parent widget and returns the screen
+            next_screen: Name of the screen likely to be shown after this one
+        """
+        self._factories[name] = factory
+        self._next_screens[name] = next_screen
+
+    def register_defaults(self):
+        """Register the standard character creation screens"""
+        for name, factory, next_screen in DEFAULT_SCREENS:
+            self.register(name, factory, next_screen)
+
+    def is_built(self, name):
+        """Check if a screen has already been built
+
+        Args:
+            name: Screen name
+
+        Returns:
+            True if the screen is cached, False otherwise
+        """
+        return name in self._screens
+
+    def get(self, name):
+        """Get a screen, building it if needed
+
+        Args:
+            name: Screen name
+
+        Returns:
+            Screen widget
+
+        Raises:
+            KeyError: If no screen is registered under the name
+        """
+        screen = self._screens.get(name)
+        if screen is None:
+            with instrumentation.measure(CATEGORY_SCREEN, name):
+                screen = self._factories[name](self.parent)
+            self._screens[name] = screen
+            self.stacked_widget.addWidget(screen)
+        return screen
+
+    def get_next(self, name):
+        """Get the name of the screen likely to follow another
+
+        Args:
+            name: Screen name
+
+        Returns:
+            Next screen name or None
+        """
+        return self._next_screens.get(name)
+
+    def preload(self, name, delay=None):
+        """Build a screen in the background once the event loop is idle
+
+        Args:
+            name: Screen name
+            delay: Milliseconds to wait first (default: config.SCREEN_PRELOAD_DELAY)
+        """
+        if not name or name not in self._factories or name in self._screens or name in self._pending:
+            return
+
+        if delay is None:
+            delay = config.SCREEN_PRELOAD_DELAY
+
+        self._pending.add(name)
+        QTimer.singleShot(delay, lambda: self._build_pending(name))
+
+    def preload_next(self, name):
+        """Preload the screen likely to follow another
+
+        Args:
+            name: Name of the screen being shown
+        """
+        self.preload(self.get_next(name))
+
+    def _build_pending(self, name):
+        """Build a preloaded screen unless it was built or dropped meanwhile
+
+        Args:
+            name: Screen name
+        """
+        if name in self._pending:
+            self._pending.discard(name)
+            self.get(name)
+
+    def discard(self, name):
+        """Drop a cached screen so the next request builds a fresh one
+
+        Args:
+            name: Screen name
+        """
+        self._pending.discard(name)
+        screen = self._screens.pop(name, None)
+        if screen is not None:
+            self.stacked_widget.removeWidget(screen)
+            screen.deleteLater()
+
+    def clear(self, keep=()):
+        """Drop every cached screen
+
+        Args:
+            keep: Names of screens to keep
+        """
+        for name in list(self._screens) + list(self._pending):
+            if name not in keep:
+                self.discard(name)
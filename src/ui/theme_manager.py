@@ -2,25 +2,68 @@
 theme_manager_fixed.py - Theme management for the application with better font handling
 """
 
-from PyQt6.QtGui import QPalette, QColor, QFont, QFontDatabase
+from PyQt6.QtCore import QObject, QEvent, QFile
+from PyQt6.QtGui import QPalette, QColor, QFont, QFontDatabase, QFontMetrics
 from PyQt6.QtWidgets import QApplication
 import src.config as config
+from src.utils.theme_cache import compile_theme, load_theme_cache
+from src.utils.resource_backend import resource_backend
 import os
 
+# Font sizes used across the screens, resolved ahead of time
+COMMON_FONT_SIZES = (12, 16, 24, 32)
+
+# Font files registered with the font database this process, mapped to their family
+_registered_fonts = {}
+
+# Widget property recording which theme a window was last styled with
+THEME_PROPERTY = "appliedTheme"
+
+
+class ThemeEventFilter(QObject):
+    """Applies the current theme to windows as they are shown"""
+
+    def __init__(self, theme_manager):
+        super().__init__()
+        self.theme_manager = theme_manager
+
+    def eventFilter(self, obj, event):
+        """Style top-level windows on their show event"""
+        if event.type() == QEvent.Type.Show and obj.isWidgetType() and obj.isWindow():
+            self.theme_manager.apply_to_widget(obj)
+        return False
+
 
 class ThemeManager:
     """Manages application themes and styling"""
 
     def __init__(self):
         self.current_theme = config.DEFAULT_THEME
+        self._applied_theme = None
+
+        # Compiled themes and palettes, built once per theme
+        self._compiled_themes = None
+        self._palettes = {}
+        self._theme_filter = None
+
+        # Fonts and metrics keyed by (family, size, bold)
+        self._fonts = {}
+        self._font_metrics = {}
+
         self._setup_fonts()
 
     def _setup_fonts(self):
         """Load custom fonts for the application"""
+        military_font_path = resource_backend.resolve(config.MILITARY_FONT) or config.MILITARY_FONT
+
+        # Fonts are only registered once per process
+        if military_font_path in _registered_fonts:
+            config.MILITARY_FONT_FAMILY = _registered_fonts[military_font_path]
+            return
+
         try:
-            # Check if font file exists
-            military_font_path = config.MILITARY_FONT
-            if not os.path.exists(military_font_path):
+            # Check if font file exists (in the resource bundle or on disk)
+            if not QFile.exists(military_font_path):
                 print(f"Error: Could not load font {military_font_path}")
                 # Fallback to a system font
                 config.MILITARY_FONT_FAMILY = "Courier New"
@@ -44,6 +87,8 @@ class ThemeManager:
             # Fallback to a system font that might look military-ish
             config.MILITARY_FONT_FAMILY = "Courier New"
 
+        _registered_fonts[military_font_path] = config.MILITARY_FONT_FAMILY
+
     def get_theme_data(self, theme_name=None):
         """Get the data for a specific theme"""
         if theme_name is None:
@@ -64,102 +109,143 @@ class ThemeManager:
         theme_data = self.get_theme_data()
 
         # Apply the theme to the application
-        self._apply_theme(theme_data)
+        self._apply_theme(theme_name)
 
         # Return the theme data in case it's needed
         return theme_data
 
-    def _apply_theme(self, theme_data):
+    def _get_compiled_theme(self, theme_name):
+        """Get a compiled theme, from the cache file or compiled on first use"""
+        if self._compiled_themes is None:
+            self._compiled_themes = load_theme_cache()
+
+        compiled = self._compiled_themes.get(theme_name)
+        if compiled is None:
+            compiled = compile_theme(config.THEMES[theme_name])
+            self._compiled_themes[theme_name] = compiled
+
+        return compiled
+
+    def get_palette(self, theme_name=None):
+        """Get the prebuilt palette for a theme"""
+        if theme_name is None:
+            theme_name = self.current_theme
+
+        palette = self._palettes.get(theme_name)
+        if palette is None:
+            palette = QPalette()
+            for role, color in self._get_compiled_theme(theme_name)["palette"].items():
+                palette.setColor(getattr(QPalette.ColorRole, role), QColor(color))
+            self._palettes[theme_name] = palette
+
+        return palette
+
+    def get_stylesheet(self, theme_name=None):
+        """Get the prebuilt stylesheet for a theme"""
+        if theme_name is None:
+            theme_name = self.current_theme
+
+        return self._get_compiled_theme(theme_name)["stylesheet"]
+
+    def _apply_theme(self, theme_name):
         """Apply theme to the application"""
         app = QApplication.instance()
         if not app:
             print("Warning: No QApplication instance found")
             return
 
-        # Create a palette for the theme
-        palette = QPalette()
-
-        # Set palette colors
-        palette.setColor(QPalette.ColorRole.Window, QColor(theme_data["primary_bg"]))
-        palette.setColor(QPalette.ColorRole.WindowText, QColor(theme_data["text"]))
-        palette.setColor(QPalette.ColorRole.Base, QColor(theme_data["secondary_bg"]))
-        palette.setColor(QPalette.ColorRole.AlternateBase, QColor(theme_data["accent"]))
-        palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(theme_data["secondary_bg"]))
-        palette.setColor(QPalette.ColorRole.ToolTipText, QColor(theme_data["text"]))
-        palette.setColor(QPalette.ColorRole.Text, QColor(theme_data["text"]))
-        palette.setColor(QPalette.ColorRole.Button, QColor(theme_data["button_bg"]))
-        palette.setColor(QPalette.ColorRole.ButtonText, QColor(theme_data["button_text"]))
-        palette.setColor(QPalette.ColorRole.Highlight, QColor(theme_data["highlight"]))
-        palette.setColor(QPalette.ColorRole.HighlightedText, QColor(theme_data["button_text"]))
-
-        # Apply the palette to the application
-        app.setPalette(palette)
-
-        # Create a stylesheet for additional styling
-        stylesheet = f"""
-        QMainWindow, QDialog {{
-            background-color: {theme_data["primary_bg"]};
-        }}
-
-        QLabel {{
-            color: {theme_data["text"]};
-        }}
-
-        QPushButton {{
-            background-color: {theme_data["button_bg"]};
-            color: {theme_data["button_text"]};
-            border: 1px solid {theme_data["border"]};
-            padding: 5px 10px;
-            border-radius: 3px;
-        }}
-
-        QPushButton:hover {{
-            background-color: {theme_data["highlight"]};
-        }}
-
-        QPushButton:pressed {{
-            background-color: {theme_data["accent"]};
-        }}
-
-        QLineEdit, QTextEdit, QComboBox {{
-            background-color: {theme_data["secondary_bg"]};
-            color: {theme_data["text"]};
-            border: 1px solid {theme_data["border"]};
-            padding: 2px;
-        }}
-
-        QScrollBar {{
-            background-color: {theme_data["primary_bg"]};
-        }}
-
-        QScrollBar::handle {{
-            background-color: {theme_data["accent"]};
-        }}
-        """
+        # Fonts can be resolved once the application exists
+        self._precompute_font_metrics()
 
-        # Apply the stylesheet
-        app.setStyleSheet(stylesheet)
+        # Nothing to do if the theme is already applied
+        if theme_name == self._applied_theme:
+            return
+        self._applied_theme = theme_name
+
+        # Swap in the prebuilt palette
+        app.setPalette(self.get_palette(theme_name))
+
+        if config.THEME_REPOLISH_VISIBLE_ONLY:
+            # Restyle visible windows now and the rest when they are shown
+            if self._theme_filter is None:
+                self._theme_filter = ThemeEventFilter(self)
+                app.installEventFilter(self._theme_filter)
+
+            for window in app.topLevelWidgets():
+                if window.isVisible():
+                    self.apply_to_widget(window)
+        else:
+            # Apply the stylesheet
+            app.setStyleSheet(self.get_stylesheet(theme_name))
+
+    def apply_to_widget(self, widget):
+        """Apply the current theme's stylesheet to a window unless it already has it"""
+        if widget.property(THEME_PROPERTY) != self.current_theme:
+            widget.setProperty(THEME_PROPERTY, self.current_theme)
+            widget.setStyleSheet(self.get_stylesheet())
+
+    def _get_cached_font(self, family, size, bold, fallback=None):
+        """Get a font from the cache, resolving it on first use
+
+        Args:
+            family: Font family
+            size: Point size
+            bold: Whether the font is bold
+            fallback: Family to use if the requested one has no exact match
+
+        Returns:
+            The cached QFont (callers should copy it before changing it)
+        """
+        key = (family, size, bold)
+        font = self._fonts.get(key)
+        if font is None:
+            font = QFont(family, size)
 
-    def get_military_font(self, size=12, bold=False):
-        """Get the military font at a specific size"""
-        # First try to create a font from the military font family
-        font = QFont(config.MILITARY_FONT_FAMILY, size)
+            # If that fails, fallback to the given family
+            if fallback and not font.exactMatch():
+                font = QFont(fallback, size)
 
-        # If that fails, fallback to a system monospace font
-        if not font.exactMatch():
-            font = QFont("Courier New", size)
+            if bold:
+                font.setBold(True)
 
-        if bold:
-            font.setBold(True)
+            self._fonts[key] = font
 
         return font
 
+    def get_military_font(self, size=12, bold=False):
+        """Get the military font at a specific size"""
+        # Fall back to a system monospace font if the military font is missing
+        return QFont(self._get_cached_font(config.MILITARY_FONT_FAMILY, size, bold, "Courier New"))
+
     def get_default_font(self, size=12, bold=False):
         """Get the default font at a specific size"""
-        font = QFont(config.DEFAULT_FONT, size)
-        if bold:
-            font.setBold(True)
-        return font
+        return QFont(self._get_cached_font(config.DEFAULT_FONT, size, bold))
+
+    def get_font_metrics(self, size=12, bold=False, military=True):
+        """Get the metrics of the military or default font at a specific size"""
+        family = config.MILITARY_FONT_FAMILY if military else config.DEFAULT_FONT
+        key = (family, size, bold)
+
+        metrics = self._font_metrics.get(key)
+        if metrics is None:
+            if military:
+                font = self._get_cached_font(family, size, bold, "Courier New")
+            else:
+                font = self._get_cached_font(family, size, bold)
+            metrics = QFontMetrics(font)
+            self._font_metrics[key] = metrics
+
+        return metrics
+
+    def _precompute_font_metrics(self):
+        """Resolve the fonts and metrics for the sizes the screens use"""
+        if self._font_metrics:
+            return
+
+        for size in COMMON_FONT_SIZES:
+            for bold in (False, True):
+                self.get_font_metrics(size, bold)
+                self.get_font_metrics(size, bold, military=False)
 
 
 # Create a global instance for easy access
@@ -0,0 +1,299 @@
+"""
+asset_manifest.py - Manifest of asset files, served from memory
+"""
+
+import os
+import json
+import fnmatch
+import hashlib
+
+import src.config as config
+
+# Project root (the folder that holds src)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Folders searched for assets, in order; the first match wins
+SEARCH_ROOTS = (PROJECT_ROOT, os.path.join(PROJECT_ROOT, "src"))
+
+MANIFEST_VERSION = 1
+
+
+def _normalize(path):
+    """Turn an asset path into a manifest key (e.g., "src/assets/x.png" -> "assets/x.png")
+
+    Args:
+        path: Asset path relative to the project root (or absolute)
+
+    Returns:
+        Key with forward slashes, relative to a search root
+    """
+    path = os.path.normpath(path)
+    if os.path.isabs(path):
+        for root in sorted(SEARCH_ROOTS, key=len, reverse=True):
+            if path.startswith(root + os.sep):
+                path = os.path.relpath(path, root)
+                break
+
+    key = path.replace(os.sep, "/")
+    if key.startswith("src/assets/"):
+        key = key[len("src/"):]
+    return key
+
+
+def hash_file(path):
+    """Get the SHA-256 digest of a file
+
+    Args:
+        path: File path
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def scan_assets(roots=SEARCH_ROOTS, with_hashes=True):
+    """Walk the assets folders and describe every file
+
+    Args:
+        roots: Folders that hold an "assets" folder, in search order
+        with_hashes: Whether to hash file contents (slow for large files)
+
+    Returns:
+        Dictionary mapping asset key (e.g., "assets/sounds/dice_roll.wav") to a
+        dictionary with "path" (absolute), "size", "mtime" and "sha256"
+    """
+    manifest_path = os.path.abspath(get_manifest_path())
+    assets = {}
+
+    for root in roots:
+        assets_dir = os.path.join(root, "assets")
+        for directory, _, files in os.walk(assets_dir):
+            for file_name in sorted(files):
+                path = os.path.abspath(os.path.join(directory, file_name))
+                if path == manifest_path:
+                    continue
+
+                key = _normalize(os.path.relpath(path, root))
+                if key in assets:
+                    continue
+
+                stat = os.stat(path)
+                assets[key] = {
+                    "path": path,
+                    "size": stat.st_size,
+                    "mtime": stat.st_mtime,
+                    "sha256": hash_file(path) if with_hashes else None
+                }
+
+    return assets
+
+
+def get_manifest_path():
+    """Get the absolute path of the manifest file"""
+    path = config.ASSET_MANIFEST_FILE
+    if not os.path.isabs(path):
+        path = os.path.join(PROJECT_ROOT, path)
+    return path
+
+
+def build_manifest(path=None):
+    """Scan the assets and write the manifest file
+
+    Args:
+        path: Manifest file path (default: config.ASSET_MANIFEST_FILE)
+
+    Returns:
+        True if the manifest was written, False otherwise
+    """
+    if path is None:
+        path = get_manifest_path()
+
+    data = {
+        "version": MANIFEST_VERSION,
+        "roots": list(SEARCH_ROOTS),
+        "assets": scan_assets()
+    }
+
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+        return True
+    except Exception as e:
+        print(f"Error writing asset manifest {path}: {e}")
+        return False
+
+
+class AssetManifest:
+    """Answers asset lookups from memory
+
+    The manifest written by build.py is loaded on the first lookup. If there
+    is no usable manifest, or it was built for another location, the assets
+    are scanned once instead (without hashing). Paths not in the manifest are
+    checked on disk once and the answer is remembered, so repeated lookups
+    never touch the filesystem. In debug mode, refresh() rescans after assets
+    change on disk.
+    """
+
+    def __init__(self, path=None):
+        """Initialize the asset manifest
+
+        Args:
+            path: Manifest file path (default: config.ASSET_MANIFEST_FILE)
+        """
+        self.path = path
+        self.assets = None
+        self.source = None  # "manifest" or "scan"
+        self._extra = {}  # Paths outside the manifest -> absolute path or None
+        self._listeners = []
+
+    def load(self):
+        """Load the manifest file, scanning the assets if it can't be used"""
+        self._extra.clear()
+        path = self.path or get_manifest_path()
+
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+
+            if data.get("version") == MANIFEST_VERSION and data.get("roots") == list(SEARCH_ROOTS):
+                self.assets = data.get("assets", {})
+                self.source = "manifest"
+                return
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error reading asset manifest {path}: {e}")
+
+        self.assets = scan_assets(with_hashes=False)
+        self.source = "scan"
+
+    def _ensure_loaded(self):
+        """Load the manifest on first use"""
+        if self.assets is None:
+            self.load()
+
+    def get_entry(self, path):
+        """Get the manifest entry of an asset
+
+        Args:
+            path: Asset path relative to the project root (e.g., "assets/images/icons/dice.png")
+
+        Returns:
+            Dictionary with "path", "size", "mtime" and "sha256", or None if not listed
+        """
+        self._ensure_loaded()
+        return self.assets.get(_normalize(path))
+
+    def resolve(self, path):
+        """Get the absolute path of an asset
+
+        Args:
+            path: Asset path relative to the project root, or an absolute path
+
+        Returns:
+            Absolute path to an existing file, or None if not found
+        """
+        if not path:
+            return None
+
+        entry = self.get_entry(path)
+        if entry is not None:
+            return entry["path"]
+
+        if path in self._extra:
+            return self._extra[path]
+
+        # Not a listed asset; check the disk once
+        resolved = None
+        candidates = [path] if os.path.isabs(path) else [os.path.join(root, path) for root in SEARCH_ROOTS]
+        for candidate in candidates:
+            if os.path.isfile(candidate):
+                resolved = os.path.abspath(candidate)
+                break
+
+        self._extra[path] = resolved
+        return resolved
+
+    def exists(self, path):
+        """Check if an asset exists
+
+        Args:
+            path: Asset path relative to the project root
+
+        Returns:
+            True if the asset exists, False otherwise
+        """
+        return self.resolve(path) is not None
+
+    def find(self, asset_type, pattern="*"):
+        """Find assets of a type matching a pattern
+
+        Args:
+            asset_type: Type of asset (fonts, images, sounds, music)
+            pattern: Glob pattern matched against the path within the type folder
+
+        Returns:
+            Sorted list of absolute paths
+        """
+        self._ensure_loaded()
+        prefix = f"assets/{asset_type}/"
+        return sorted(
+            entry["path"] for key, entry in self.assets.items()
+            if key.startswith(prefix) and fnmatch.fnmatch(key[len(prefix):], pattern)
+        )
+
+    def add_refresh_listener(self, callback):
+        """Call a function after the manifest is refreshed
+
+        Args:
+            callback: Function taking no arguments
+        """
+        self._listeners.append(callback)
+
+    def refresh(self):
+        """Rescan the assets (for debug mode, after files change on disk)"""
+        self.assets = scan_assets(with_hashes=False)
+        self.source = "scan"
+        self._extra.clear()
+
+        for callback in self._listeners:
+            callback()
+
+    def watch(self, parent=None):
+        """Refresh whenever an asset file or folder changes (debug mode only)
+
+        Args:
+            parent: Qt parent for the watcher
+
+        Returns:
+            QFileSystemWatcher, or None if not in debug mode
+        """
+        if not config.DEBUG_MODE:
+            return None
+
+        from PyQt6.QtCore import QFileSystemWatcher
+
+        directories = []
+        for root in SEARCH_ROOTS:
+            for directory, _, _ in os.walk(os.path.join(root, "assets")):
+                directories.append(directory)
+
+        self._ensure_loaded()
+        files = [entry["path"] for entry in self.assets.values()]
+
+        watcher = QFileSystemWatcher(directories + files, parent)
+        watcher.directoryChanged.connect(lambda directory: self.refresh())
+        watcher.fileChanged.connect(lambda file_path: self.refresh())
+        return watcher
+
+
+# Create a global instance for easy access
+asset_manifest = AssetManifest()
@@ -2,42 +2,186 @@
 audio_manager.py - Audio management for the application
 """
 
-import os
-from PyQt6.QtCore import QUrl, QObject
-from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput, QMediaDevices
+from PyQt6.QtCore import QObject
+from PyQt6.QtGui import QGuiApplication
 import src.config as config
+from src.utils.resource_backend import resource_backend
+from src.utils.audio_scheduler import AudioScheduler
+
+# Qt platforms that have no display, where audio is skipped as well
+HEADLESS_PLATFORMS = ("offscreen", "minimal")
+
+
+class NullAudioBackend:
+    """Audio backend that plays nothing
+
+    Used when running headless, when there are no output devices, or when
+    Qt Multimedia isn't available, so callers never need to check.
+    """
+
+    name = "null"
+
+    def prepare_music(self, music_file):
+        pass
+
+    def play_music(self, music_file, loop=True):
+        pass
+
+    def stop_music(self):
+        pass
+
+    def preload_sounds(self, sound_keys):
+        pass
+
+    def play_sound(self, sound_key):
+        pass
+
+    def stop_sounds(self):
+        pass
+
+    def set_master_volume(self, volume):
+        pass
+
+    def set_sfx_volume(self, volume):
+        pass
+
+
+class QtAudioBackend:
+    """Audio backend that plays through Qt Multimedia"""
+
+    name = "qt"
+
+    def __init__(self, master_volume, sfx_volume):
+        """Initialize the Qt Multimedia backend
+
+        Args:
+            master_volume: Music volume (0.0 to 1.0)
+            sfx_volume: Sound effects volume (0.0 to 1.0)
+        """
+        from src.utils.music_engine import MusicEngine
+        from src.utils.sfx_engine import SfxEngine
+
+        # Background music on two decks (QMediaPlayer each) for crossfades
+        self.music_engine = MusicEngine(volume=master_volume)
+
+        # Sound effects play from preloaded voices
+        self.sfx_engine = SfxEngine(volume=sfx_volume)
+
+    def prepare_music(self, music_file):
+        """Buffer a music file so it can start without delay"""
+        self.music_engine.prepare(music_file)
+
+    def play_music(self, music_file, loop=True):
+        """Play a music file, crossfading from the current one
+
+        Args:
+            music_file: Path to the music file
+            loop: Whether to loop the music
+        """
+        self.music_engine.play(music_file, loop)
+
+    def stop_music(self):
+        """Stop currently playing music"""
+        self.music_engine.stop()
+
+    def preload_sounds(self, sound_keys):
+        """Decode sound effects ahead of their first use"""
+        self.sfx_engine.preload(sound_keys)
+
+    def play_sound(self, sound_key):
+        """Play a sound effect"""
+        self.sfx_engine.play(sound_key)
+
+    def stop_sounds(self):
+        """Stop every playing sound effect"""
+        self.sfx_engine.stop_all()
+
+    def set_master_volume(self, volume):
+        """Set the master volume (0.0 to 1.0)"""
+        self.music_engine.set_volume(volume)
+
+    def set_sfx_volume(self, volume):
+        """Set the sound effects volume (0.0 to 1.0)"""
+        self.sfx_engine.set_volume(volume)
+
+
+def is_headless():
+    """Check if the application is running without a display
+
+    Returns:
+        True if there is no GUI application or it runs on a headless platform
+    """
+    app = QGuiApplication.instance()
+    if not isinstance(app, QGuiApplication):
+        return True
+    return QGuiApplication.platformName() in HEADLESS_PLATFORMS
+
+
+def create_audio_backend(master_volume, sfx_volume):
+    """Create the best available audio backend
+
+    Args:
+        master_volume: Music volume (0.0 to 1.0)
+        sfx_volume: Sound effects volume (0.0 to 1.0)
+
+    Returns:
+        QtAudioBackend, or NullAudioBackend if audio isn't possible or wanted
+    """
+    if config.AUDIO_BACKEND == "null":
+        return NullAudioBackend()
+
+    if config.AUDIO_BACKEND == "auto" and is_headless():
+        return NullAudioBackend()
+
+    try:
+        from PyQt6.QtMultimedia import QMediaDevices
+
+        if not QMediaDevices.audioOutputs():
+            print("Warning: No audio output devices found")
+            return NullAudioBackend()
+
+        return QtAudioBackend(master_volume, sfx_volume)
+    except Exception as e:
+        print(f"Warning: Audio disabled, could not start Qt Multimedia: {e}")
+        return NullAudioBackend()
+
 
 class AudioManager(QObject):
-    """Manages audio playback for the application"""
+    """Manages audio playback for the application
+
+    The audio backend is only created on the first play request, so importing
+    this module costs nothing and code that never plays audio never touches
+    Qt Multimedia.
+    """
 
     def __init__(self):
         super().__init__()
+        self._backend = None
+        self.master_volume = config.MASTER_VOLUME
+        self.sfx_volume = config.SFX_VOLUME
 
-        # Set up audio output
-        self.audio_output = QAudioOutput()
-        self.audio_output.setVolume(config.MASTER_VOLUME)
+        # Drops requests too close together or held off by higher priority sounds
+        self.scheduler = AudioScheduler()
 
-        # Set up media player for background music
-        self.music_player = QMediaPlayer()
-        self.music_player.setAudioOutput(self.audio_output)
-
-        # Set up media player for sound effects
-        self.sfx_player = QMediaPlayer()
-        self.sfx_output = QAudioOutput()
-        self.sfx_output.setVolume(config.SFX_VOLUME)
-        self.sfx_player.setAudioOutput(self.sfx_output)
+        # Sounds to decode as soon as the backend exists
+        self._pending_preload = []
 
         # Track currently playing music
         self.current_music = None
 
-        # Check for available audio devices
-        self._check_audio_devices()
+    @property
+    def backend(self):
+        """Get the audio backend, creating it on first use"""
+        if self._backend is None:
+            self._backend = create_audio_backend(self.master_volume, self.sfx_volume)
+            if self._pending_preload:
+                self._backend.preload_sounds(self._pending_preload)
+                self._pending_preload = []
+        return self._backend
 
-    def _check_audio_devices(self):
-        """Check for available audio devices"""
-        devices = QMediaDevices.audioOutputs()
-        if not devices:
-            print("Warning: No audio output devices found")
+    def is_started(self):
+        """Check if the audio backend has been created"""
+        return self._backend is not None
 
     def play_music(self, music_key, loop=True):
         """Play background music
@@ -54,47 +198,69 @@ class AudioManager(QObject):
             return
 
         # Get the music file path
-        music_file = config.AUDIO_FILES[music_key]
+        music_file = resource_backend.resolve(config.AUDIO_FILES[music_key])
 
         # Check if file exists
-        if not os.path.exists(music_file):
-            print(f"Warning: Music file '{music_file}' not found")
+        if music_file is None:
+            print(f"Warning: Music file '{config.AUDIO_FILES[music_key]}' not found")
             return
 
-        # Stop any currently playing music
-        self.stop_music()
-
-        # Set the source and play
-        self.music_player.setSource(QUrl.fromLocalFile(music_file))
-        self.music_player.play()
+        # Music cues hold off clicks and dice for a moment
+        if not self.scheduler.request(music_key):
+            return
 
-        # Set up looping if requested
-        if loop:
-            self.music_player.mediaStatusChanged.connect(self._on_music_status_changed)
+        self.backend.play_music(music_file, loop)
 
         # Track the current music
         self.current_music = music_key
 
-    def _on_music_status_changed(self, status):
-        """Handle music player status changes for looping"""
-        if status == QMediaPlayer.MediaStatus.EndOfMedia:
-            # Restart the music from the beginning
-            self.music_player.setPosition(0)
-            self.music_player.play()
+    def prepare_music(self, music_key):
+        """Buffer background music so it can start without delay
+
+        Does nothing until audio has started.
+
+        Args:
+            music_key: Key to audio file in config.AUDIO_FILES
+        """
+        if self._backend is None or not config.ENABLE_MUSIC:
+            return
+
+        music_file = resource_backend.resolve(config.AUDIO_FILES.get(music_key))
+        if music_file:
+            self._backend.prepare_music(music_file)
+
+    def play_theme_music(self, theme_name):
+        """Play the music for a theme
+
+        Args:
+            theme_name: Theme name from config.THEMES
+        """
+        music_key = config.THEME_MUSIC.get(theme_name)
+        if music_key and music_key != self.current_music:
+            self.play_music(music_key)
 
     def stop_music(self):
         """Stop currently playing music"""
-        self.music_player.stop()
-
-        # Disconnect any connected signals to avoid multiple connections
-        try:
-            self.music_player.mediaStatusChanged.disconnect()
-        except TypeError:
-            # No connections to disconnect
-            pass
+        if self._backend is not None:
+            self._backend.stop_music()
 
         self.current_music = None
 
+    def preload_sounds(self, sound_keys=None):
+        """Decode sound effects ahead of their first use
+
+        If audio hasn't started yet, the sounds are decoded when it does.
+
+        Args:
+            sound_keys: Keys to audio files in config.AUDIO_FILES (default: config.SFX_PRELOAD)
+        """
+        sound_keys = list(config.SFX_PRELOAD if sound_keys is None else sound_keys)
+
+        if self._backend is None:
+            self._pending_preload.extend(key for key in sound_keys if key not in self._pending_preload)
+        else:
+            self._backend.preload_sounds(sound_keys)
+
     def play_sound(self, sound_key):
         """Play a sound effect
 
@@ -104,29 +270,22 @@ class AudioManager(QObject):
         if not config.ENABLE_SFX:
             return
 
-        if sound_key not in config.AUDIO_FILES:
-            print(f"Warning: Sound key '{sound_key}' not found in audio files")
-            return
-
-        # Get the sound file path
-        sound_file = config.AUDIO_FILES[sound_key]
-
-        # Check if file exists
-        if not os.path.exists(sound_file):
-            print(f"Warning: Sound file '{sound_file}' not found")
+        if not self.scheduler.request(sound_key):
             return
 
-        # Set the source and play
-        self.sfx_player.setSource(QUrl.fromLocalFile(sound_file))
-        self.sfx_player.play()
+        self.backend.play_sound(sound_key)
 
     def set_master_volume(self, volume):
         """Set the master volume (0.0 to 1.0)"""
-        self.audio_output.setVolume(volume)
+        self.master_volume = volume
+        if self._backend is not None:
+            self._backend.set_master_volume(volume)
 
     def set_sfx_volume(self, volume):
         """Set the sound effects volume (0.0 to 1.0)"""
-        self.sfx_output.setVolume(volume)
+        self.sfx_volume = volume
+        if self._backend is not None:
+            self._backend.set_sfx_volume(volume)
 
     def enable_music(self, enable=True):
         """Enable or disable music"""
@@ -137,6 +296,8 @@ class AudioManager(QObject):
     def enable_sfx(self, enable=True):
         """Enable or disable sound effects"""
         config.ENABLE_SFX = enable
+        if not enable and self._backend is not None:
+            self._backend.stop_sounds()
 
 # Create a global instance for easy access
-audio_manager = AudioManager()
\ No newline at end of file
+audio_manager = AudioManager()
@@ -0,0 +1,101 @@
+"""
+audio_scheduler.py - Rate limiting and prioritizing of audio requests
+"""
+
+import time
+
+import src.config as config
+
+# Priority classes, lowest first
+PRIORITY_CLASSES = ("ui", "dice", "music")
+
+
+class AudioScheduler:
+    """Decides which audio requests are worth playing
+
+    Requests for the same sound closer together than its minimum interval
+    are coalesced into the one already playing. Each sound belongs to a
+    priority class (UI click < dice < music cue): after a sound starts,
+    requests from lower classes are dropped for a short hold time, so a
+    burst of clicks can't step on a dice roll or a music cue.
+
+    Checks are a clock read and a few dictionary lookups, so rejected
+    requests cost the UI thread almost nothing.
+    """
+
+    def __init__(self, min_intervals=None, priorities=None, priority_hold=None, clock=time.monotonic):
+        """Initialize the audio scheduler
+
+        Args:
+            min_intervals: Dictionary of sound key to minimum milliseconds between plays
+                (default: config.AUDIO_MIN_INTERVALS)
+            priorities: Dictionary of sound key to priority class (default: config.AUDIO_PRIORITIES)
+            priority_hold: Milliseconds lower classes are held off after a sound starts
+                (default: config.AUDIO_PRIORITY_HOLD)
+            clock: Function returning the time in seconds
+        """
+        self.min_intervals = config.AUDIO_MIN_INTERVALS if min_intervals is None else min_intervals
+        self.priorities = config.AUDIO_PRIORITIES if priorities is None else priorities
+        self.priority_hold = (config.AUDIO_PRIORITY_HOLD if priority_hold is None else priority_hold) / 1000
+        self.clock = clock
+
+        self._last_played = {}  # sound key -> time it last played
+        self._hold_level = -1  # Priority level currently holding off lower classes
+        self._hold_until = 0.0
+        self.coalesced = {}  # sound key -> number of requests coalesced or dropped
+
+    def get_priority(self, sound_key):
+        """Get the priority level of a sound
+
+        Args:
+            sound_key: Key to audio file in config.AUDIO_FILES
+
+        Returns:
+            Index into PRIORITY_CLASSES (unknown sounds count as UI sounds)
+        """
+        priority_class = self.priorities.get(sound_key, PRIORITY_CLASSES[0])
+        if priority_class in PRIORITY_CLASSES:
+            return PRIORITY_CLASSES.index(priority_class)
+        return 0
+
+    def request(self, sound_key):
+        """Ask to play a sound now
+
+        Args:
+            sound_key: Key to audio file in config.AUDIO_FILES
+
+        Returns:
+            True if the sound should be played, False if it was coalesced or held off
+        """
+        now = self.clock()
+        level = self.get_priority(sound_key)
+
+        # Held off by a higher priority sound that just started
+        if level < self._hold_level and now < self._hold_until:
+            self._count_coalesced(sound_key)
+            return False
+
+        # Too soon after the same sound
+        interval = self.min_intervals.get(sound_key, 0) / 1000
+        last_played = self._last_played.get(sound_key)
+        if last_played is not None and now - last_played < interval:
+            self._count_coalesced(sound_key)
+            return False
+
+        self._last_played[sound_key] = now
+        if level >= self._hold_level or now >= self._hold_until:
+            self._hold_level = level
+            self._hold_until = now + self.priority_hold
+
+        return True
+
+    def _count_coalesced(self, sound_key):
+        """Count a request that wasn't played"""
+        self.coalesced[sound_key] = self.coalesced.get(sound_key, 0) + 1
+
+    def reset(self):
+        """Forget every played sound and hold"""
+        self._last_played.clear()
+        self._hold_level = -1
+        self._hold_until = 0.0
+        self.coalesced.clear()
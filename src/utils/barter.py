@@ -0,0 +1,224 @@
+"""
+barter.py - Barter valuation of character inventories
+"""
+
+import re
+from functools import lru_cache
+
+from src.data.game_data import EXCHANGE_RATES, GEAR_EXCHANGE_ALIASES, GEAR_EXCHANGE_PREFIX_ALIASES
+from src.utils.gear_parser import ItemStack, ItemNode, QuantityNode, BundleNode, ChoiceNode, parse_gear
+
+# Anything that is not a letter, digit, dot or space
+NON_WORD_PATTERN = re.compile(r"[^a-z0-9. ]+")
+
+
+@lru_cache(maxsize=None)
+def normalize_item_name(name):
+    """Normalize an item name for price lookups
+
+    Lower-cases the name, drops punctuation and strips plural endings,
+    so "Personal Medkits" and "personal medkit" match.
+
+    Args:
+        name: Item name
+
+    Returns:
+        Normalized name
+    """
+    words = NON_WORD_PATTERN.sub(" ", name.lower()).split()
+
+    singular = []
+    for word in words:
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        singular.append(word)
+
+    return " ".join(singular)
+
+
+def _build_price_index():
+    """Build the price index from EXCHANGE_RATES and GEAR_EXCHANGE_ALIASES
+
+    Returns:
+        Tuple of (exact name index, alias list sorted longest first). The index
+        holds (normalized name, (category, item name, value)) entries, and the
+        alias list (normalized alias, whether it matches by prefix, entry) tuples.
+    """
+    index = {}
+    for category, items in EXCHANGE_RATES.items():
+        for item_name, value in items.items():
+            index[normalize_item_name(item_name)] = (category, item_name, value)
+
+    aliases = []
+    for alias, (category, item_name) in GEAR_EXCHANGE_ALIASES.items():
+        value = EXCHANGE_RATES[category][item_name]
+        normalized = normalize_item_name(alias)
+        # Multi-word aliases are specific enough to match the start of a name
+        prefix = " " in normalized or alias in GEAR_EXCHANGE_PREFIX_ALIASES
+        aliases.append((normalized, prefix, (category, item_name, value)))
+
+    # Longest alias first, so "ration of food" wins over "ration"
+    aliases.sort(key=lambda entry: len(entry[0]), reverse=True)
+
+    return index, aliases
+
+
+# Precomputed price index
+PRICE_INDEX, PRICE_ALIASES = _build_price_index()
+
+
+@lru_cache(maxsize=None)
+def lookup_item_price(name):
+    """Look up the exchange category and unit value of an item
+
+    Args:
+        name: Item name (e.g., "Personal medkit", "rations of food")
+
+    Returns:
+        Tuple of (category, exchange item name, unit value), or None if the item
+        has no exchange value
+    """
+    normalized = normalize_item_name(name)
+
+    entry = PRICE_INDEX.get(normalized)
+    if entry:
+        return entry
+
+    # Some aliases also match the start of the name ("reload for each weapon")
+    for alias, prefix, entry in PRICE_ALIASES:
+        if normalized == alias or (prefix and normalized.startswith(alias + " ")):
+            return entry
+
+    return None
+
+
+def _expected_stacks(node):
+    """Get the expected (name, quantity) pairs for an unresolved gear node
+
+    A quantity "for each weapon" is valued as if for one weapon.
+
+    Args:
+        node: ItemNode, QuantityNode, BundleNode or ChoiceNode
+
+    Returns:
+        List of (name, quantity, weight) tuples
+    """
+    if isinstance(node, ItemNode):
+        return [(node.name, 1, 1.0)]
+
+    if isinstance(node, QuantityNode):
+        quantity = node.modifier + node.dice_count * (node.die_size + 1) / 2
+        return [(node.name, quantity, 1.0)]
+
+    if isinstance(node, BundleNode):
+        return [entry for part in node.parts for entry in _expected_stacks(part)]
+
+    if isinstance(node, ChoiceNode):
+        # Every alternative is equally likely
+        weight = 1.0 / len(node.options)
+        return [(name, quantity, weight)
+                for option in node.options
+                for name, quantity, _ in _expected_stacks(option)]
+
+    return []
+
+
+@lru_cache(maxsize=None)
+def _string_stacks(text):
+    """Get the (name, quantity, weight) tuples for a gear string, cached per string
+
+    Args:
+        text: Gear string (e.g., "6 reloads", "D6 rations of food")
+
+    Returns:
+        Tuple of (name, quantity, weight) tuples
+    """
+    return tuple(_expected_stacks(parse_gear(text)))
+
+
+def _inventory_entries(inventory):
+    """Flatten an inventory into (name, quantity) pairs
+
+    Args:
+        inventory: List of ItemStack objects, (name, quantity) tuples or gear strings
+
+    Returns:
+        List of (name, quantity) tuples
+    """
+    entries = []
+    for item in inventory:
+        if isinstance(item, ItemStack):
+            entries.append((item.name, item.quantity))
+        elif isinstance(item, tuple):
+            entries.append(item)
+        else:
+            # Gear strings may hold rolled quantities or even unresolved dice
+            entries.extend((name, quantity * weight) for name, quantity, weight in _string_stacks(item))
+    return entries
+
+
+def get_inventory_value(inventory):
+    """Get the total exchange value of an inventory
+
+    Args:
+        inventory: List of ItemStack objects, (name, quantity) tuples or gear strings
+
+    Returns:
+        Total exchange value
+    """
+    return get_roster_values([inventory])[0]
+
+
+def get_inventory_breakdown(inventory):
+    """Get the exchange value of an inventory by category
+
+    Args:
+        inventory: List of ItemStack objects, (name, quantity) tuples or gear strings
+
+    Returns:
+        Dictionary mapping exchange category to total value
+    """
+    breakdown = {}
+    for name, quantity in _inventory_entries(inventory):
+        entry = lookup_item_price(name)
+        if entry:
+            category, _, value = entry
+            breakdown[category] = breakdown.get(category, 0) + value * quantity
+    return breakdown
+
+
+def get_roster_values(inventories):
+    """Get the exchange value of many inventories in one pass
+
+    Every distinct item name across the roster is priced once, then each
+    inventory is summed from that table.
+
+    Args:
+        inventories: List of inventories (e.g., each character's gear list)
+
+    Returns:
+        List of total exchange values, one per inventory
+    """
+    flattened = [_inventory_entries(inventory) for inventory in inventories]
+
+    # Price each distinct name once for the whole roster
+    prices = {}
+    for entries in flattened:
+        for name, _ in entries:
+            if name not in prices:
+                entry = lookup_item_price(name)
+                prices[name] = entry[2] if entry else 0
+
+    return [sum(prices[name] * quantity for name, quantity in entries) for entries in flattened]
+
+
+def get_character_values(characters):
+    """Get the exchange value of each character's gear
+
+    Args:
+        characters: List of Character objects
+
+    Returns:
+        List of total exchange values, one per character
+    """
+    return get_roster_values([character.gear for character in characters])
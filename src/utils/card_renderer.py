@@ -0,0 +1,360 @@
+"""
+card_renderer.py - Offscreen rendering of quick-reference character cards
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+
+from PyQt6.QtCore import Qt, QRect, QRunnable, QThreadPool
+from PyQt6.QtGui import QImage, QPainter, QColor, QPen
+
+import src.config as config
+
+# Card size in pixels (3.5 x 2.5 inches at 200 DPI)
+CARD_WIDTH = 700
+CARD_HEIGHT = 500
+CARD_MARGIN = 16
+
+# Boxes across the stat row: (caption, key)
+STAT_BOXES = [
+    ("STR", "STR"),
+    ("AGL", "AGL"),
+    ("INT", "INT"),
+    ("EMP", "EMP"),
+    ("CUF", "cuf"),
+    ("HIT", "hit_capacity"),
+    ("STRESS", "stress_capacity")
+]
+
+# Left-aligned, word-wrapped text (mixed flag types have to be combined as ints)
+WRAP_FLAGS = Qt.AlignmentFlag.AlignLeft.value | Qt.TextFlag.TextWordWrap.value
+
+# Skill rows per column
+SKILL_ROWS = 6
+
+# Fonts used on the card: role -> (size, bold)
+CARD_FONTS = {
+    "name": (22, True),
+    "subtitle": (11, False),
+    "caption": (9, True),
+    "stat": (16, True),
+    "body": (11, False)
+}
+
+
+def _build_layout():
+    """Work out where every part of the card goes
+
+    Returns:
+        Dictionary mapping region name to a QRect, or a list of QRects
+    """
+    inner_width = CARD_WIDTH - 2 * CARD_MARGIN
+    layout = {
+        "header": QRect(0, 0, CARD_WIDTH, 70),
+        "name": QRect(CARD_MARGIN, 8, inner_width, 34),
+        "subtitle": QRect(CARD_MARGIN, 42, inner_width, 20)
+    }
+
+    # Stat boxes
+    gap = 8
+    box_width = (inner_width - gap * (len(STAT_BOXES) - 1)) // len(STAT_BOXES)
+    layout["stat_boxes"] = [
+        QRect(CARD_MARGIN + i * (box_width + gap), 82, box_width, 62) for i in range(len(STAT_BOXES))
+    ]
+
+    # Sections below the stats: (caption rect, content rect)
+    top = 156
+    for section, height in (("skills", 6 + SKILL_ROWS * 20), ("specialties", 46), ("gear", 0)):
+        if not height:
+            height = CARD_HEIGHT - CARD_MARGIN - top - 16
+        layout[f"{section}_caption"] = QRect(CARD_MARGIN, top, inner_width, 16)
+        layout[section] = QRect(CARD_MARGIN, top + 16, inner_width, height)
+        top += 16 + height + 8
+
+    return layout
+
+
+class CardRenderer:
+    """Draws character cards onto images without any widgets
+
+    The layout, fonts and the theme's background layer (colors, frames and
+    captions) are built once and shared by every card, so rendering a card
+    only draws the character's own values.
+    """
+
+    def __init__(self, theme_name=None):
+        """Initialize the card renderer
+
+        Needs a QGuiApplication (see main for headless use).
+
+        Args:
+            theme_name: Theme from config.THEMES (default: config.DEFAULT_THEME)
+        """
+        from src.ui.theme_manager import theme_manager
+
+        self.theme = config.THEMES.get(theme_name or config.DEFAULT_THEME, config.THEMES[config.DEFAULT_THEME])
+        self.layout = _build_layout()
+
+        # Resolve fonts once through the theme manager's font cache
+        self.fonts = {
+            role: theme_manager.get_military_font(size, bold)
+            for role, (size, bold) in CARD_FONTS.items()
+        }
+
+        self.background = self._build_background()
+
+    def _build_background(self):
+        """Draw the parts of the card that are the same for every character
+
+        Returns:
+            QImage background layer
+        """
+        image = QImage(CARD_WIDTH, CARD_HEIGHT, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(QColor(self.theme["primary_bg"]))
+
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+
+        # Header band and frame
+        painter.fillRect(self.layout["header"], QColor(self.theme["secondary_bg"]))
+        painter.setPen(QPen(QColor(self.theme["border"]), 3))
+        painter.drawRect(QRect(1, 1, CARD_WIDTH - 3, CARD_HEIGHT - 3))
+
+        # Stat boxes with their captions
+        painter.setFont(self.fonts["caption"])
+        for rect, (caption, _) in zip(self.layout["stat_boxes"], STAT_BOXES):
+            painter.fillRect(rect, QColor(self.theme["secondary_bg"]))
+            painter.setPen(QPen(QColor(self.theme["border"]), 1))
+            painter.drawRect(rect.adjusted(0, 0, -1, -1))
+            painter.setPen(QColor(self.theme["highlight"]).lighter(160))
+            painter.drawText(rect.adjusted(0, 4, 0, 0), Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop,
+                             caption)
+
+        # Section captions with a rule under each
+        for section in ("skills", "specialties", "gear"):
+            rect = self.layout[f"{section}_caption"]
+            painter.setPen(QColor(self.theme["text"]))
+            painter.drawText(rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, section.upper())
+            painter.setPen(QPen(QColor(self.theme["border"]), 1))
+            painter.drawLine(rect.left(), rect.bottom() + 1, rect.right(), rect.bottom() + 1)
+
+        painter.end()
+        return image
+
+    def render_card(self, character):
+        """Render a character card
+
+        Args:
+            character: Character object
+
+        Returns:
+            QImage of the card
+        """
+        image = self.background.copy()
+        layout = self.layout
+        fonts = self.fonts
+        text_color = QColor(self.theme["text"])
+
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        painter.setPen(text_color)
+
+        # Header
+        painter.setFont(fonts["name"])
+        name = painter.fontMetrics().elidedText(character.name or "Unnamed", Qt.TextElideMode.ElideRight,
+                                                layout["name"].width())
+        painter.drawText(layout["name"], Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, name)
+
+        painter.setFont(fonts["subtitle"])
+        painter.drawText(layout["subtitle"], Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                         self._subtitle(character))
+
+        # Stats
+        painter.setFont(fonts["stat"])
+        for rect, (_, key) in zip(layout["stat_boxes"], STAT_BOXES):
+            if key in character.attributes:
+                value = character.get_attribute_letter(key)
+            else:
+                value = str(getattr(character, key))
+            painter.drawText(rect.adjusted(0, 18, 0, 0), Qt.AlignmentFlag.AlignCenter, value)
+
+        # Skills in columns, best first
+        painter.setFont(fonts["body"])
+        skills = sorted(((level, skill) for skill, level in character.skills.items() if level != "F"))
+        skills_rect = layout["skills"]
+        column_width = skills_rect.width() // 2
+        for i, (level, skill) in enumerate(skills[:SKILL_ROWS * 2]):
+            row_rect = QRect(skills_rect.left() + (i // SKILL_ROWS) * column_width,
+                             skills_rect.top() + 4 + (i % SKILL_ROWS) * 20, column_width - 24, 20)
+            painter.drawText(row_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, skill)
+            painter.drawText(row_rect, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, level)
+
+        # Specialties and gear wrap within their boxes
+        specialties = ", ".join(name for name, has in character.specialties.items() if has) or "None"
+        painter.drawText(layout["specialties"].adjusted(0, 4, 0, 0),
+                         WRAP_FLAGS, specialties)
+
+        gear = ", ".join(str(item) for item in character.gear) or "None"
+        painter.drawText(layout["gear"].adjusted(0, 4, 0, 0),
+                         WRAP_FLAGS, gear)
+
+        painter.end()
+        return image
+
+    def _subtitle(self, character):
+        """Build the line under the name (nationality, age and latest career)"""
+        parts = [character.nationality, f"Age {character.age}"]
+        if character.careers:
+            career = character.careers[-1]
+            parts.append(career.get("rank") or career.get("branch") or career.get("type"))
+        return " • ".join(part for part in parts if part)
+
+    def save_card(self, character, filename):
+        """Render a character card to a PNG file
+
+        Args:
+            character: Character object
+            filename: Path of the PNG file
+
+        Returns:
+            True if successful, False otherwise
+        """
+        return self.render_card(character).save(filename, "PNG")
+
+    def render_roster(self, characters, output_dir, max_threads=None):
+        """Render cards for many characters, encoding and saving them in parallel
+
+        Cards are drawn on the calling thread, since not every platform can
+        draw text outside the GUI thread. PNG encoding, which takes most of
+        the time, runs on a thread pool.
+
+        Args:
+            characters: List of Character objects
+            output_dir: Directory to write the PNG files to
+            max_threads: Optional limit on worker threads
+
+        Returns:
+            List of written file paths
+        """
+        os.makedirs(output_dir, exist_ok=True)
+
+        thread_pool = QThreadPool()
+        if max_threads:
+            thread_pool.setMaxThreadCount(max_threads)
+
+        # Wait for the pool every few cards, so finished images don't pile up in memory
+        batch_size = thread_pool.maxThreadCount() * 4
+
+        tasks = []
+        for i, character in enumerate(characters):
+            safe_name = re.sub(r"[^A-Za-z0-9]+", "_", character.name).strip("_") or "character"
+            filename = os.path.join(output_dir, f"{i + 1:04d}_{safe_name}.png")
+
+            task = CardSaveTask(self.render_card(character), filename)
+            tasks.append(task)
+            thread_pool.start(task)
+
+            if len(tasks) % batch_size == 0:
+                thread_pool.waitForDone()
+
+        thread_pool.waitForDone()
+        return [task.filename for task in tasks if task.saved]
+
+
+class CardSaveTask(QRunnable):
+    """Encodes and saves one card image on a worker thread"""
+
+    def __init__(self, image, filename):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.image = image
+        self.filename = filename
+        self.saved = False
+
+    def run(self):
+        """Save the card as a PNG file"""
+        try:
+            self.saved = self.image.save(self.filename, "PNG")
+        except Exception as e:
+            print(f"Error saving card {self.filename}: {e}")
+
+        # Free the image as soon as it's written
+        self.image = None
+
+
+def _load_characters(args):
+    """Load the characters named on the command line
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        List of Character objects
+    """
+    from src.models.character import Character
+
+    characters = []
+
+    for path in args.files:
+        with open(path, "r") as f:
+            data = json.load(f)
+        # A file may hold one character or a list of them
+        for character_dict in (data if isinstance(data, list) else [data]):
+            characters.append(Character.from_dict(character_dict))
+
+    if args.db:
+        from src.utils.character_store import CharacterStore
+
+        store = CharacterStore(args.db)
+        offset = 0
+        while True:
+            rows = store.fetch_rows(offset, config.ROSTER_PAGE_SIZE, "id")
+            if not rows:
+                break
+            characters.extend(store.get_character(row[0]) for row in rows)
+            offset += len(rows)
+        store.close()
+
+    if args.unit:
+        from src.controllers.unit_controller import unit_controller
+
+        nationality, unit_type = args.unit
+        characters.extend(unit_controller.generate_unit(nationality, unit_type))
+
+    return characters
+
+
+def main(argv=None):
+    """Render character cards from the command line"""
+    parser = argparse.ArgumentParser(description="Render Twilight 2000 character cards to PNG files")
+    parser.add_argument("files", nargs="*", help="Character JSON files")
+    parser.add_argument("--db", help="Render every character in a roster database")
+    parser.add_argument("--unit", nargs=2, metavar=("NATIONALITY", "UNIT_TYPE"), help="Generate and render an NPC unit")
+    parser.add_argument("--out", default="cards", help="Output directory (default: cards)")
+    parser.add_argument("--theme", default=config.DEFAULT_THEME, choices=list(config.THEMES), help="Card theme")
+    parser.add_argument("--threads", type=int, default=None, help="Maximum worker threads")
+    args = parser.parse_args(argv)
+
+    # Render without a display
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    from PyQt6.QtGui import QGuiApplication
+    app = QGuiApplication.instance() or QGuiApplication(sys.argv[:1])
+
+    characters = _load_characters(args)
+    if not characters:
+        parser.error("no characters to render")
+
+    renderer = CardRenderer(args.theme)
+    written = renderer.render_roster(characters, args.out, args.threads)
+    print(f"Rendered {len(written)} of {len(characters)} cards to {args.out}")
+
+    return 0 if len(written) == len(characters) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,262 @@
+"""
+character_store.py - SQLite store for a roster of saved characters
+"""
+
+import re
+import json
+import sqlite3
+
+import src.config as config
+from src.models.character import Character
+from src.data.skills import CORE_SKILLS
+
+
+def _skill_column(skill):
+    """Get the column name for a core skill (e.g., "Close Combat" -> "skill_close_combat")"""
+    return "skill_" + re.sub(r"[^a-z0-9]+", "_", skill.lower()).strip("_")
+
+
+# Column for each core skill level
+SKILL_COLUMNS = {skill: _skill_column(skill) for skill in CORE_SKILLS}
+
+# Summary columns that can be shown, sorted and filtered without loading the full character
+SUMMARY_COLUMNS = ["id", "name", "nationality", "career", "cuf", "age"] + list(SKILL_COLUMNS.values())
+
+# Columns that hold a level letter, where A is best and F is untrained
+LEVEL_COLUMNS = ["cuf"] + list(SKILL_COLUMNS.values())
+
+
+class CharacterStore:
+    """Stores characters in an SQLite database
+
+    Each character is saved as JSON, next to indexed summary columns
+    (name, nationality, career, CUF, age and each core skill level). Rows
+    are sorted, filtered and paged in SQL, so a roster can be browsed without
+    loading every character.
+    """
+
+    def __init__(self, path=None):
+        """Open (and create if needed) a character store
+
+        Args:
+            path: Database file path (default: config.ROSTER_DB)
+        """
+        self.path = path or config.ROSTER_DB
+        self.connection = sqlite3.connect(self.path)
+        self._create_tables()
+
+    def _create_tables(self):
+        """Create the characters table and its indexes"""
+        skill_columns = "".join(f", {column} TEXT NOT NULL DEFAULT 'F'" for column in SKILL_COLUMNS.values())
+
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS characters ("
+                "id INTEGER PRIMARY KEY, "
+                "name TEXT NOT NULL DEFAULT '', "
+                "nationality TEXT NOT NULL DEFAULT '', "
+                "career TEXT NOT NULL DEFAULT '', "
+                "cuf TEXT NOT NULL DEFAULT 'D', "
+                "age INTEGER NOT NULL DEFAULT 18"
+                f"{skill_columns}, "
+                "data TEXT NOT NULL)"
+            )
+
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS idx_characters_name ON characters (name COLLATE NOCASE)")
+            for column in SUMMARY_COLUMNS[2:]:
+                self.connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_characters_{column} ON characters ({column})")
+
+    def _summary_values(self, character):
+        """Get the summary column values for a character
+
+        Args:
+            character: Character object
+
+        Returns:
+            Tuple of values in SUMMARY_COLUMNS order (without the ID) followed by the JSON data
+        """
+        career = ""
+        if character.careers:
+            latest_career = character.careers[-1]
+            career = latest_career.get("branch") or latest_career.get("type") or ""
+
+        skills = tuple(character.skills.get(skill, "F") for skill in SKILL_COLUMNS)
+
+        return ((character.name, character.nationality, career, character.cuf, character.age)
+                + skills + (json.dumps(character.to_dict()),))
+
+    def add_character(self, character):
+        """Add a character to the store
+
+        Args:
+            character: Character object
+
+        Returns:
+            ID of the new row
+        """
+        return self.add_characters([character])[0]
+
+    def add_characters(self, characters):
+        """Add many characters in one transaction
+
+        Args:
+            characters: List of Character objects (e.g., a generated unit)
+
+        Returns:
+            List of IDs of the new rows
+        """
+        # Every summary column except the ID, plus the JSON data
+        columns = SUMMARY_COLUMNS[1:] + ["data"]
+        placeholders = ", ".join("?" * len(columns))
+        columns = ", ".join(columns)
+        query = f"INSERT INTO characters ({columns}) VALUES ({placeholders})"
+
+        with self.connection:
+            self.connection.executemany(query, (self._summary_values(character) for character in characters))
+            last_id = self.connection.execute("SELECT last_insert_rowid()").fetchone()[0]
+
+        # Rows inserted in one transaction get consecutive IDs
+        return list(range(last_id - len(characters) + 1, last_id + 1))
+
+    def update_character(self, character_id, character):
+        """Replace a stored character
+
+        Args:
+            character_id: Row ID
+            character: Character object
+
+        Returns:
+            True if the row was updated, False if not found
+        """
+        assignments = ", ".join(f"{column} = ?" for column in SUMMARY_COLUMNS[1:] + ["data"])
+        with self.connection:
+            cursor = self.connection.execute(
+                f"UPDATE characters SET {assignments} WHERE id = ?",
+                self._summary_values(character) + (character_id,)
+            )
+        return cursor.rowcount > 0
+
+    def delete_character(self, character_id):
+        """Delete a stored character
+
+        Args:
+            character_id: Row ID
+
+        Returns:
+            True if the row was deleted, False if not found
+        """
+        with self.connection:
+            cursor = self.connection.execute("DELETE FROM characters WHERE id = ?", (character_id,))
+        return cursor.rowcount > 0
+
+    def get_character(self, character_id):
+        """Load a stored character
+
+        Args:
+            character_id: Row ID
+
+        Returns:
+            Character object or None if not found
+        """
+        row = self.connection.execute("SELECT data FROM characters WHERE id = ?", (character_id,)).fetchone()
+        if not row:
+            return None
+        return Character.from_dict(json.loads(row[0]))
+
+    def _where_clause(self, filters):
+        """Build the WHERE clause for a set of filters
+
+        Args:
+            filters: Dictionary with optional "name" (substring), "nationality", "career",
+                "cuf" (minimum level) and "skills" (dictionary of skill to minimum level)
+
+        Returns:
+            Tuple of (SQL clause, parameters)
+        """
+        conditions = []
+        params = []
+
+        if not filters:
+            return "", params
+
+        if filters.get("name"):
+            conditions.append("name LIKE ? ESCAPE '\\'")
+            escaped = re.sub(r"([%_\\])", r"\\\1", filters["name"])
+            params.append(f"%{escaped}%")
+
+        for column in ("nationality", "career"):
+            if filters.get(column):
+                conditions.append(f"{column} = ?")
+                params.append(filters[column])
+
+        # Levels are letters, so "at least B" means "A" or "B"
+        if filters.get("cuf"):
+            conditions.append("cuf <= ?")
+            params.append(filters["cuf"])
+
+        for skill, level in (filters.get("skills") or {}).items():
+            if skill in SKILL_COLUMNS and level:
+                conditions.append(f"{SKILL_COLUMNS[skill]} <= ?")
+                params.append(level)
+
+        if not conditions:
+            return "", params
+        return " WHERE " + " AND ".join(conditions), params
+
+    def count(self, filters=None):
+        """Count the characters matching a set of filters
+
+        Args:
+            filters: Filter dictionary (see _where_clause)
+
+        Returns:
+            Number of matching rows
+        """
+        where, params = self._where_clause(filters)
+        return self.connection.execute(f"SELECT COUNT(*) FROM characters{where}", params).fetchone()[0]
+
+    def fetch_rows(self, offset, limit, sort_column="name", descending=False, filters=None):
+        """Fetch a page of summary rows
+
+        Args:
+            offset: Index of the first row
+            limit: Maximum number of rows
+            sort_column: Column from SUMMARY_COLUMNS to sort by
+            descending: Whether to sort in descending order
+            filters: Filter dictionary (see _where_clause)
+
+        Returns:
+            List of tuples in SUMMARY_COLUMNS order
+        """
+        if sort_column not in SUMMARY_COLUMNS:
+            sort_column = "name"
+
+        order = "DESC" if descending else "ASC"
+        collate = " COLLATE NOCASE" if sort_column == "name" else ""
+        where, params = self._where_clause(filters)
+
+        # Sort by ID as well, so pages stay stable when values tie
+        query = (f"SELECT {', '.join(SUMMARY_COLUMNS)} FROM characters{where} "
+                 f"ORDER BY {sort_column}{collate} {order}, id {order} LIMIT ? OFFSET ?")
+        return self.connection.execute(query, params + [limit, offset]).fetchall()
+
+    def get_distinct_values(self, column):
+        """Get the distinct values of a summary column
+
+        Args:
+            column: Column name (e.g., "nationality", "career")
+
+        Returns:
+            Sorted list of values
+        """
+        if column not in SUMMARY_COLUMNS:
+            return []
+
+        rows = self.connection.execute(f"SELECT DISTINCT {column} FROM characters ORDER BY {column}")
+        return [row[0] for row in rows if row[0] != ""]
+
+    def close(self):
+        """Close the database connection"""
+        self.connection.close()
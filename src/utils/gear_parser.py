@@ -0,0 +1,455 @@
+"""
+gear_parser.py - Parsing and resolving starting gear descriptions
+"""
+
+import re
+from functools import lru_cache
+
+from src.controllers.dice_controller import DiceController
+
+# "D6 reloads", "2D6 rations of food", "D3+1 flares"
+DICE_QUANTITY_PATTERN = re.compile(r"^(\d*)D(\d+)(?:\s*([+-])\s*(\d+))?\s+(.+)$")
+
+# "3 hand grenades" (but not "2WD car")
+FIXED_QUANTITY_PATTERN = re.compile(r"^(\d+)\s+(.+)$")
+
+# Separator between alternatives in a choice
+CHOICE_SEPARATOR = re.compile(r"\s+or\s+")
+
+# Words in item names that mark each kind of item a quantity can be given "for each" of
+PER_ITEM_KEYWORDS = {
+    "weapon": ("rifle", "pistol", "revolver", "firearm", "submachine gun", "shotgun",
+               "lmg", "atrl", "grenade launcher")
+}
+
+# "D6 reloads for each weapon"
+PER_ITEM_PATTERN = re.compile(r"^(.+?)\s+for each\s+(" + "|".join(PER_ITEM_KEYWORDS) + r")s?$", re.IGNORECASE)
+
+# "Rifle with 2 magazines" (but not "Patrol car with half a tank of gasoline")
+WITH_QUANTITY_PATTERN = re.compile(r"^(.+?)\s+with\s+(\d*D\d+.*|\d+\s+.+)$")
+
+
+def is_item_of_kind(name, kind):
+    """Check if an item is of a kind that quantities can be given "for each" of
+
+    Args:
+        name: Item name
+        kind: Key in PER_ITEM_KEYWORDS (e.g., "weapon")
+
+    Returns:
+        True if the name contains one of the kind's keywords
+    """
+    name = name.lower()
+    return any(keyword in name for keyword in PER_ITEM_KEYWORDS.get(kind, ()))
+
+
+class ItemStack:
+    """A concrete quantity of one gear item"""
+
+    def __init__(self, name, quantity=1):
+        """Initialize an item stack
+
+        Args:
+            name: Item name
+            quantity: Number of items in the stack
+        """
+        self.name = name
+        self.quantity = quantity
+
+    def to_dict(self):
+        """Convert item stack to dictionary for saving
+
+        Returns:
+            Dictionary representation of the item stack
+        """
+        return {
+            "name": self.name,
+            "quantity": self.quantity
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create item stack from dictionary
+
+        Args:
+            data: Dictionary with item stack data
+
+        Returns:
+            ItemStack object
+        """
+        return cls(
+            name=data.get("name", ""),
+            quantity=data.get("quantity", 1)
+        )
+
+    def __eq__(self, other):
+        """Compare two item stacks by name and quantity"""
+        if not isinstance(other, ItemStack):
+            return NotImplemented
+        return self.name == other.name and self.quantity == other.quantity
+
+    def __repr__(self):
+        """Debug representation of the item stack"""
+        return f"ItemStack({self.name!r}, {self.quantity})"
+
+    def __str__(self):
+        """String representation of the item stack
+
+        Returns:
+            String in format "4 hand grenades" or just the name for a single item
+        """
+        if self.quantity == 1:
+            return self.name
+        return f"{self.quantity} {self.name}"
+
+
+class ItemNode:
+    """Gear node for a single item"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def needs_inventory(self):
+        """Check if resolving the node depends on the rest of the inventory"""
+        return False
+
+    def resolve(self, dice_controller, inventory=()):
+        """Resolve the node into item stacks
+
+        Args:
+            dice_controller: DiceController used for any rolls
+            inventory: Item stacks resolved so far
+
+        Returns:
+            List of ItemStack objects
+        """
+        return [ItemStack(self.name)]
+
+    def __repr__(self):
+        return f"ItemNode({self.name!r})"
+
+
+class QuantityNode:
+    """Gear node for a rolled or fixed quantity of an item"""
+
+    def __init__(self, name, dice_count=0, die_size=0, modifier=0, per=None):
+        """Initialize a quantity node
+
+        Args:
+            name: Item name
+            dice_count: Number of dice to roll (0 for a fixed quantity)
+            die_size: Number of sides on each die
+            modifier: Amount added to the roll (the whole quantity if no dice)
+            per: Kind of item the quantity is given for each of (e.g., "weapon"), or None
+        """
+        self.name = name
+        self.dice_count = dice_count
+        self.die_size = die_size
+        self.modifier = modifier
+        self.per = per
+
+    def needs_inventory(self):
+        """Check if resolving the node depends on the rest of the inventory"""
+        return self.per is not None
+
+    def _roll_quantity(self, dice_controller):
+        """Roll (or take) the quantity once"""
+        quantity = self.modifier
+        if self.dice_count:
+            quantity += sum(dice_controller.roll_dice(self.die_size, self.dice_count))
+        return quantity
+
+    def resolve(self, dice_controller, inventory=()):
+        """Resolve the node into item stacks
+
+        A quantity "for each weapon" is rolled once per weapon in the inventory,
+        giving one stack per weapon (e.g., "reloads (Assault rifle)").
+
+        Args:
+            dice_controller: DiceController used for any rolls
+            inventory: Item stacks resolved so far
+
+        Returns:
+            List of ItemStack objects, without stacks whose quantity comes out at 0
+        """
+        if self.per is None:
+            quantity = self._roll_quantity(dice_controller)
+            return [ItemStack(self.name, quantity)] if quantity > 0 else []
+
+        stacks = []
+        for item in inventory:
+            if not is_item_of_kind(item.name, self.per):
+                continue
+
+            quantity = sum(self._roll_quantity(dice_controller) for _ in range(item.quantity))
+            if quantity > 0:
+                stacks.append(ItemStack(f"{self.name} ({item.name})", quantity))
+        return stacks
+
+    def __repr__(self):
+        per = f", per={self.per!r}" if self.per else ""
+        return f"QuantityNode({self.name!r}, {self.dice_count}, {self.die_size}, {self.modifier}{per})"
+
+
+class BundleNode:
+    """Gear node for items that come together (e.g., "Rifle with 2 magazines")"""
+
+    def __init__(self, parts):
+        """Initialize a bundle node
+
+        Args:
+            parts: List of nodes, all of which are resolved
+        """
+        self.parts = parts
+
+    def needs_inventory(self):
+        """Check if resolving the node depends on the rest of the inventory"""
+        return any(part.needs_inventory() for part in self.parts)
+
+    def resolve(self, dice_controller, inventory=()):
+        """Resolve every part of the bundle
+
+        Later parts see the earlier parts' items, so the magazines in
+        "Rifle with 2 magazines for each weapon" include the rifle's.
+
+        Args:
+            dice_controller: DiceController used for any rolls
+            inventory: Item stacks resolved so far
+
+        Returns:
+            List of ItemStack objects
+        """
+        stacks = []
+        for part in self.parts:
+            stacks.extend(part.resolve(dice_controller, list(inventory) + stacks))
+        return stacks
+
+    def __repr__(self):
+        return f"BundleNode({self.parts!r})"
+
+
+class ChoiceNode:
+    """Gear node for a choice between alternatives"""
+
+    def __init__(self, options):
+        """Initialize a choice node
+
+        Args:
+            options: List of ItemNode, QuantityNode or BundleNode alternatives
+        """
+        self.options = options
+
+    def needs_inventory(self):
+        """Check if resolving the node depends on the rest of the inventory"""
+        return any(option.needs_inventory() for option in self.options)
+
+    def resolve(self, dice_controller, inventory=()):
+        """Resolve the node into item stacks, picking one alternative at random
+
+        Args:
+            dice_controller: DiceController used for any rolls
+            inventory: Item stacks resolved so far
+
+        Returns:
+            List of ItemStack objects for the chosen alternative
+        """
+        option = self.options[dice_controller.roll_die(len(self.options)) - 1]
+        return option.resolve(dice_controller, inventory)
+
+    def __repr__(self):
+        return f"ChoiceNode({self.options!r})"
+
+
+def _split_alternatives(text):
+    """Split a gear string into its alternatives
+
+    Commas only separate alternatives when the string is a choice
+    (e.g., "Assault rifle, LMG or ATRL"), and never inside parentheses.
+
+    Args:
+        text: Gear description
+
+    Returns:
+        List of alternative strings
+    """
+    if not CHOICE_SEPARATOR.search(text):
+        return [text]
+
+    # Split on top-level commas first
+    parts = []
+    depth = 0
+    current = []
+    for char in text:
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth = max(0, depth - 1)
+
+        if char == "," and depth == 0:
+            parts.append("".join(current))
+            current = []
+        else:
+            current.append(char)
+    parts.append("".join(current))
+
+    alternatives = []
+    for part in parts:
+        alternatives.extend(CHOICE_SEPARATOR.split(part))
+
+    return [alternative.strip() for alternative in alternatives if alternative.strip()]
+
+
+def _parse_quantity(text, per=None):
+    """Parse a rolled or fixed quantity of an item
+
+    Args:
+        text: Quantity description (e.g., "D6 hand grenades", "3 flares")
+        per: Kind of item the quantity is given for each of, or None
+
+    Returns:
+        QuantityNode, or None if the text doesn't start with a quantity
+    """
+    match = DICE_QUANTITY_PATTERN.match(text)
+    if match:
+        dice_count, die_size, sign, modifier, name = match.groups()
+        modifier = int(modifier) if modifier else 0
+        if sign == "-":
+            modifier = -modifier
+        return QuantityNode(name, int(dice_count or 1), int(die_size), modifier, per)
+
+    match = FIXED_QUANTITY_PATTERN.match(text)
+    if match:
+        quantity, name = match.groups()
+        return QuantityNode(name, modifier=int(quantity), per=per)
+
+    return None
+
+
+def _parse_alternative(text):
+    """Parse one alternative into an item, quantity or bundle node
+
+    Args:
+        text: Alternative description (e.g., "D6 hand grenades", "D6 reloads for each weapon")
+
+    Returns:
+        ItemNode, QuantityNode or BundleNode
+    """
+    per = None
+    match = PER_ITEM_PATTERN.match(text)
+    if match:
+        text, per = match.group(1), match.group(2).lower()
+
+    # "Rifle with 2 magazines" is the rifle plus the magazines
+    match = WITH_QUANTITY_PATTERN.match(text)
+    if match:
+        item, quantity = match.groups()
+        return BundleNode([_parse_alternative(item), _parse_quantity(quantity, per)])
+
+    node = _parse_quantity(text, per)
+    if node is not None:
+        return node
+
+    # "Reload for each weapon" is one of the item per weapon
+    if per is not None:
+        return QuantityNode(text, modifier=1, per=per)
+
+    # Alternatives after "or" are lower case in the career data
+    return ItemNode(text[:1].upper() + text[1:])
+
+
+@lru_cache(maxsize=None)
+def parse_gear(text):
+    """Compile a gear description into a gear node
+
+    Results are cached, so each distinct string is only parsed once.
+
+    Args:
+        text: Gear description (e.g., "Knife or D6 hand grenades")
+
+    Returns:
+        ItemNode, QuantityNode, BundleNode or ChoiceNode
+    """
+    alternatives = [_parse_alternative(alternative) for alternative in _split_alternatives(text.strip())]
+
+    if len(alternatives) == 1:
+        return alternatives[0]
+    return ChoiceNode(alternatives)
+
+
+class GearResolver:
+    """Resolves gear descriptions into concrete item stacks"""
+
+    def __init__(self, dice_controller=None):
+        """Initialize the gear resolver
+
+        Args:
+            dice_controller: Optional DiceController to roll with
+        """
+        self.dice_controller = dice_controller or DiceController()
+
+    def resolve(self, text):
+        """Resolve a single gear description
+
+        Args:
+            text: Gear description
+
+        Returns:
+            List of ItemStack objects
+        """
+        return parse_gear(text).resolve(self.dice_controller)
+
+    @staticmethod
+    def _resolve_nodes(nodes, dice_controller):
+        """Resolve compiled gear nodes into one inventory
+
+        Nodes that depend on the inventory ("D6 reloads for each weapon") are
+        resolved after all the others, so they see every weapon, but their
+        stacks keep their place in the list.
+
+        Args:
+            nodes: List of gear nodes
+            dice_controller: DiceController used for any rolls
+
+        Returns:
+            List of ItemStack objects
+        """
+        resolved = [None if node.needs_inventory() else node.resolve(dice_controller) for node in nodes]
+
+        inventory = [stack for stacks in resolved if stacks for stack in stacks]
+        for i, node in enumerate(nodes):
+            if resolved[i] is None:
+                resolved[i] = node.resolve(dice_controller, inventory)
+
+        return [stack for stacks in resolved for stack in stacks]
+
+    def resolve_list(self, gear_list):
+        """Resolve a list of gear descriptions into one inventory
+
+        Args:
+            gear_list: List of gear descriptions (e.g., a career's "starting_gear")
+
+        Returns:
+            List of ItemStack objects
+        """
+        return self._resolve_nodes([parse_gear(text) for text in gear_list], self.dice_controller)
+
+    def resolve_batch(self, gear_list, count):
+        """Resolve the same gear list for many characters
+
+        The list is compiled once and then rolled count times.
+
+        Args:
+            gear_list: List of gear descriptions
+            count: Number of inventories to resolve
+
+        Returns:
+            List of count inventories, each a list of ItemStack objects
+        """
+        dice_controller = self.dice_controller
+        nodes = [parse_gear(text) for text in gear_list]
+        inventories = []
+
+        for _ in range(count):
+            inventories.append(self._resolve_nodes(nodes, dice_controller))
+
+        return inventories
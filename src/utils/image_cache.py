@@ -0,0 +1,252 @@
+"""
+image_cache.py - Cache of decoded and pre-scaled images
+"""
+
+from collections import OrderedDict
+
+from PyQt6.QtCore import Qt, QObject, QRunnable, QThreadPool, QSize, pyqtSignal
+from PyQt6.QtGui import QImage, QPixmap
+
+import src.config as config
+from src.utils.resource_backend import resource_backend
+
+
+def find_image(path):
+    """Find an image in the resource bundle or the root or src assets folders
+
+    Args:
+        path: Image path relative to the project root (e.g., "assets/images/icons/dice.png")
+
+    Returns:
+        ":/..." resource path or absolute file path, or None if not found
+    """
+    return resource_backend.resolve(path)
+
+
+class _ImageTaskSignals(QObject):
+    """Signals for an image task (QRunnable can't have its own)"""
+
+    finished = pyqtSignal(object, object, object, int)  # key, source QImage, scaled QImage, cache generation
+
+
+class ImageTask(QRunnable):
+    """Decodes an image and scales it on a worker thread"""
+
+    def __init__(self, key, source=None, generation=0):
+        """Initialize the image task
+
+        Args:
+            key: Cache key (path, (width, height), device pixel ratio)
+            source: Already decoded QImage, or None to decode from the path
+            generation: Cache generation the task was started in
+        """
+        super().__init__()
+        self.key = key
+        self.source = source
+        self.generation = generation
+        self.signals = _ImageTaskSignals()
+
+    def run(self):
+        """Decode and scale the image"""
+        path, size, dpr = self.key
+
+        source = self.source
+        if source is None:
+            file_path = find_image(path)
+            source = QImage(file_path) if file_path else QImage()
+
+        scaled = None
+        if not source.isNull():
+            # Fill the target size, cropping rather than leaving bars
+            scaled = source.scaled(
+                round(size[0] * dpr), round(size[1] * dpr),
+                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+                Qt.TransformationMode.SmoothTransformation
+            )
+
+        self.signals.finished.emit(self.key, source, scaled, self.generation)
+
+
+class ImageCache(QObject):
+    """Keeps decoded images and pixmaps scaled for specific sizes
+
+    Decoding and smooth scaling run on the global thread pool. Finished
+    pixmaps are kept in an LRU keyed by (path, size, device pixel ratio) and
+    bounded by config.IMAGE_CACHE_BUDGET bytes, so theme switches and
+    repeated window sizes reuse them.
+    """
+
+    # Emitted with the image path when a scaled pixmap becomes available
+    pixmapReady = pyqtSignal(str)
+
+    def __init__(self, budget=None):
+        """Initialize the image cache
+
+        Args:
+            budget: Maximum bytes of images and pixmaps to keep (default: config.IMAGE_CACHE_BUDGET)
+        """
+        super().__init__()
+        self.budget = budget or config.IMAGE_CACHE_BUDGET
+        self.thread_pool = QThreadPool.globalInstance()
+
+        self._sources = OrderedDict()  # path -> decoded QImage
+        self._pixmaps = OrderedDict()  # (path, (width, height), dpr) -> QPixmap
+        self._latest = {}  # path -> key of the most recently scaled pixmap
+        self._pending = {}  # key -> running ImageTask
+        self._bytes = 0
+        self._failed = set()
+        self._generation = 0  # Bumped by clear, so older tasks' results are dropped
+
+    def get_image(self, path):
+        """Get a decoded image, decoding it now if needed
+
+        Meant for small images such as icons, where a worker isn't worth it.
+
+        Args:
+            path: Image path relative to the project root
+
+        Returns:
+            QImage (null if the file is missing or can't be decoded)
+        """
+        image = self._sources.get(path)
+        if image is not None:
+            self._sources.move_to_end(path)
+            return image
+
+        file_path = find_image(path)
+        image = QImage(file_path) if file_path else QImage()
+        if not image.isNull():
+            self._store_source(path, image)
+        return image
+
+    def get_pixmap(self, path, size, dpr=1.0):
+        """Get a cached pixmap scaled for a size
+
+        Args:
+            path: Image path relative to the project root
+            size: Logical size as a QSize or (width, height)
+            dpr: Device pixel ratio
+
+        Returns:
+            QPixmap, or None if it isn't ready (see prescale)
+        """
+        key = self._make_key(path, size, dpr)
+        pixmap = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+        return pixmap
+
+    def get_nearest_pixmap(self, path):
+        """Get the most recently scaled pixmap of an image at any size
+
+        Useful to draw something (scaled quickly) while the right size is prepared.
+
+        Args:
+            path: Image path relative to the project root
+
+        Returns:
+            QPixmap or None
+        """
+        key = self._latest.get(path)
+        if key is None:
+            return None
+        return self._pixmaps.get(key)
+
+    def prescale(self, path, size, dpr=1.0):
+        """Prepare a pixmap for a size on a worker thread
+
+        pixmapReady is emitted with the path when it's done.
+
+        Args:
+            path: Image path relative to the project root
+            size: Logical size as a QSize or (width, height)
+            dpr: Device pixel ratio
+        """
+        key = self._make_key(path, size, dpr)
+        if key in self._pixmaps or key in self._pending or path in self._failed:
+            return
+        if key[1][0] <= 0 or key[1][1] <= 0:
+            return
+
+        task = ImageTask(key, self._sources.get(path), self._generation)
+        task.signals.finished.connect(self._on_task_finished)
+        self._pending[key] = task
+        self.thread_pool.start(task)
+
+    def prescale_all(self, paths, size, dpr=1.0):
+        """Prepare pixmaps of several images for the same size
+
+        Args:
+            paths: Image paths relative to the project root
+            size: Logical size as a QSize or (width, height)
+            dpr: Device pixel ratio
+        """
+        for path in paths:
+            self.prescale(path, size, dpr)
+
+    def clear(self):
+        """Drop every cached image and pixmap
+
+        Tasks still running finish in the background, but their results are
+        dropped, since they may have decoded a file that has since changed.
+        """
+        self._generation += 1
+        self._pending.clear()
+        self._sources.clear()
+        self._pixmaps.clear()
+        self._latest.clear()
+        self._failed.clear()
+        self._bytes = 0
+
+    def _make_key(self, path, size, dpr):
+        """Build a cache key"""
+        if isinstance(size, QSize):
+            size = (size.width(), size.height())
+        return (path, (int(size[0]), int(size[1])), round(float(dpr), 2))
+
+    def _on_task_finished(self, key, source, scaled, generation):
+        """Store the results of a finished image task"""
+        if generation != self._generation:
+            return
+
+        self._pending.pop(key, None)
+        path, size, dpr = key
+
+        if scaled is None:
+            print(f"Warning: Could not load image {path}")
+            self._failed.add(path)
+            return
+
+        if path not in self._sources:
+            self._store_source(path, source)
+
+        pixmap = QPixmap.fromImage(scaled)
+        pixmap.setDevicePixelRatio(dpr)
+        self._pixmaps[key] = pixmap
+        self._latest[path] = key
+        self._bytes += pixmap.width() * pixmap.height() * 4
+        self._evict()
+
+        self.pixmapReady.emit(path)
+
+    def _store_source(self, path, image):
+        """Keep a decoded image"""
+        self._sources[path] = image
+        self._bytes += image.sizeInBytes()
+        self._evict()
+
+    def _evict(self):
+        """Drop the least recently used pixmaps, then images, until within budget"""
+        while self._bytes > self.budget and len(self._pixmaps) > 1:
+            key, pixmap = self._pixmaps.popitem(last=False)
+            self._bytes -= pixmap.width() * pixmap.height() * 4
+            if self._latest.get(key[0]) == key:
+                del self._latest[key[0]]
+
+        while self._bytes > self.budget and len(self._sources) > 1:
+            _, image = self._sources.popitem(last=False)
+            self._bytes -= image.sizeInBytes()
+
+
+# Create a global instance for easy access
+image_cache = ImageCache()
@@ -0,0 +1,173 @@
+"""
+import_profiler.py - Timing of src.* module imports, like python -X importtime
+"""
+
+import os
+import sys
+import time
+import argparse
+import importlib
+
+# Environment variable that turns on import profiling in the launchers
+ENV_VARIABLE = "T2K_PROFILE_IMPORTS"
+
+
+class _TimedLoader:
+    """Wraps a module loader to time executing the module"""
+
+    def __init__(self, loader, profiler):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._profiler._begin(module.__name__)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._end()
+
+    def __getattr__(self, name):
+        # Everything else (get_resource_reader, is_package, ...) goes to the real loader
+        return getattr(self._loader, name)
+
+
+class ImportProfiler:
+    """Meta path finder that times every import under a package prefix
+
+    Each module gets a cumulative time (executing it, including everything it
+    imports) and a self time (without the profiled modules it imports). Time
+    spent importing third-party modules counts as self time of the profiled
+    module that imported them.
+    """
+
+    def __init__(self, prefix="src"):
+        """Initialize the import profiler
+
+        Args:
+            prefix: Top-level package whose modules are timed
+        """
+        self.prefix = prefix
+        self.records = []  # (module name, depth, self seconds, cumulative seconds) in completion order
+        self._stack = []  # [module name, start time, seconds spent in profiled children]
+
+    def install(self):
+        """Start timing imports"""
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        """Stop timing imports"""
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path, target=None):
+        """Find a module with the other finders and wrap its loader"""
+        if fullname != self.prefix and not fullname.startswith(self.prefix + "."):
+            return None
+
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, self)
+                return spec
+
+        return None
+
+    def _begin(self, name):
+        """Start timing a module"""
+        self._stack.append([name, time.perf_counter(), 0.0])
+
+    def _end(self):
+        """Finish timing a module"""
+        name, started, children = self._stack.pop()
+        cumulative = time.perf_counter() - started
+
+        if self._stack:
+            self._stack[-1][2] += cumulative
+
+        self.records.append((name, len(self._stack), cumulative - children, cumulative))
+
+    def get_total(self):
+        """Get the total time spent in top-level profiled imports, in seconds"""
+        return sum(cumulative for _, depth, _, cumulative in self.records if depth == 0)
+
+    def format_report(self, sort="order", limit=None):
+        """Format the import times as text
+
+        Args:
+            sort: "order" (nested, in the order imports finished, like -X importtime),
+                "self" or "cumulative" (slowest first)
+            limit: Maximum number of modules to list
+
+        Returns:
+            Report text
+        """
+        records = list(self.records)
+        if sort == "self":
+            records.sort(key=lambda record: record[2], reverse=True)
+        elif sort == "cumulative":
+            records.sort(key=lambda record: record[3], reverse=True)
+        if limit:
+            records = records[:limit]
+
+        lines = [f"import time: {'self [us]':>10} | {'cumulative':>10} | imported module"]
+        for name, depth, self_time, cumulative in records:
+            indent = "  " * depth if sort == "order" else ""
+            lines.append(f"import time: {self_time * 1e6:10.0f} | {cumulative * 1e6:10.0f} | {indent}{name}")
+
+        lines.append(f"Total: {self.get_total() * 1000:.1f} ms in {len(self.records)} {self.prefix} modules")
+        return "\n".join(lines)
+
+    def print_report(self, sort="order", limit=None):
+        """Print the import times (see format_report)"""
+        print(self.format_report(sort, limit), file=sys.stderr)
+
+
+def profile_imports_from_env():
+    """Start an import profiler if the environment asks for one
+
+    Returns:
+        Installed ImportProfiler, or None if T2K_PROFILE_IMPORTS isn't set
+    """
+    if not os.environ.get(ENV_VARIABLE):
+        return None
+
+    profiler = ImportProfiler()
+    profiler.install()
+    return profiler
+
+
+def main(argv=None):
+    """Import modules under the profiler and print the report
+
+    Args:
+        argv: Command line arguments (default: sys.argv[1:])
+    """
+    parser = argparse.ArgumentParser(description="Time the imports of src modules.")
+    parser.add_argument("modules", nargs="*", default=["src.ui.main_window"],
+                        help="Modules to import (default: src.ui.main_window)")
+    parser.add_argument("--sort", choices=["order", "self", "cumulative"], default="order",
+                        help="Report order")
+    parser.add_argument("--limit", type=int, help="Number of modules to list")
+    args = parser.parse_args(argv)
+
+    profiler = ImportProfiler()
+    profiler.install()
+    try:
+        for module in args.modules:
+            importlib.import_module(module)
+    finally:
+        profiler.uninstall()
+
+    profiler.print_report(args.sort, args.limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,353 @@
+"""
+instrumentation.py - Opt-in timing of the UI event loop, slots, screens and painting
+"""
+
+import os
+import json
+import time
+import threading
+import functools
+from collections import deque
+from contextlib import contextmanager
+
+from PyQt6.QtCore import QObject, QTimer, QEvent
+from PyQt6.QtWidgets import QApplication
+
+import src.config as config
+
+# Environment variable that turns instrumentation on ("1") or off ("0")
+ENV_VARIABLE = "T2K_INSTRUMENT"
+
+# Environment variable that turns paint event timing on ("1") or off ("0")
+PAINT_ENV_VARIABLE = "T2K_INSTRUMENT_PAINT"
+
+# Sample categories
+CATEGORY_STALL = "stall"
+CATEGORY_SLOT = "slot"
+CATEGORY_SCREEN = "screen"
+CATEGORY_PAINT = "paint"
+
+
+def timed_slot(name):
+    """Decorator that times each call of a slot
+
+    The decorated method is still connected as a bound method, so Qt
+    disconnects it when its object is destroyed:
+
+        @timed_slot("characterChanged:CharacterSheetScreen")
+        def update_display(self):
+            ...
+
+    Args:
+        name: Name recorded for the slot
+
+    Returns:
+        Decorator
+    """
+    def decorator(slot):
+        @functools.wraps(slot)
+        def wrapper(*args, **kwargs):
+            if not instrumentation.enabled:
+                return slot(*args, **kwargs)
+
+            start = time.perf_counter_ns()
+            try:
+                return slot(*args, **kwargs)
+            finally:
+                instrumentation.record(CATEGORY_SLOT, name, start, time.perf_counter_ns() - start)
+
+        return wrapper
+
+    return decorator
+
+
+def _get_flag(variable, default):
+    """Read an on/off flag from the environment
+
+    Args:
+        variable: Environment variable name
+        default: Value if the variable isn't set
+
+    Returns:
+        True if the flag is on, False otherwise
+    """
+    value = os.environ.get(variable)
+    if value is not None:
+        return value.strip().lower() not in ("", "0", "false", "no", "off")
+    return bool(default)
+
+
+def is_instrumentation_enabled():
+    """Check if instrumentation is turned on
+
+    The environment variable wins over config.INSTRUMENTATION_ENABLED.
+
+    Returns:
+        True if instrumentation is enabled, False otherwise
+    """
+    return _get_flag(ENV_VARIABLE, config.INSTRUMENTATION_ENABLED)
+
+
+def is_paint_instrumentation_enabled():
+    """Check if paint events should be timed
+
+    Needs instrumentation to be on as well. The environment variable wins over
+    config.PAINT_INSTRUMENTATION_ENABLED.
+
+    Returns:
+        True if paint timing is enabled, False otherwise
+    """
+    return _get_flag(PAINT_ENV_VARIABLE, config.PAINT_INSTRUMENTATION_ENABLED)
+
+
+class Instrumentation(QObject):
+    """Records timing samples in a fixed-size ring buffer
+
+    Each sample is a tuple of (category, name, start, duration, thread ID),
+    with times in nanoseconds from perf_counter_ns. When the buffer is full
+    the oldest samples are dropped, so recording costs the same however long
+    the application runs. When disabled, nothing is recorded.
+    """
+
+    def __init__(self, capacity=None, enabled=None):
+        """Initialize the instrumentation
+
+        Args:
+            capacity: Maximum number of samples kept (default: config.INSTRUMENTATION_BUFFER_SIZE)
+            enabled: Whether to record samples (default: see is_instrumentation_enabled)
+        """
+        super().__init__()
+        self.enabled = is_instrumentation_enabled() if enabled is None else enabled
+        self.samples = deque(maxlen=capacity or config.INSTRUMENTATION_BUFFER_SIZE)
+        self.origin = time.perf_counter_ns()
+
+        # Event loop heartbeat
+        self.heartbeat_timer = None
+        self.stall_threshold = 0
+        self._last_beat = 0
+
+    def record(self, category, name, start, duration):
+        """Record a timing sample
+
+        Args:
+            category: Sample category (e.g., CATEGORY_SLOT)
+            name: What was measured
+            start: Start time from perf_counter_ns
+            duration: Duration in nanoseconds
+        """
+        if self.enabled:
+            self.samples.append((category, name, start, duration, threading.get_ident()))
+
+    @contextmanager
+    def measure(self, category, name):
+        """Time a block of code
+
+        Args:
+            category: Sample category
+            name: What is being measured
+        """
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(category, name, start, time.perf_counter_ns() - start)
+
+    def start_stall_monitor(self, interval=None, threshold=None):
+        """Watch for event loop stalls with a heartbeat timer
+
+        The timer should fire every interval milliseconds. When it fires late
+        by more than the threshold, the event loop was blocked, and the late
+        part is recorded as a stall.
+
+        Args:
+            interval: Heartbeat interval in milliseconds (default: config.INSTRUMENTATION_HEARTBEAT)
+            threshold: Lateness in milliseconds that counts as a stall (default: config.STALL_THRESHOLD)
+        """
+        if not self.enabled or self.heartbeat_timer is not None:
+            return
+
+        self.heartbeat_timer = QTimer(self)
+        self.heartbeat_timer.setInterval(interval or config.INSTRUMENTATION_HEARTBEAT)
+        self.heartbeat_timer.timeout.connect(self._on_heartbeat)
+        self.stall_threshold = (threshold or config.STALL_THRESHOLD) * 1_000_000
+
+        self._last_beat = time.perf_counter_ns()
+        self.heartbeat_timer.start()
+
+    def stop_stall_monitor(self):
+        """Stop watching for event loop stalls"""
+        if self.heartbeat_timer is not None:
+            self.heartbeat_timer.stop()
+            self.heartbeat_timer.deleteLater()
+            self.heartbeat_timer = None
+
+    def _on_heartbeat(self):
+        """Record a stall if the heartbeat came late"""
+        now = time.perf_counter_ns()
+        expected = self._last_beat + self.heartbeat_timer.interval() * 1_000_000
+        self._last_beat = now
+
+        lateness = now - expected
+        if lateness > self.stall_threshold:
+            self.record(CATEGORY_STALL, "event loop", expected, lateness)
+
+    def clear(self):
+        """Drop every recorded sample"""
+        self.samples.clear()
+
+    def get_summary(self):
+        """Summarize the recorded samples
+
+        Returns:
+            Dictionary mapping "category:name" to count, total, mean and max in milliseconds
+        """
+        totals = {}
+        for category, name, _, duration, _ in self.samples:
+            key = f"{category}:{name}"
+            count, total, longest = totals.get(key, (0, 0, 0))
+            totals[key] = (count + 1, total + duration, max(longest, duration))
+
+        return {
+            key: {
+                "count": count,
+                "total_ms": round(total / 1_000_000, 3),
+                "mean_ms": round(total / count / 1_000_000, 3),
+                "max_ms": round(longest / 1_000_000, 3)
+            }
+            for key, (count, total, longest) in sorted(totals.items())
+        }
+
+    def to_dict(self):
+        """Get the recorded samples as a dictionary
+
+        Returns:
+            Dictionary with the samples (times in milliseconds from startup) and a summary
+        """
+        return {
+            "samples": [
+                {
+                    "category": category,
+                    "name": name,
+                    "start_ms": round((start - self.origin) / 1_000_000, 3),
+                    "duration_ms": round(duration / 1_000_000, 3),
+                    "thread": thread
+                }
+                for category, name, start, duration, thread in self.samples
+            ],
+            "summary": self.get_summary()
+        }
+
+    def to_chrome_trace(self):
+        """Get the recorded samples in Chrome trace event format
+
+        The result can be loaded in chrome://tracing or Perfetto.
+
+        Returns:
+            Dictionary with a "traceEvents" list of complete ("X") events
+        """
+        pid = os.getpid()
+        return {
+            "traceEvents": [
+                {
+                    "name": name,
+                    "cat": category,
+                    "ph": "X",
+                    "ts": (start - self.origin) / 1000,
+                    "dur": duration / 1000,
+                    "pid": pid,
+                    "tid": thread
+                }
+                for category, name, start, duration, thread in self.samples
+            ],
+            "displayTimeUnit": "ms"
+        }
+
+    def export_json(self, file_path):
+        """Export the recorded samples as JSON
+
+        Args:
+            file_path: Output file path
+
+        Returns:
+            True if successful, False otherwise
+        """
+        return self._write(file_path, self.to_dict())
+
+    def export_chrome_trace(self, file_path=None):
+        """Export the recorded samples in Chrome trace event format
+
+        Args:
+            file_path: Output file path (default: config.INSTRUMENTATION_TRACE_FILE)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        return self._write(file_path or config.INSTRUMENTATION_TRACE_FILE, self.to_chrome_trace())
+
+    def _write(self, file_path, data):
+        """Write data to a JSON file"""
+        try:
+            directory = os.path.dirname(file_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(file_path, "w") as f:
+                json.dump(data, f)
+            return True
+        except Exception as e:
+            print(f"Error exporting instrumentation to {file_path}: {e}")
+            return False
+
+
+class InstrumentedApplication(QApplication):
+    """Application that times the delivery of paint events
+
+    Overriding notify costs a Python call for every event, so this class is
+    only used when paint timing is enabled as well as instrumentation.
+    """
+
+    def notify(self, receiver, event):
+        """Deliver an event, timing it if it's a paint event"""
+        if event.type() != QEvent.Type.Paint:
+            return super().notify(receiver, event)
+
+        start = time.perf_counter_ns()
+        try:
+            return super().notify(receiver, event)
+        finally:
+            name = receiver.objectName() or type(receiver).__name__
+            instrumentation.record(CATEGORY_PAINT, name, start, time.perf_counter_ns() - start)
+
+
+def create_application(argv):
+    """Create the application, instrumented if instrumentation is enabled
+
+    Stall monitoring and the trace export come with instrumentation; paint
+    timing also needs is_paint_instrumentation_enabled.
+
+    Args:
+        argv: Command line arguments
+
+    Returns:
+        QApplication instance
+    """
+    if not instrumentation.enabled:
+        return QApplication(argv)
+
+    if is_paint_instrumentation_enabled():
+        app = InstrumentedApplication(argv)
+    else:
+        app = QApplication(argv)
+
+    instrumentation.start_stall_monitor()
+
+    # Keep a trace of the session for analysis
+    app.aboutToQuit.connect(lambda: instrumentation.export_chrome_trace())
+    return app
+
+
+# Create a global instance for easy access
+instrumentation = Instrumentation()
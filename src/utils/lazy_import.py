@@ -0,0 +1,41 @@
+"""
+lazy_import.py - Deferring imports of heavy, rarely used modules
+"""
+
+import sys
+import importlib.util
+
+
+def lazy_import(name):
+    """Get a module that is only executed when one of its attributes is used
+
+    Lets heavy optional modules (PDF export, analysis tools) be named at the
+    top of a module without costing anything at startup:
+
+        pdf_generator = lazy_import("src.utils.pdf_generator")
+        ...
+        pdf_generator.PDFGenerator(character)  # The module is loaded here
+
+    Args:
+        name: Full module name
+
+    Returns:
+        Module (possibly not loaded yet)
+
+    Raises:
+        ImportError: If the module can't be found
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"No module named '{name}'", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
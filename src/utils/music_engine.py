@@ -0,0 +1,172 @@
+"""
+music_engine.py - Gapless looping music with crossfades between tracks
+"""
+
+import math
+
+from PyQt6.QtCore import QObject, QTimer, QElapsedTimer
+from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
+
+import src.config as config
+from src.utils.resource_backend import to_qurl
+
+
+class MusicDeck:
+    """A media player with its own output, holding one track"""
+
+    def __init__(self, parent):
+        """Initialize the deck
+
+        Args:
+            parent: Owner of the player and output
+        """
+        self.output = QAudioOutput(parent)
+        self.output.setVolume(0.0)
+        self.player = QMediaPlayer(parent)
+        self.player.setAudioOutput(self.output)
+        self.music_file = None
+
+    def load(self, music_file):
+        """Load a track unless it's already loaded
+
+        Setting the source starts buffering, so a loaded track starts at once.
+
+        Args:
+            music_file: Resolved path to the music file (":/..." or absolute)
+        """
+        if music_file != self.music_file:
+            self.player.setSource(to_qurl(music_file))
+            self.music_file = music_file
+
+    def is_playing(self):
+        """Check if the deck is playing"""
+        return self.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState
+
+
+class MusicEngine(QObject):
+    """Plays music on two decks and crossfades between them
+
+    Tracks loop inside the media player (setLoops), so there is no gap or
+    seek at the end of a loop. A new track is loaded on the idle deck and
+    faded in while the current one fades out, driven by a timer that only
+    sets volumes. The idle deck keeps its last track buffered, so switching
+    back and forth between themes starts instantly.
+    """
+
+    def __init__(self, volume=None, crossfade=None):
+        """Initialize the music engine
+
+        Args:
+            volume: Music volume from 0.0 to 1.0 (default: config.MASTER_VOLUME)
+            crossfade: Crossfade length in milliseconds (default: config.MUSIC_CROSSFADE)
+        """
+        super().__init__()
+        self.volume = config.MASTER_VOLUME if volume is None else volume
+        self.crossfade = config.MUSIC_CROSSFADE if crossfade is None else crossfade
+
+        self.decks = [MusicDeck(self), MusicDeck(self)]
+        self.active = 0
+
+        # Crossfade state
+        self.fade_timer = QTimer(self)
+        self.fade_timer.setInterval(config.MUSIC_FADE_STEP)
+        self.fade_timer.timeout.connect(self._on_fade_step)
+        self.fade_clock = QElapsedTimer()
+        self.fade_duration = 0
+
+    @property
+    def active_deck(self):
+        """Get the deck playing (or fading in) the current track"""
+        return self.decks[self.active]
+
+    @property
+    def idle_deck(self):
+        """Get the deck that isn't playing the current track"""
+        return self.decks[1 - self.active]
+
+    def prepare(self, music_file):
+        """Buffer a track on the idle deck so it can start without delay
+
+        Args:
+            music_file: Path to the music file
+        """
+        if music_file == self.active_deck.music_file:
+            return
+
+        # Don't interrupt a track that is still fading out
+        if self.fade_timer.isActive():
+            return
+
+        self.idle_deck.load(music_file)
+
+    def play(self, music_file, loop=True, crossfade=None):
+        """Play a track, crossfading from the current one
+
+        Args:
+            music_file: Path to the music file
+            loop: Whether to loop the track
+            crossfade: Crossfade length in milliseconds (default: self.crossfade)
+        """
+        if crossfade is None:
+            crossfade = self.crossfade
+
+        current = self.active_deck
+        if current.music_file == music_file and current.is_playing():
+            return
+
+        # Finish any crossfade in progress before starting another
+        if self.fade_timer.isActive():
+            self._finish_fade()
+
+        fading_out = current if current.is_playing() else None
+        self.active = 1 - self.active
+        deck = self.active_deck
+
+        deck.load(music_file)
+        deck.player.setLoops(QMediaPlayer.Loops.Infinite if loop else QMediaPlayer.Loops.Once)
+        deck.player.setPosition(0)
+
+        if fading_out is None or crossfade <= 0:
+            if fading_out is not None:
+                fading_out.player.stop()
+            deck.output.setVolume(self.volume)
+            deck.player.play()
+            return
+
+        deck.output.setVolume(0.0)
+        deck.player.play()
+
+        self.fade_duration = crossfade
+        self.fade_clock.start()
+        self.fade_timer.start()
+
+    def _on_fade_step(self):
+        """Move the crossfade along"""
+        progress = min(1.0, self.fade_clock.elapsed() / self.fade_duration)
+        if progress >= 1.0:
+            self._finish_fade()
+            return
+
+        # Equal-power curves keep the overall loudness steady
+        self.active_deck.output.setVolume(self.volume * math.sin(progress * math.pi / 2))
+        self.idle_deck.output.setVolume(self.volume * math.cos(progress * math.pi / 2))
+
+    def _finish_fade(self):
+        """Complete a crossfade at once"""
+        self.fade_timer.stop()
+        self.active_deck.output.setVolume(self.volume)
+        self.idle_deck.player.stop()
+        self.idle_deck.output.setVolume(0.0)
+
+    def stop(self):
+        """Stop all music"""
+        self.fade_timer.stop()
+        for deck in self.decks:
+            deck.player.stop()
+            deck.output.setVolume(0.0)
+
+    def set_volume(self, volume):
+        """Set the music volume (0.0 to 1.0)"""
+        self.volume = volume
+        if not self.fade_timer.isActive() and self.active_deck.is_playing():
+            self.active_deck.output.setVolume(volume)
@@ -0,0 +1,117 @@
+"""
+resource_backend.py - Serving assets from the compiled Qt resource bundle
+"""
+
+import importlib
+
+from PyQt6.QtCore import QUrl, QDirIterator
+
+import src.config as config
+from src.utils.asset_manifest import asset_manifest
+
+# Module generated from resources.qrc by build.py
+BUNDLE_MODULE = "src.resources_rc"
+
+# Prefix of asset paths inside the bundle
+BUNDLE_PREFIX = ":/"
+
+
+def to_qurl(path):
+    """Get a URL for a resolved asset path, for APIs that take URLs (e.g., QMediaPlayer)
+
+    Args:
+        path: Path from ResourceBackend.resolve (":/..." or a file path)
+
+    Returns:
+        QUrl ("qrc:/..." or "file://...")
+    """
+    if path.startswith(BUNDLE_PREFIX):
+        return QUrl("qrc" + path)
+    return QUrl.fromLocalFile(path)
+
+
+class ResourceBackend:
+    """Resolves assets to the Qt resource bundle, or to loose files
+
+    When the compiled bundle (src/resources_rc.py) can be imported, assets are
+    served from ":/assets/..." paths, which Qt reads from memory. Without a
+    bundle, or with config.RESOURCE_MODE set to "files" (as while developing),
+    lookups fall back to the loose files in the asset manifest.
+    """
+
+    def __init__(self):
+        """Initialize the resource backend"""
+        self.bundle_loaded = None
+        self._bundled = set()  # Asset keys in the bundle (e.g., "assets/sounds/dice_roll.wav")
+
+    def load(self):
+        """Register the resource bundle if it's available and wanted
+
+        Returns:
+            True if assets are served from the bundle, False otherwise
+        """
+        if self.bundle_loaded is not None:
+            return self.bundle_loaded
+
+        self.bundle_loaded = False
+        if config.RESOURCE_MODE == "files":
+            return False
+
+        try:
+            # Importing the module registers its data with Qt
+            importlib.import_module(BUNDLE_MODULE)
+        except ImportError:
+            if config.RESOURCE_MODE == "bundle":
+                print("Warning: Resource bundle not found, using loose asset files")
+            return False
+        except Exception as e:
+            print(f"Error loading resource bundle: {e}")
+            return False
+
+        iterator = QDirIterator(BUNDLE_PREFIX + "assets", QDirIterator.IteratorFlag.Subdirectories)
+        while iterator.hasNext():
+            path = iterator.next()
+            if iterator.fileInfo().isFile():
+                self._bundled.add(path[len(BUNDLE_PREFIX):])
+
+        self.bundle_loaded = bool(self._bundled)
+        return self.bundle_loaded
+
+    def resolve(self, path):
+        """Get the path to load an asset from
+
+        Args:
+            path: Asset path relative to the project root (e.g., "assets/images/icons/dice.png")
+
+        Returns:
+            ":/assets/..." path if bundled, an absolute file path, or None if not found
+        """
+        if not path:
+            return None
+
+        if self.load():
+            key = path.replace("\\", "/")
+            if key.startswith("src/assets/"):
+                key = key[len("src/"):]
+            if key in self._bundled:
+                return BUNDLE_PREFIX + key
+
+        return asset_manifest.resolve(path)
+
+    def resolve_url(self, path):
+        """Get a URL to load an asset from
+
+        Args:
+            path: Asset path relative to the project root
+
+        Returns:
+            QUrl, or None if not found
+        """
+        resolved = self.resolve(path)
+        if resolved is None:
+            return None
+        return to_qurl(resolved)
+
+
+# Create a global instance for easy access
+resource_backend = ResourceBackend()
@@ -4,8 +4,9 @@ resource_loader.py - Resource loading utilities
 
 import os
 import sys
-import glob
 from PyQt6.QtCore import QDir
+from src.utils.asset_manifest import asset_manifest
+from src.utils.resource_backend import resource_backend
 
 
 def setup_resources():
@@ -13,6 +14,9 @@ def setup_resources():
     # Ensure base directories exist
     ensure_directories()
 
+    # Serve assets from the compiled resource bundle when there is one
+    resource_backend.load()
+
     # Add the root directory to the Python path if needed
     root_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     if root_dir not in sys.path:
@@ -48,8 +52,13 @@ def get_asset_path(asset_type, asset_name):
         asset_name: Name of the asset file
 
     Returns:
-        Full path to the asset
+        Full path to the asset (in the root assets folder if it doesn't exist yet)
     """
+    relative_path = f"assets/{asset_type}/{asset_name}"
+    resolved = asset_manifest.resolve(relative_path)
+    if resolved:
+        return resolved
+
     base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     return os.path.join(base_dir, "assets", asset_type, asset_name)
 
@@ -64,13 +73,7 @@ def find_assets(asset_type, pattern="*"):
     Returns:
         List of matching asset paths
     """
-    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    asset_dir = os.path.join(base_dir, "assets", asset_type)
-
-    if not os.path.exists(asset_dir):
-        return []
-
-    return glob.glob(os.path.join(asset_dir, pattern))
+    return asset_manifest.find(asset_type, pattern)
 
 
 def create_placeholder_assets():
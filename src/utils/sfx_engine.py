@@ -0,0 +1,151 @@
+"""
+sfx_engine.py - Low-latency sound effects from pools of preloaded voices
+"""
+
+from PyQt6.QtCore import QObject
+from PyQt6.QtMultimedia import QSoundEffect
+
+import src.config as config
+from src.utils.resource_backend import resource_backend, to_qurl
+
+
+def find_audio_file(path):
+    """Find an audio file in the resource bundle or the root or src assets folders
+
+    Args:
+        path: Audio path relative to the project root (e.g., "assets/sounds/dice_roll.wav")
+
+    Returns:
+        ":/..." resource path or absolute file path, or None if not found
+    """
+    return resource_backend.resolve(path)
+
+
+class SfxEngine(QObject):
+    """Plays sound effects from pools of preloaded voices
+
+    Each sound gets a pool of QSoundEffect voices that decode the file into
+    memory once, when the sound is loaded. Playing a sound starts an idle
+    voice from its pool, so overlapping effects don't cut each other off.
+    When every voice is busy, the one that started first is stolen and
+    restarted.
+    """
+
+    def __init__(self, polyphony=None, volume=None):
+        """Initialize the sound effects engine
+
+        Args:
+            polyphony: Voices per sound (default: config.SFX_POLYPHONY)
+            volume: Sound effects volume from 0.0 to 1.0 (default: config.SFX_VOLUME)
+        """
+        super().__init__()
+        self.polyphony = max(1, polyphony or config.SFX_POLYPHONY)
+        self.volume = config.SFX_VOLUME if volume is None else volume
+
+        self._voices = {}  # sound key -> list of QSoundEffect
+        self._start_order = {}  # id of QSoundEffect -> when it was last started
+        self._play_count = 0
+        self._missing = set()
+
+    def load(self, sound_key):
+        """Load a sound and create its voices
+
+        Args:
+            sound_key: Key to audio file in config.AUDIO_FILES
+
+        Returns:
+            True if the sound is loaded (or loading), False otherwise
+        """
+        if sound_key in self._voices:
+            return True
+        if sound_key in self._missing:
+            return False
+
+        if sound_key not in config.AUDIO_FILES:
+            print(f"Warning: Sound key '{sound_key}' not found in audio files")
+            self._missing.add(sound_key)
+            return False
+
+        sound_file = find_audio_file(config.AUDIO_FILES[sound_key])
+        if sound_file is None:
+            print(f"Warning: Sound file '{config.AUDIO_FILES[sound_key]}' not found")
+            self._missing.add(sound_key)
+            return False
+
+        # Every voice shares the same source, which Qt decodes once
+        source = to_qurl(sound_file)
+        voices = []
+        for _ in range(self.polyphony):
+            voice = QSoundEffect(self)
+            voice.setSource(source)
+            voice.setVolume(self.volume)
+            voices.append(voice)
+
+        self._voices[sound_key] = voices
+        return True
+
+    def preload(self, sound_keys=None):
+        """Load sounds ahead of their first use
+
+        Args:
+            sound_keys: Keys to audio files in config.AUDIO_FILES (default: config.SFX_PRELOAD)
+        """
+        for sound_key in (config.SFX_PRELOAD if sound_keys is None else sound_keys):
+            self.load(sound_key)
+
+    def play(self, sound_key):
+        """Play a sound effect on a free voice, stealing the oldest if none is free
+
+        Args:
+            sound_key: Key to audio file in config.AUDIO_FILES
+        """
+        if not self.load(sound_key):
+            return
+
+        voices = self._voices[sound_key]
+        voice = next((v for v in voices if not v.isPlaying()), None)
+
+        if voice is None:
+            # Steal the voice that has been playing longest
+            voice = min(voices, key=lambda v: self._start_order.get(id(v), 0))
+            voice.stop()
+
+        self._play_count += 1
+        self._start_order[id(voice)] = self._play_count
+        voice.play()
+
+    def stop_all(self):
+        """Stop every playing voice"""
+        for voices in self._voices.values():
+            for voice in voices:
+                voice.stop()
+
+    def set_volume(self, volume):
+        """Set the sound effects volume (0.0 to 1.0)"""
+        self.volume = volume
+        for voices in self._voices.values():
+            for voice in voices:
+                voice.setVolume(volume)
+
+    def set_polyphony(self, polyphony):
+        """Set the number of voices per sound
+
+        Loaded sounds are rebuilt with the new voice count.
+
+        Args:
+            polyphony: Voices per sound
+        """
+        self.polyphony = max(1, polyphony)
+        loaded = list(self._voices)
+        self.clear()
+        self.preload(loaded)
+
+    def clear(self):
+        """Stop and drop every voice"""
+        for voices in self._voices.values():
+            for voice in voices:
+                voice.stop()
+                voice.deleteLater()
+        self._voices.clear()
+        self._start_order.clear()
+        self._missing.clear()
@@ -0,0 +1,186 @@
+"""
+startup_cache.py - Skipping startup setup and repairs when nothing has changed
+"""
+
+import os
+import sys
+import json
+import time
+import hashlib
+from importlib import metadata
+
+import src.config as config
+
+# Project root (the folder that holds src)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Packages whose versions are part of the fingerprint
+FINGERPRINT_PACKAGES = ["PyQt6", "PyQt6-Qt6", "PyPDF2", "reportlab"]
+
+# Folders (relative to the project root) whose files are part of the fingerprint
+FINGERPRINT_DIRS = ["src", "assets"]
+
+# Replacement files the launchers copy over sources
+FINGERPRINT_FILES = ["career_controller_fixed.py", "theme_manager_fixed.py",
+                     "audio_manager_disabled.py", "skill.py", "fonts_setup.py", "image_setup.py"]
+
+# Environment variable that forces the full setup to run
+FORCE_VARIABLE = "T2K_FORCE_SETUP"
+
+
+def _get_package_version(package):
+    """Get an installed package's version without importing it"""
+    try:
+        return metadata.version(package)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def _scan_files(directory, files):
+    """Add the (mtime, size) of every file under a folder
+
+    Args:
+        directory: Folder to scan
+        files: Dictionary of relative path to (mtime in ns, size) to fill in
+    """
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        return
+
+    with entries:
+        for entry in entries:
+            if entry.name == "__pycache__" or entry.name.startswith("."):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                _scan_files(entry.path, files)
+            elif entry.is_file():
+                stat = entry.stat()
+                files[os.path.relpath(entry.path, PROJECT_ROOT)] = (stat.st_mtime_ns, stat.st_size)
+
+
+def compute_fingerprint():
+    """Fingerprint everything the startup setup depends on
+
+    Covers the Python version, the versions of the required packages and the
+    modification time and size of every source, asset and replacement file.
+
+    Returns:
+        Hex digest
+    """
+    files = {}
+    for directory in FINGERPRINT_DIRS:
+        _scan_files(os.path.join(PROJECT_ROOT, directory), files)
+
+    for file_name in FINGERPRINT_FILES:
+        path = os.path.join(PROJECT_ROOT, file_name)
+        if os.path.isfile(path):
+            stat = os.stat(path)
+            files[file_name] = (stat.st_mtime_ns, stat.st_size)
+
+    source = json.dumps({
+        "python": sys.version,
+        "executable": sys.executable,
+        "packages": {package: _get_package_version(package) for package in FINGERPRINT_PACKAGES},
+        "files": files
+    }, sort_keys=True)
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+class StartupCache:
+    """Remembers the fingerprint of the last successful startup setup
+
+    Each launcher has its own entry. If the fingerprint is unchanged, the
+    dependency checks, directory creation, placeholder assets and source
+    repairs would do nothing, so they can be skipped.
+    """
+
+    def __init__(self, name, path=None):
+        """Initialize the startup cache
+
+        Args:
+            name: Launcher name (e.g., "launch", "main")
+            path: Cache file path (default: config.STARTUP_CACHE_FILE)
+        """
+        self.name = name
+        self.path = path or os.path.join(PROJECT_ROOT, config.STARTUP_CACHE_FILE)
+
+    def _load(self):
+        """Load every launcher's cached fingerprint"""
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def is_fresh(self):
+        """Check if nothing has changed since the last successful setup
+
+        Returns:
+            True if the setup can be skipped, False otherwise
+        """
+        if os.environ.get(FORCE_VARIABLE):
+            return False
+
+        return self._load().get(self.name) == compute_fingerprint()
+
+    def save(self):
+        """Record that the setup succeeded with the current files and packages"""
+        data = self._load()
+        data[self.name] = compute_fingerprint()
+
+        try:
+            with open(self.path, "w") as f:
+                json.dump(data, f, indent=2)
+        except OSError as e:
+            print(f"Error writing startup cache {self.path}: {e}")
+
+    def clear(self):
+        """Forget the cached fingerprint so the setup runs next time"""
+        data = self._load()
+        if data.pop(self.name, None) is not None:
+            try:
+                with open(self.path, "w") as f:
+                    json.dump(data, f, indent=2)
+            except OSError as e:
+                print(f"Error writing startup cache {self.path}: {e}")
+
+
+class PhaseTimer:
+    """Times consecutive startup phases and prints a report"""
+
+    def __init__(self):
+        """Initialize the phase timer"""
+        self.phases = []  # (name, seconds)
+        self._current = None
+        self._started = 0.0
+
+    def begin(self, name):
+        """End the current phase (if any) and start another
+
+        Args:
+            name: Phase name
+        """
+        self.finish()
+        self._current = name
+        self._started = time.perf_counter()
+
+    def finish(self):
+        """End the current phase"""
+        if self._current is not None:
+            self.phases.append((self._current, time.perf_counter() - self._started))
+            self._current = None
+
+    def print_report(self):
+        """Print how long each phase took"""
+        self.finish()
+        if not self.phases:
+            return
+
+        width = max([len(name) for name, _ in self.phases] + [len("Total")])
+        total = sum(seconds for _, seconds in self.phases)
+
+        print("\n--- Startup Timing ---")
+        for name, seconds in self.phases:
+            print(f"{name:<{width}}  {seconds * 1000:8.1f} ms")
+        print(f"{'Total':<{width}}  {total * 1000:8.1f} ms")
@@ -0,0 +1,171 @@
+"""
+theme_cache.py - Compiling themes into palettes and stylesheets, with an optional cache file
+"""
+
+import os
+import json
+import hashlib
+
+import src.config as config
+
+# Palette roles and the theme color used for each
+PALETTE_ROLES = [
+    ("Window", "primary_bg"),
+    ("WindowText", "text"),
+    ("Base", "secondary_bg"),
+    ("AlternateBase", "accent"),
+    ("ToolTipBase", "secondary_bg"),
+    ("ToolTipText", "text"),
+    ("Text", "text"),
+    ("Button", "button_bg"),
+    ("ButtonText", "button_text"),
+    ("Highlight", "highlight"),
+    ("HighlightedText", "button_text")
+]
+
+# Stylesheet filled in with theme colors
+STYLESHEET_TEMPLATE = """
+        QMainWindow, QDialog {{
+            background-color: {primary_bg};
+        }}
+
+        QLabel {{
+            color: {text};
+        }}
+
+        QPushButton {{
+            background-color: {button_bg};
+            color: {button_text};
+            border: 1px solid {border};
+            padding: 5px 10px;
+            border-radius: 3px;
+        }}
+
+        QPushButton:hover {{
+            background-color: {highlight};
+        }}
+
+        QPushButton:pressed {{
+            background-color: {accent};
+        }}
+
+        QLineEdit, QTextEdit, QComboBox {{
+            background-color: {secondary_bg};
+            color: {text};
+            border: 1px solid {border};
+            padding: 2px;
+        }}
+
+        QScrollBar {{
+            background-color: {primary_bg};
+        }}
+
+        QScrollBar::handle {{
+            background-color: {accent};
+        }}
+        """
+
+
+def compile_theme(theme_data):
+    """Compile a theme into its palette colors and stylesheet
+
+    Args:
+        theme_data: Theme dictionary from config.THEMES
+
+    Returns:
+        Dictionary with "palette" (palette role name to color) and "stylesheet"
+    """
+    return {
+        "palette": {role: theme_data[key] for role, key in PALETTE_ROLES},
+        "stylesheet": STYLESHEET_TEMPLATE.format(**theme_data)
+    }
+
+
+def get_themes_fingerprint(themes=None):
+    """Get a fingerprint of the theme definitions and stylesheet template
+
+    Args:
+        themes: Themes dictionary (default: config.THEMES)
+
+    Returns:
+        Hex digest that changes whenever a theme or the template changes
+    """
+    if themes is None:
+        themes = config.THEMES
+
+    source = json.dumps([themes, PALETTE_ROLES, STYLESHEET_TEMPLATE], sort_keys=True)
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def compile_themes(themes=None):
+    """Compile every theme
+
+    Args:
+        themes: Themes dictionary (default: config.THEMES)
+
+    Returns:
+        Dictionary mapping theme name to compiled theme
+    """
+    if themes is None:
+        themes = config.THEMES
+
+    return {name: compile_theme(theme_data) for name, theme_data in themes.items()}
+
+
+def build_theme_cache(path=None):
+    """Compile every theme and write them to the cache file
+
+    Args:
+        path: Cache file path (default: config.THEME_CACHE_FILE)
+
+    Returns:
+        True if the cache was written, False otherwise
+    """
+    if path is None:
+        path = config.THEME_CACHE_FILE
+
+    data = {
+        "fingerprint": get_themes_fingerprint(),
+        "themes": compile_themes()
+    }
+
+    try:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
+        return True
+    except Exception as e:
+        print(f"Error writing theme cache {path}: {e}")
+        return False
+
+
+def load_theme_cache(path=None):
+    """Load compiled themes from the cache file
+
+    The cache is ignored if it was built from different theme definitions.
+
+    Args:
+        path: Cache file path (default: config.THEME_CACHE_FILE)
+
+    Returns:
+        Dictionary mapping theme name to compiled theme (empty if there is no valid cache)
+    """
+    if path is None:
+        path = config.THEME_CACHE_FILE
+
+    if not path or not os.path.exists(path):
+        return {}
+
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except Exception as e:
+        print(f"Error reading theme cache {path}: {e}")
+        return {}
+
+    if data.get("fingerprint") != get_themes_fingerprint():
+        return {}
+
+    return data.get("themes", {})